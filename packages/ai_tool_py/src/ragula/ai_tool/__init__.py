@@ -6,75 +6,247 @@ This package provides a tool for integrating Ragula's knowledge base retrieval c
 
 __version__ = "0.1.0"
 
-from typing import Dict, Any, Optional, List, TypedDict, Callable
-from ragula.sdk import RagulaClient
+import atexit
+import threading
+import weakref
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, TypedDict, Callable, Sequence, AsyncGenerator, Tuple
+
+from ragula.ai_tool.context import ContextBuilder, ContextReport
+
+# The SDK (and its HTTP stack) is imported when the tool first runs, not when the
+# tool is defined, to keep cold starts of serverless functions short.
+if TYPE_CHECKING:
+    import asyncio
+    from ragula.sdk import AsyncRagulaClient, RagulaClient
+
+    # A loop's shared async clients, by API key, and the generator closing them.
+    _LoopClients = Tuple[Dict[str, AsyncRagulaClient], AsyncGenerator[None, None]]
+
+# Maximum number of queries of one multi-query call that run at the same time.
+DEFAULT_QUERY_CONCURRENCY = 8
 
 class QueryResult(TypedDict):
     context: str
 
-class RagulaToolParams(TypedDict):
+class RagulaToolParams(TypedDict, total=False):
     query: str
+    queries: List[str]
+
+# Clients shared by all tools using the same API key, so every tool call reuses
+# pooled (already TLS-established) connections. Async clients are bound to the
+# event loop they were created on, so they are kept per loop, together with the
+# async generator that closes them when the loop shuts down.
+_clients_lock = threading.Lock()
+_clients: Dict[str, "RagulaClient"] = {}
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClients]" = (
+    weakref.WeakKeyDictionary()
+)
+
+def _shared_client(api_key: str) -> "RagulaClient":
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            from ragula.sdk import RagulaClient
+
+            client = _clients[api_key] = RagulaClient(token=api_key)
+        return client
+
+async def _close_on_shutdown(clients: Dict[str, "AsyncRagulaClient"]) -> AsyncGenerator[None, None]:
+    # Once started, the loop finalizes this generator in shutdown_asyncgens()
+    # (as asyncio.run does before closing the loop), which closes the clients.
+    try:
+        yield
+    finally:
+        for client in list(clients.values()):
+            await client.aclose()
+        clients.clear()
+
+async def _shared_async_client(api_key: str) -> "AsyncRagulaClient":
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    closer = None
+    with _clients_lock:
+        entry = _async_clients.get(loop)
+        if entry is None:
+            clients: Dict[str, "AsyncRagulaClient"] = {}
+            closer = _close_on_shutdown(clients)
+            entry = _async_clients[loop] = (clients, closer)
+        clients = entry[0]
+        client = clients.get(api_key)
+        if client is None:
+            from ragula.sdk import AsyncRagulaClient
 
-def ragula_tool(api_key: str, collection_id: str) -> Dict[str, Any]:
+            client = clients[api_key] = AsyncRagulaClient(token=api_key)
+    if closer is not None:
+        await closer.__anext__()
+    return client
+
+def close_clients() -> None:
+    """Closes the pooled clients shared by tools. Also runs at interpreter exit."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+async def aclose_clients() -> None:
+    """Closes the pooled clients shared by tools: the sync ones and the async ones of the running loop."""
+    import asyncio
+
+    close_clients()
+    with _clients_lock:
+        entry = _async_clients.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry[1].aclose()
+
+atexit.register(close_clients)
+
+def _queries_from(params: RagulaToolParams) -> List[str]:
+    """Returns the queries of a tool call: "queries", or else the single "query"."""
+    queries = params.get("queries")
+    if isinstance(queries, str):
+        queries = [queries]
+    queries = [query for query in queries or [params.get("query")] if query]
+    if not queries:
+        raise ValueError("Query parameter is required")
+    return queries
+
+def _collect(queries: List[str], results: Sequence[Any], builder: ContextBuilder) -> ContextReport:
+    """Builds the context of a tool call, failing with the first error only if no query succeeded."""
+    errors = [result for result in results if isinstance(result, Exception)]
+    if len(errors) == len(queries):
+        raise errors[0]
+    # Injected clients may use the model or raw response mode; the builder reads any of them.
+    return builder.build([result for result in results if not isinstance(result, Exception)])
+
+def ragula_tool(
+    api_key: Optional[str],
+    collection_id: str,
+    client: Optional["RagulaClient"] = None,
+    async_client: Optional["AsyncRagulaClient"] = None,
+    multi_query: bool = False,
+    concurrency: int = DEFAULT_QUERY_CONCURRENCY,
+    context_builder: Optional[ContextBuilder] = None,
+    on_context: Optional[Callable[[ContextReport], None]] = None,
+) -> Dict[str, Any]:
     """
     Creates a tool that fetches relevant context from a Ragula knowledge base.
-    
+
     Args:
-        api_key: Your Ragula API key
+        api_key: Your Ragula API key. Required unless a client is injected; execute
+            without client, or aexecute without async_client, also need it.
         collection_id: The ID of the Ragula collection to query
-        
+        client: RagulaClient used by execute. Defaults to a pooled client shared
+            by all tools with the same API key, created on the first call.
+        async_client: AsyncRagulaClient used by aexecute. Defaults to a pooled
+            client per API key and event loop (requires ragula-sdk[async]), closed
+            when the loop shuts down. close_clients() / aclose_clients() close the
+            pooled clients earlier.
+        multi_query: Advertise a "queries" array instead of a single "query", so an
+            agent can retrieve for several queries in one tool call. Both forms are
+            accepted by execute and aexecute either way.
+        concurrency: Maximum number of queries of one call that run at the same time.
+        context_builder: Builds the context from the results: by default ordered by
+            score, one snippet per file and without near duplicates. Pass e.g.
+            ContextBuilder(max_tokens=2000) to cap its size.
+        on_context: Called with the ContextReport of every call, listing the results
+            that were included and dropped (e.g. for logging).
+
     Returns:
         A tool definition that can be used with AI frameworks like LangChain
+
+    Raises:
+        ValueError: If neither api_key nor a client is provided.
     """
+    if not api_key and client is None and async_client is None:
+        raise ValueError("An api_key is required unless a client or async_client is provided.")
+    builder = context_builder if context_builder is not None else ContextBuilder()
+
+    def require_api_key() -> str:
+        if not api_key:
+            raise ValueError("An api_key is required to create the shared client.")
+        return api_key
+
+    def finish(report: ContextReport) -> QueryResult:
+        if on_context is not None:
+            on_context(report)
+        return {"context": report.context}
+
     def execute(params: RagulaToolParams) -> QueryResult:
         """
         Executes the tool with the given parameters.
-        
+
+        Args:
+            params: The parameters for the tool execution: a "query" string or a
+                "queries" list, run concurrently
+
+        Returns:
+            A dictionary containing the context from the knowledge base
+        """
+        queries = _queries_from(params)
+        ragula = client if client is not None else _shared_client(require_api_key())
+
+        try:
+            if len(queries) == 1:
+                results = [ragula.query.query_collection(collection_id=collection_id, query=queries[0])]
+            else:
+                results = ragula.query.query_many(collection_id, queries, concurrency=concurrency)
+            # Inside the handled block: a malformed response fails like any other error.
+            report = _collect(queries, results, builder)
+        except Exception as e:
+            raise RuntimeError(f"Error fetching context: {str(e)}")
+        return finish(report)
+
+    async def aexecute(params: RagulaToolParams) -> QueryResult:
+        """
+        Asynchronous counterpart of execute, for agents running on an event loop.
+
         Args:
             params: The parameters for the tool execution
-            
+
         Returns:
             A dictionary containing the context from the knowledge base
         """
-        query = params.get("query")
-        if not query:
-            raise ValueError("Query parameter is required")
-            
-        client = RagulaClient(token=api_key)
-        
+        queries = _queries_from(params)
+        ragula = async_client if async_client is not None else await _shared_async_client(require_api_key())
+
         try:
-            response = client.query.query_collection(
-                collection_id=collection_id,
-                query=query
-            )
-            
-            if not response:
-                return {"context": ""}
-                
-            results = response.get("results", [])
-            
-            context = ""
-            for result in results:
-                if content_snippet := result.get("contentSnippet"):
-                    context += f"\n\n{content_snippet}"
-                    
-            return {"context": context.strip()}
-            
+            if len(queries) == 1:
+                results = [await ragula.query.query_collection(collection_id=collection_id, query=queries[0])]
+            else:
+                results = await ragula.query.query_many(collection_id, queries, concurrency=concurrency)
+            # Inside the handled block: a malformed response fails like any other error.
+            report = _collect(queries, results, builder)
         except Exception as e:
             raise RuntimeError(f"Error fetching context: {str(e)}")
-    
+        return finish(report)
+
+    if multi_query:
+        properties: Dict[str, Any] = {
+            "queries": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "One or more strings to find more information in the knowledgebase"
+            }
+        }
+    else:
+        properties = {
+            "query": {
+                "type": "string",
+                "description": "A string to find more information in the knowledgebase"
+            }
+        }
+
+    subject = "queries" if multi_query else "query"
     return {
         "name": "knowledgebase",
-        "description": "Fetch additional context from the knowledgebase for the provided search query.",
+        "description": f"Fetch additional context from the knowledgebase for the provided search {subject}.",
         "parameters": {
             "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "A string to find more information in the knowledgebase"
-                }
-            },
-            "required": ["query"]
+            "properties": properties,
+            "required": list(properties)
         },
-        "execute": execute
-    }
\ No newline at end of file
+        "execute": execute,
+        "aexecute": aexecute,
+    }
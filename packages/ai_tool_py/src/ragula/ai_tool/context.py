@@ -0,0 +1,198 @@
+"""
+Budgeted context assembly for ragula.ai_tool.
+
+ContextBuilder turns query responses into the context handed to the model:
+results are ordered by score, repeated files and near-identical (or largely
+overlapping) snippets are skipped, and snippets are added while they fit the
+character and token budgets. Every step is linear in the size of the snippets,
+apart from ordering the results by score.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+
+# Reasons a result is left out of the context.
+DUPLICATE_FILE = "duplicate_file"
+NEAR_DUPLICATE = "near_duplicate"
+OVER_BUDGET = "over_budget"
+
+DEFAULT_SEPARATOR = "\n\n"
+# Share of a snippet's word shingles already in the context above which it counts as a near duplicate.
+DEFAULT_SIMILARITY = 0.9
+# Words per shingle used to compare snippets.
+SHINGLE_SIZE = 5
+
+_WORD = re.compile(r"\w+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for English text (about four characters per token)."""
+    return (len(text) + 3) // 4
+
+
+@dataclass
+class ContextItem:
+    """
+    Attributes:
+        file_id: The file the snippet came from.
+        score: The result's relevance score.
+        text: The content snippet.
+    """
+    file_id: Optional[str]
+    score: float
+    text: str
+
+
+@dataclass
+class DroppedItem:
+    """
+    Attributes:
+        item: The result left out of the context.
+        reason: DUPLICATE_FILE, NEAR_DUPLICATE or OVER_BUDGET.
+    """
+    item: ContextItem
+    reason: str
+
+
+@dataclass
+class ContextReport:
+    """
+    Attributes:
+        context: The assembled context.
+        included: Results in the context, best first.
+        dropped: Results left out, with the reason.
+        chars: Length of the context.
+        tokens: Tokens of the context, as counted by the builder.
+    """
+    context: str = ""
+    included: List[ContextItem] = field(default_factory=list)
+    dropped: List[DroppedItem] = field(default_factory=list)
+    chars: int = 0
+    tokens: int = 0
+
+    def dropped_counts(self) -> Dict[str, int]:
+        """Number of dropped results per reason."""
+        counts: Dict[str, int] = {}
+        for dropped in self.dropped:
+            counts[dropped.reason] = counts.get(dropped.reason, 0) + 1
+        return counts
+
+
+def _shingles(text: str) -> Set[int]:
+    """Hashes of the snippet's overlapping word sequences, ignoring case, spacing and punctuation."""
+    words = _WORD.findall(text.lower())
+    if len(words) <= SHINGLE_SIZE:
+        return {hash(tuple(words))}
+    return {hash(tuple(words[i:i + SHINGLE_SIZE])) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+def result_items(responses: Sequence[Any]) -> List[ContextItem]:
+    """The results of query responses (in any response mode) that have a snippet, in order."""
+    from ragula.sdk.parsing import to_json_value
+
+    items = []
+    for response in responses:
+        response = to_json_value(response)
+        if not response:
+            continue
+        for result in response.get("results") or []:
+            if result.get("contentSnippet"):
+                items.append(ContextItem(result.get("fileId"), result.get("score") or 0.0, result["contentSnippet"]))
+    return items
+
+
+class ContextBuilder:
+    """
+    Assembles a bounded, de-duplicated context from query results.
+
+    Args:
+        max_chars: Maximum length of the context. None for no limit.
+        max_tokens: Maximum tokens of the context, as counted by count_tokens. None for no limit.
+        count_tokens: Token counter, e.g. a tokenizer's encode length. Defaults to estimate_tokens.
+        one_per_file: Keep only the best-scoring snippet of each file. A file only counts
+            once one of its snippets is in the context: when its best snippet does not
+            fit the budget, a smaller one from the same file may still be added.
+        similarity: Skip a snippet when at least this share of its word sequences is already
+            in the context (1.0 only skips snippets identical up to case, spacing and
+            punctuation). None keeps near duplicates.
+        separator: Text placed between snippets.
+    """
+
+    def __init__(
+        self,
+        max_chars: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        count_tokens: Optional[Callable[[str], int]] = None,
+        one_per_file: bool = True,
+        similarity: Optional[float] = DEFAULT_SIMILARITY,
+        separator: str = DEFAULT_SEPARATOR,
+    ):
+        if max_chars is not None and max_chars < 0:
+            raise ValueError("'max_chars' must not be negative.")
+        if max_tokens is not None and max_tokens < 0:
+            raise ValueError("'max_tokens' must not be negative.")
+        if similarity is not None and not 0 < similarity <= 1:
+            raise ValueError("'similarity' must be greater than 0 and at most 1.")
+        self.max_chars = max_chars
+        self.max_tokens = max_tokens
+        self.count_tokens = count_tokens or estimate_tokens
+        self.one_per_file = one_per_file
+        self.similarity = similarity
+        self.separator = separator
+
+    def build(self, responses: Sequence[Any]) -> ContextReport:
+        """Builds the context from query responses, e.g. the responses of one tool call."""
+        return self.build_items(result_items(responses))
+
+    def build_items(self, items: Sequence[ContextItem]) -> ContextReport:
+        """Builds the context from results, in any order."""
+        report = ContextReport()
+        ranked = sorted(items, key=lambda item: item.score, reverse=True) # Stable: ties keep their order
+        separator_chars = len(self.separator)
+        separator_tokens = self.count_tokens(self.separator) if self.max_tokens is not None else 0
+        files: Set[Optional[str]] = set()
+        seen: Set[int] = set()
+        parts: List[str] = []
+        chars = tokens = 0
+
+        for item in ranked:
+            # Only included snippets claim their file (see one_per_file).
+            if self.one_per_file and item.file_id is not None and item.file_id in files:
+                report.dropped.append(DroppedItem(item, DUPLICATE_FILE))
+                continue
+            shingles: Set[int] = set()
+            if self.similarity is not None:
+                shingles = _shingles(item.text)
+                if shingles and len(shingles & seen) >= self.similarity * len(shingles):
+                    report.dropped.append(DroppedItem(item, NEAR_DUPLICATE))
+                    continue
+
+            extra_chars = len(item.text) + (separator_chars if parts else 0)
+            if self.max_chars is not None and chars + extra_chars > self.max_chars:
+                report.dropped.append(DroppedItem(item, OVER_BUDGET))
+                continue
+            extra_tokens = 0
+            if self.max_tokens is not None:
+                extra_tokens = self.count_tokens(item.text) + (separator_tokens if parts else 0)
+                if tokens + extra_tokens > self.max_tokens:
+                    report.dropped.append(DroppedItem(item, OVER_BUDGET))
+                    continue
+
+            parts.append(item.text)
+            report.included.append(item)
+            files.add(item.file_id)
+            seen |= shingles
+            chars += extra_chars
+            tokens += extra_tokens
+
+        report.context = self.separator.join(parts)
+        report.chars = chars
+        report.tokens = tokens if self.max_tokens is not None else self.count_tokens(report.context)
+        return report
+
+
+def build_context(responses: Sequence[Any], **options: Any) -> ContextReport:
+    """Shorthand for ContextBuilder(**options).build(responses)."""
+    return ContextBuilder(**options).build(responses)
+
@@ -0,0 +1,96 @@
+"""Tests for the budgeted context builder."""
+
+import pytest
+from ragula.ai_tool.context import (
+    DUPLICATE_FILE, NEAR_DUPLICATE, OVER_BUDGET, ContextBuilder, ContextItem, build_context, estimate_tokens
+)
+
+WARRANTY = "The warranty period is two years from the date of purchase for all devices."
+RETURNS = "Returns are accepted within thirty days of delivery, no questions asked at all."
+
+
+def result(file_id, score, snippet):
+    return {"fileId": file_id, "score": score, "contentSnippet": snippet}
+
+
+def test_orders_by_score_and_keeps_ties_in_order():
+    """Tests that results from several responses are merged best first, ties in input order."""
+    responses = [
+        {"results": [result("a", 0.2, "alpha text"), result("b", 0.9, "beta text")]},
+        {"results": [result("c", 0.5, "gamma text"), result("d", 0.5, "delta text"), result("e", 0.1, None)]},
+    ]
+    report = build_context(responses)
+    assert [item.file_id for item in report.included] == ["b", "c", "d", "a"]
+    assert report.context == "beta text\n\ngamma text\n\ndelta text\n\nalpha text"
+    assert report.chars == len(report.context) and report.tokens == estimate_tokens(report.context)
+
+
+def test_keeps_the_best_snippet_of_each_file():
+    """Tests same-file de-duplication, and that it can be turned off."""
+    items = [ContextItem("a", 0.4, RETURNS), ContextItem("a", 0.8, WARRANTY)]
+    report = ContextBuilder().build_items(items)
+    assert report.context == WARRANTY
+    assert [(d.item.text, d.reason) for d in report.dropped] == [(RETURNS, DUPLICATE_FILE)]
+    assert len(ContextBuilder(one_per_file=False).build_items(items).included) == 2
+
+
+def test_drops_near_duplicates_and_overlaps():
+    """Tests that reformatted copies and snippets mostly contained in the context are skipped."""
+    items = [
+        ContextItem("a", 0.9, WARRANTY),
+        ContextItem("b", 0.8, "THE WARRANTY period is two years -- from the date of purchase, for all devices!"),
+        ContextItem("c", 0.7, WARRANTY + " Extended"), # Overlaps almost entirely
+        ContextItem("d", 0.6, RETURNS),
+    ]
+    report = ContextBuilder().build_items(items)
+    assert [item.file_id for item in report.included] == ["a", "d"]
+    assert report.dropped_counts() == {NEAR_DUPLICATE: 2}
+    assert len(ContextBuilder(similarity=None).build_items(items).included) == 4
+
+
+def test_char_budget_is_never_exceeded():
+    """Tests the character budget, counting separators, and that smaller results still fill it."""
+    items = [ContextItem("a", 0.9, "x" * 60), ContextItem("b", 0.8, "y" * 50), ContextItem("c", 0.7, "z" * 30)]
+    report = ContextBuilder(max_chars=92).build_items(items)
+    assert [item.file_id for item in report.included] == ["a", "c"] # 60 + 2 + 30
+    assert report.chars == len(report.context) == 92
+    assert [(d.item.file_id, d.reason) for d in report.dropped] == [("b", OVER_BUDGET)]
+    assert ContextBuilder(max_chars=10).build_items(items).context == ""
+
+
+def test_token_budget_uses_the_token_counter():
+    """Tests the token budget with a custom counter (one token per word)."""
+    words = lambda text: len(text.split())
+    items = [ContextItem("a", 0.9, WARRANTY), ContextItem("b", 0.8, RETURNS), ContextItem("c", 0.7, "short note")]
+    report = ContextBuilder(max_tokens=17, count_tokens=words, separator=" | ").build_items(items)
+    assert [item.file_id for item in report.included] == ["a", "c"] # b needs 14 + 1 (separator) + 13
+    assert report.tokens == 14 + 1 + 2 == words(report.context)
+    assert report.dropped_counts() == {OVER_BUDGET: 1}
+
+
+def test_file_dropped_for_budget_can_contribute_a_smaller_snippet():
+    """Tests the decision that a file only counts once one of its snippets was included."""
+    items = [ContextItem("a", 0.9, "x" * 100), ContextItem("b", 0.8, "y" * 20), ContextItem("a", 0.5, "z" * 20)]
+    report = ContextBuilder(max_chars=50).build_items(items)
+    assert [(item.file_id, item.score) for item in report.included] == [("b", 0.8), ("a", 0.5)]
+    assert report.dropped_counts() == {OVER_BUDGET: 1}
+
+
+def test_dropped_counts_per_reason():
+    """Tests that the report accounts for every result that was left out."""
+    items = [
+        ContextItem("a", 0.9, WARRANTY),
+        ContextItem("a", 0.8, RETURNS),
+        ContextItem("b", 0.7, WARRANTY),
+        ContextItem("c", 0.6, "z" * 500),
+    ]
+    report = ContextBuilder(max_chars=200).build_items(items)
+    assert report.dropped_counts() == {DUPLICATE_FILE: 1, NEAR_DUPLICATE: 1, OVER_BUDGET: 1}
+    assert len(report.included) + len(report.dropped) == len(items)
+
+
+def test_rejects_invalid_options():
+    """Tests option validation."""
+    for options in ({"max_chars": -1}, {"max_tokens": -1}, {"similarity": 0}, {"similarity": 1.5}):
+        with pytest.raises(ValueError):
+            ContextBuilder(**options)
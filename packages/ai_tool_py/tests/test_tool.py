@@ -0,0 +1,152 @@
+"""Tests for ragula_tool: shared clients, execute / aexecute and the tool schema."""
+
+import asyncio
+
+import pytest
+import ragula.ai_tool as ai_tool
+from ragula.ai_tool import ContextBuilder, close_clients, ragula_tool
+from ragula.sdk.client import RagulaClient, RagulaError
+
+WARRANTY = "The warranty period is two years from the date of purchase."
+RETURNS = "Returns are accepted within thirty days of delivery."
+SNIPPETS = {"warranty": WARRANTY, "returns": RETURNS}
+
+
+def answer(query):
+    """Fake query endpoint: one result per known query, a 500 for anything else."""
+    if query not in SNIPPETS:
+        raise RagulaError(status_code=500, message="boom")
+    return {"results": [{"fileId": query, "score": 0.9, "contentSnippet": SNIPPETS[query]}]}
+
+
+@pytest.fixture(autouse=True)
+def shared_clients():
+    """Fixture closing the clients the tool shared during a test."""
+    yield
+    close_clients()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Fixture to create a RagulaClient answering queries without the network."""
+    client = RagulaClient(token="test_api_key", base_url="http://localhost:8000")
+
+    def fake_request(method, endpoint, json_data=None, **kwargs):
+        return answer(json_data["query"])
+
+    monkeypatch.setattr(client, "_request", fake_request)
+    return client
+
+
+def test_execute_reuses_the_shared_client(monkeypatch):
+    """Tests that tools with the same API key share one client, and that close_clients closes it."""
+    shared = ai_tool._shared_client("key")
+    calls = []
+
+    def fake_request(method, endpoint, json_data=None, **kwargs):
+        calls.append(json_data["query"])
+        return answer(json_data["query"])
+
+    monkeypatch.setattr(shared, "_request", fake_request)
+    for _ in range(2):
+        tool = ragula_tool(api_key="key", collection_id="c1")
+        assert tool["execute"]({"query": "warranty"}) == {"context": WARRANTY}
+    assert calls == ["warranty", "warranty"]
+    assert ai_tool._shared_client("other") is not shared
+
+    closed = []
+    monkeypatch.setattr(shared, "close", lambda: closed.append(True))
+    close_clients()
+    assert closed == [True]
+    assert ai_tool._shared_client("key") is not shared
+
+
+def test_multi_query_skips_failed_queries(client):
+    """Tests the fan-out of several queries, where only the failures are left out."""
+    reports = []
+    tool = ragula_tool(None, "c1", client=client, multi_query=True, on_context=reports.append)
+    result = tool["execute"]({"queries": ["warranty", "broken", "returns"]})
+    assert result == {"context": WARRANTY + "\n\n" + RETURNS}
+    assert [item.file_id for item in reports[0].included] == ["warranty", "returns"]
+    with pytest.raises(RuntimeError, match=r"Error fetching context: \[500\] boom"):
+        tool["execute"]({"queries": ["broken", "missing"]})
+
+
+def test_malformed_response_is_reported_as_an_error(client, monkeypatch):
+    """Tests that a response of the wrong shape fails as a RuntimeError, not a raw AttributeError."""
+    monkeypatch.setattr(client, "_request", lambda *args, **kwargs: "not a response")
+    tool = ragula_tool(None, "c1", client=client)
+    with pytest.raises(RuntimeError, match="Error fetching context"):
+        tool["execute"]({"query": "warranty"})
+
+
+def test_context_builder_is_applied(client):
+    """Tests that the tool builds its context with the given ContextBuilder."""
+    tool = ragula_tool(None, "c1", client=client, multi_query=True, context_builder=ContextBuilder(max_chars=60))
+    assert tool["execute"]({"queries": ["warranty", "returns"]}) == {"context": WARRANTY}
+
+
+def test_schema_follows_multi_query():
+    """Tests the advertised parameters with and without multi_query."""
+    single = ragula_tool("key", "c1")["parameters"]
+    assert single["required"] == ["query"] and single["properties"]["query"]["type"] == "string"
+    multi = ragula_tool("key", "c1", multi_query=True)["parameters"]
+    assert multi["required"] == ["queries"]
+    assert multi["properties"]["queries"] == {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "One or more strings to find more information in the knowledgebase",
+    }
+    with pytest.raises(ValueError):
+        ragula_tool("key", "c1")["execute"]({"queries": []})
+
+
+def test_aexecute_shares_clients_per_loop_and_closes_them_on_shutdown(monkeypatch):
+    """Tests aexecute on the shared async client, which is closed when its event loop shuts down."""
+    pytest.importorskip("httpx")
+    tool = ragula_tool(api_key="key", collection_id="c1", multi_query=True)
+
+    async def fake_request(method, endpoint, json_data=None, **kwargs):
+        await asyncio.sleep(0)
+        return answer(json_data["query"])
+
+    async def run():
+        shared = await ai_tool._shared_async_client("key")
+        monkeypatch.setattr(shared, "_request", fake_request)
+        first = await tool["aexecute"]({"query": "warranty"})
+        many = await tool["aexecute"]({"queries": ["returns", "broken"]})
+        assert await ai_tool._shared_async_client("key") is shared
+        return shared, first, many
+
+    shared, first, many = asyncio.run(run())
+    assert first == {"context": WARRANTY}
+    assert many == {"context": RETURNS}
+    assert shared._http.is_closed
+
+    other = asyncio.run(ai_tool._shared_async_client("key"))
+    assert other is not shared and other._http.is_closed
+
+
+def test_aclose_clients_closes_the_loops_clients():
+    """Tests that aclose_clients closes the async clients of the running loop right away."""
+    pytest.importorskip("httpx")
+
+    async def run():
+        shared = await ai_tool._shared_async_client("key")
+        await ai_tool.aclose_clients()
+        assert shared._http.is_closed
+        assert await ai_tool._shared_async_client("key") is not shared
+
+    asyncio.run(run())
+
+
+def test_api_key_or_client_is_required(client):
+    """Tests that a tool without an API key or client is rejected when it is defined, not on its first call."""
+    with pytest.raises(ValueError):
+        ragula_tool(None, "c1")
+    with pytest.raises(ValueError):
+        ragula_tool("", "c1", multi_query=True)
+    tool = ragula_tool(None, "c1", client=client)
+    assert tool["execute"]({"query": "warranty"}) == {"context": WARRANTY}
+    with pytest.raises(ValueError, match="api_key"):
+        asyncio.run(tool["aexecute"]({"query": "warranty"}))
@@ -4,7 +4,45 @@ ragula.langchain_tool package.
 This package is a Python port of the langchain-tool TypeScript package.
 """
 
+from typing import TYPE_CHECKING, Any, Dict, List
+
 from ragula.langchain_tool.greet import greet_langchain_tool
 
 __version__ = "0.1.0"
-__all__ = ["greet_langchain_tool"]
\ No newline at end of file
+
+# The retriever and the tool are imported on first access (PEP 562), so importing
+# the package does not load LangChain.
+_EXPORTS: Dict[str, str] = {
+    "RagulaRetriever": "retriever",
+    "ragula_tool": "tool",
+    "RagulaToolInput": "tool",
+    "format_context": "tool",
+}
+
+if TYPE_CHECKING:
+    from ragula.langchain_tool.retriever import RagulaRetriever
+    from ragula.langchain_tool.tool import RagulaToolInput, format_context, ragula_tool
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+__all__ = [
+    "greet_langchain_tool",
+    "RagulaRetriever",
+    "ragula_tool",
+    "RagulaToolInput",
+    "format_context",
+]
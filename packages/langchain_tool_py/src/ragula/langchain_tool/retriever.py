@@ -0,0 +1,243 @@
+"""
+LangChain retriever backed by a Ragula collection.
+"""
+
+import threading
+import weakref
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    cast,
+)
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForRetrieverRun,
+    CallbackManagerForRetrieverRun,
+)
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.runnables import RunnableConfig
+from pydantic import Field, PrivateAttr
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from ragula.sdk import AsyncRagulaClient, RagulaClient
+
+# Default number of queries of one batch that run at the same time.
+DEFAULT_BATCH_CONCURRENCY = 8
+
+
+async def _close_on_shutdown(client: "AsyncRagulaClient") -> AsyncGenerator[None, None]:
+    # Once started, the loop finalizes this generator in shutdown_asyncgens()
+    # (as asyncio.run does before closing the loop), which closes the client.
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+class RagulaRetriever(BaseRetriever):
+    """
+    Retrieves Documents from a Ragula collection.
+
+    Each result becomes a Document holding its content snippet, with the
+    result's fileId and score (and the collectionId) as metadata.
+
+    The retriever keeps one pooled client for its lifetime (and one async client
+    per event loop, closed when the loop shuts down), so parallel retrieval steps
+    of a chain reuse established connections. invoke/batch run on the sync client
+    and ainvoke/abatch natively on the async client; batches run up to
+    `concurrency` queries at the same time.
+
+    Example:
+        .. code-block:: python
+
+            retriever = RagulaRetriever(api_key="...", collection_id="...", top_k=5)
+            documents = retriever.invoke("How do I reset my password?")
+            answers = await retriever.abatch(["first question", "second question"])
+    """
+
+    collection_id: str
+    """The ID of the Ragula collection to query."""
+    api_key: Optional[str] = Field(default=None, repr=False)
+    """Ragula API key. Not used for the clients that are injected."""
+    base_url: str = "https://www.ragula.io"
+    """Base URL of the Ragula API."""
+    top_k: Optional[int] = None
+    """Maximum number of results per query. Defaults to the server's setting."""
+    folder_ids: Optional[List[str]] = None
+    """Only search files in these folders."""
+    file_types: Optional[List[str]] = None
+    """Only search files of these types, e.g. ["pdf"]."""
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    """Queries of one batch that run at the same time, unless the run config sets
+    max_concurrency."""
+    # Typed as Any so defining the retriever does not import the SDK (see ragula.sdk).
+    client: Optional[Any] = Field(default=None, exclude=True)
+    """RagulaClient to use instead of the retriever's own."""
+    async_client: Optional[Any] = Field(default=None, exclude=True)
+    """AsyncRagulaClient to use instead of the retriever's own."""
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _client: Optional[Any] = PrivateAttr(default=None)
+    # Async clients are bound to the event loop they were created on, so they are
+    # kept per loop, with the generator that closes them when the loop shuts down.
+    _async_clients: Any = PrivateAttr(default_factory=weakref.WeakKeyDictionary)
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        response = self._sync_client().query.query_collection(
+            self.collection_id,
+            query,
+            top_k=self.top_k,
+            folder_ids=self.folder_ids,
+            file_types=self.file_types,
+        )
+        return self._documents(response)
+
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        client = await self._async_client()
+        response = await client.query.query_collection(
+            self.collection_id,
+            query,
+            top_k=self.top_k,
+            folder_ids=self.folder_ids,
+            file_types=self.file_types,
+        )
+        return self._documents(response)
+
+    def batch(
+        self,
+        inputs: List[str],
+        config: Optional[Union[RunnableConfig, List[RunnableConfig]]] = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> List[List[Document]]:
+        """
+        Same as BaseRetriever.batch, with max_concurrency defaulting to the
+        retriever's `concurrency` instead of unbounded.
+        """
+        return super().batch(
+            inputs,
+            self._with_concurrency(config),
+            return_exceptions=return_exceptions,
+            **kwargs,
+        )
+
+    async def abatch(
+        self,
+        inputs: List[str],
+        config: Optional[Union[RunnableConfig, List[RunnableConfig]]] = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> List[List[Document]]:
+        """
+        Same as BaseRetriever.abatch, with max_concurrency defaulting to the
+        retriever's `concurrency` instead of unbounded.
+        """
+        return await super().abatch(
+            inputs,
+            self._with_concurrency(config),
+            return_exceptions=return_exceptions,
+            **kwargs,
+        )
+
+    def close(self) -> None:
+        """Closes the retriever's own sync client. Injected clients are left open."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """
+        Closes the retriever's own clients (the async one of the running loop).
+        Async clients are also closed when their event loop shuts down.
+        """
+        import asyncio
+
+        self.close()
+        with self._lock:
+            entry = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[1].aclose()
+
+    def _with_concurrency(
+        self, config: Optional[Union[RunnableConfig, Sequence[RunnableConfig]]]
+    ) -> Union[RunnableConfig, List[RunnableConfig]]:
+        """Applies the retriever's concurrency where the config sets none."""
+        if isinstance(config, Sequence):
+            return [self._apply_concurrency(item) for item in config]
+        return self._apply_concurrency(config)
+
+    def _apply_concurrency(self, config: Optional[RunnableConfig]) -> RunnableConfig:
+        config = cast(RunnableConfig, dict(config or {}))
+        if config.get("max_concurrency") is None:
+            config["max_concurrency"] = self.concurrency
+        return config
+
+    def _sync_client(self) -> "RagulaClient":
+        if self.client is not None:
+            return self.client
+        with self._lock:
+            if self._client is None:
+                from ragula.sdk import RagulaClient
+                from ragula.sdk.transport import DEFAULT_POOL_MAXSIZE
+
+                # One pooled connection per concurrent query of a batch.
+                self._client = RagulaClient(
+                    base_url=self.base_url,
+                    token=self.api_key,
+                    pool_maxsize=max(self.concurrency, DEFAULT_POOL_MAXSIZE),
+                )
+            return self._client
+
+    async def _async_client(self) -> "AsyncRagulaClient":
+        if self.async_client is not None:
+            return self.async_client
+        import asyncio
+
+        loop: "asyncio.AbstractEventLoop" = asyncio.get_running_loop()
+        closer = None
+        with self._lock:
+            entry = self._async_clients.get(loop)
+            if entry is None:
+                from ragula.sdk import AsyncRagulaClient
+
+                client = AsyncRagulaClient(base_url=self.base_url, token=self.api_key)
+                closer = _close_on_shutdown(client)
+                entry = self._async_clients[loop] = (client, closer)
+        if closer is not None:
+            await closer.__anext__()
+        return entry[0]
+
+    def _documents(self, response: Any) -> List[Document]:
+        """Turns a query response into Documents, skipping results without a snippet."""
+        from ragula.sdk.parsing import to_json_value
+
+        # Injected clients may use the model or raw response mode.
+        body: Dict[str, Any] = to_json_value(response) or {}
+        return [
+            Document(
+                page_content=result["contentSnippet"],
+                metadata={
+                    "fileId": result.get("fileId"),
+                    "score": result.get("score"),
+                    "collectionId": self.collection_id,
+                },
+            )
+            for result in body.get("results") or []
+            if result.get("contentSnippet")
+        ]
@@ -0,0 +1,98 @@
+"""
+LangChain tool fetching context from a Ragula collection.
+"""
+
+from typing import Any, List, Optional
+
+from langchain_core.documents import Document
+from langchain_core.tools import StructuredTool
+from pydantic import BaseModel, Field
+
+from ragula.langchain_tool.retriever import RagulaRetriever
+
+TOOL_NAME = "ragula-knowledge-base-retriever"
+TOOL_DESCRIPTION = (
+    "Fetch additional context from the knowledgebase for the provided search query. "
+    "Use this when you need specific information or context related to a topic."
+)
+# Separator between the snippets of the tool's result.
+SNIPPET_SEPARATOR = "\n\n---\n\n"
+
+
+class RagulaToolInput(BaseModel):
+    """Arguments of the Ragula tool."""
+
+    query: str = Field(
+        description=(
+            "The specific question or topic to search for in the knowledge base "
+            "to retrieve relevant context."
+        )
+    )
+
+
+def format_context(documents: List[Document]) -> str:
+    """
+    Joins the content of the retrieved documents into the tool's result.
+
+    Args:
+        documents (List[Document]): Documents returned by the retriever.
+
+    Returns:
+        str: The snippets separated by SNIPPET_SEPARATOR, or a message when
+            nothing relevant was found.
+    """
+    if not documents:
+        return "No relevant context found in the knowledge base for the query."
+    return SNIPPET_SEPARATOR.join(document.page_content for document in documents)
+
+
+def ragula_tool(
+    api_key: Optional[str] = None,
+    collection_id: Optional[str] = None,
+    retriever: Optional[RagulaRetriever] = None,
+    **retriever_options: Any,
+) -> StructuredTool:
+    """
+    Creates a LangChain tool that fetches relevant context from a Ragula collection.
+
+    The tool runs on a RagulaRetriever, so its pooled client is reused by every
+    call, and async agents call it natively (ainvoke) without a worker thread.
+    Errors are returned as text, so the agent can report them or try again.
+
+    Args:
+        api_key (Optional[str]): Your Ragula API key.
+        collection_id (Optional[str]): The ID of the Ragula collection to query.
+        retriever (Optional[RagulaRetriever]): Retriever to use instead of one
+            created from api_key, collection_id and retriever_options.
+        **retriever_options: Further RagulaRetriever fields, e.g. top_k.
+
+    Returns:
+        StructuredTool: The tool, ready to be bound to a chat model or agent.
+    """
+    if retriever is None:
+        if collection_id is None:
+            raise ValueError("Either 'collection_id' or 'retriever' is required.")
+        retriever = RagulaRetriever(
+            api_key=api_key, collection_id=collection_id, **retriever_options
+        )
+    tool_retriever = retriever
+
+    def run(query: str) -> str:
+        try:
+            return format_context(tool_retriever.invoke(query))
+        except Exception as e:
+            return f"Error fetching context from Ragula: {e}"
+
+    async def arun(query: str) -> str:
+        try:
+            return format_context(await tool_retriever.ainvoke(query))
+        except Exception as e:
+            return f"Error fetching context from Ragula: {e}"
+
+    return StructuredTool.from_function(
+        func=run,
+        coroutine=arun,
+        name=TOOL_NAME,
+        description=TOOL_DESCRIPTION,
+        args_schema=RagulaToolInput,
+    )
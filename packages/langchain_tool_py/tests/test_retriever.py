@@ -0,0 +1,143 @@
+"""
+Tests for the retriever and tool modules.
+"""
+
+import asyncio
+import importlib.util
+import threading
+import unittest
+
+HAS_LANGCHAIN = importlib.util.find_spec("langchain_core") is not None
+
+
+def _response(query):
+    return {
+        "results": [
+            {"fileId": f"{query}-1", "score": 0.9, "contentSnippet": f"About {query}"},
+            {"fileId": f"{query}-2", "score": 0.5, "contentSnippet": None},
+        ]
+    }
+
+
+class _FakeQuery:
+    """Answers queries like the SDK's QueryService and records how many ran at once."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+        self.calls = []
+
+    def query_collection(self, collection_id, query, **options):
+        with self.lock:
+            self.calls.append((collection_id, query, options))
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        threading.Event().wait(0.05)
+        with self.lock:
+            self.running -= 1
+        if query == "broken":
+            raise RuntimeError("boom")
+        return _response(query)
+
+
+class _FakeAsyncQuery(_FakeQuery):
+    async def query_collection(self, collection_id, query, **options):
+        self.calls.append((collection_id, query, options))
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.05)
+        self.running -= 1
+        return _response(query)
+
+
+class _FakeClient:
+    def __init__(self, query):
+        self.query = query
+
+
+@unittest.skipUnless(HAS_LANGCHAIN, "langchain-core is not installed")
+class TestRagulaRetriever(unittest.TestCase):
+    """Test cases for RagulaRetriever."""
+
+    def make_retriever(self, **options):
+        from ragula.langchain_tool import RagulaRetriever
+
+        self.sync_query, self.async_query = _FakeQuery(), _FakeAsyncQuery()
+        return RagulaRetriever(
+            collection_id="c1",
+            client=_FakeClient(self.sync_query),
+            async_client=_FakeClient(self.async_query),
+            **options,
+        )
+
+    def test_invoke_returns_documents_with_metadata(self):
+        """Test that results with snippets become Documents with fileId and score."""
+        retriever = self.make_retriever(top_k=3)
+        documents = retriever.invoke("paris")
+        self.assertEqual([d.page_content for d in documents], ["About paris"])
+        self.assertEqual(
+            documents[0].metadata,
+            {"fileId": "paris-1", "score": 0.9, "collectionId": "c1"},
+        )
+        self.assertEqual(self.sync_query.calls[0][2]["top_k"], 3)
+
+    def test_batch_runs_queries_concurrently(self):
+        """Test that batch overlaps queries, bounded by the retriever's concurrency."""
+        retriever = self.make_retriever(concurrency=3)
+        results = retriever.batch([f"q{i}" for i in range(6)])
+        file_ids = [documents[0].metadata["fileId"] for documents in results]
+        self.assertEqual(file_ids, [f"q{i}-1" for i in range(6)])
+        self.assertEqual(self.sync_query.peak, 3)
+        errors = retriever.batch(["ok", "broken"], return_exceptions=True)
+        self.assertIsInstance(errors[1], RuntimeError)
+
+    def test_abatch_uses_the_async_client(self):
+        """Test that ainvoke and abatch run natively on the async client."""
+        retriever = self.make_retriever(concurrency=4)
+
+        async def run():
+            single = await retriever.ainvoke("one")
+            many = await retriever.abatch([f"q{i}" for i in range(8)])
+            return single, many
+
+        single, many = asyncio.run(run())
+        self.assertEqual(single[0].page_content, "About one")
+        self.assertEqual(len(many), 8)
+        self.assertEqual(self.async_query.peak, 4)
+        self.assertEqual(self.sync_query.calls, [])
+
+    def test_own_async_clients_are_closed_with_their_loop(self):
+        """Test that the retriever's async client of a loop is closed when it ends."""
+        from ragula.langchain_tool import RagulaRetriever
+
+        retriever = RagulaRetriever(collection_id="c1", api_key="key")
+
+        async def run():
+            client = await retriever._async_client()
+            self.assertIs(await retriever._async_client(), client)
+            return client
+
+        client = asyncio.run(run())
+        self.assertTrue(client._http.is_closed)
+
+        async def run_and_close():
+            client = await retriever._async_client()
+            await retriever.aclose()
+            return client
+
+        self.assertTrue(asyncio.run(run_and_close())._http.is_closed)
+
+    def test_tool_formats_context_and_errors(self):
+        """Test the tool's result text for hits and for failures."""
+        from ragula.langchain_tool import ragula_tool
+
+        tool = ragula_tool(retriever=self.make_retriever())
+        self.assertEqual(tool.invoke({"query": "paris"}), "About paris")
+        error = tool.invoke({"query": "broken"})
+        self.assertTrue(error.startswith("Error fetching context"))
+        self.assertEqual(asyncio.run(tool.ainvoke({"query": "rome"})), "About rome")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1 @@
+"""Benchmarks for the Ragula Python SDK, run against a local mock server."""
@@ -0,0 +1,112 @@
+"""
+Cold-start benchmark: import time and the heavy modules loaded by common entry points.
+
+Every sample runs in a fresh interpreter, so nothing is cached between runs.
+Queries go to an in-process stub transport; no server is needed.
+
+    python -m benchmarks.bench_import --runs 10
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+# Modules the entry points should only load when they are really needed.
+HEAVY_MODULES = ("pydantic", "httpx", "asyncio", "sqlite3", "opentelemetry", "ragula.sdk.models")
+
+_STUB_SESSION = """
+import requests
+from requests.adapters import HTTPAdapter
+
+class StubAdapter(HTTPAdapter):
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"results": [{"fileId": "f1", "score": 0.9, "contentSnippet": "text"}]}'
+        response.request = request
+        return response
+"""
+
+# Scenario name -> code to time.
+SCENARIOS: Dict[str, str] = {
+    "import requests (floor)": "import requests",
+    "from ragula.sdk import RagulaClient": "from ragula.sdk import RagulaClient",
+    "RagulaClient + first query": (
+        "from ragula.sdk import RagulaClient\n"
+        + _STUB_SESSION
+        + "client = RagulaClient(token='bench')\n"
+        "client._session.mount('https://', StubAdapter())\n"
+        "client.query.query_collection('c1', 'q')"
+    ),
+    "ragula_tool definition": "from ragula.ai_tool import ragula_tool\nragula_tool('key', 'c1')",
+    "from ragula.sdk import *": "from ragula.sdk import *",
+}
+
+_RUNNER = """
+import json, sys, time
+started = time.perf_counter()
+{code}
+seconds = time.perf_counter() - started
+print(json.dumps({{"seconds": seconds, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+@dataclass
+class ImportResult:
+    """
+    Attributes:
+        name: Scenario name.
+        runs: Fresh interpreters sampled.
+        median_ms: Median time of the scenario's code, in milliseconds.
+        loaded: Heavy modules that were imported.
+    """
+    name: str
+    runs: int
+    median_ms: float
+    loaded: List[str]
+
+
+def sample(code: str, python: str = sys.executable) -> Dict[str, object]:
+    """Runs code in a fresh interpreter and returns its time and the heavy modules it loaded."""
+    script = _RUNNER.format(code=code, heavy=HEAVY_MODULES)
+    output = subprocess.run([python, "-c", script], check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run_imports(runs: int, scenarios: Optional[Dict[str, str]] = None) -> List[ImportResult]:
+    results = []
+    for name, code in (scenarios or SCENARIOS).items():
+        samples = [sample(code) for _ in range(runs)]
+        median = statistics.median(float(s["seconds"]) for s in samples) * 1000
+        results.append(ImportResult(name, runs, median, list(samples[-1]["loaded"])))
+    return results
+
+
+def format_table(results: List[ImportResult]) -> str:
+    header = f"{'scenario':<38}{'runs':>6}{'median ms':>11}  heavy modules loaded"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(f"{r.name:<38}{r.runs:>6}{r.median_ms:>11.1f}  {', '.join(r.loaded) or '-'}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per scenario.")
+    parser.add_argument("--json", metavar="PATH", help="Also write the results as JSON.")
+    args = parser.parse_args(argv)
+
+    results = run_imports(args.runs)
+    print(format_table(results))
+    if args.json:
+        with open(args.json, "w") as handle:
+            json.dump([asdict(r) for r in results], handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+Micro-benchmark of the client-side cost of one API call.
+
+The transports are replaced by in-process stubs returning a canned body, so
+the numbers are pure SDK overhead: payload building, header handling, JSON
+encoding, the requests/httpx request pipeline and decoding. Each step is also
+timed next to the approach it replaced.
+
+    python -m benchmarks.bench_request_overhead --calls 20000
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ragula.sdk import RagulaClient, RetryPolicy
+from ragula.sdk.models import QueryPayload
+from ragula.sdk.parsing import decode_body, dumps_json, fast_json_backend
+from ragula.sdk.query import build_query_payload
+
+COLLECTION_ID = "bench-collection"
+QUERY = "How do I rotate my API keys?"
+
+
+@dataclass
+class OverheadResult:
+    """
+    Attributes:
+        name: Step or call measured.
+        calls: Iterations timed.
+        us_per_call: Mean microseconds per iteration.
+    """
+    name: str
+    calls: int
+    us_per_call: float
+
+
+def query_body(results: int, snippet_size: int) -> bytes:
+    snippet = "x" * snippet_size
+    hits = [
+        {"fileId": f"file-{i}", "score": 1.0 - i / (results + 1), "contentSnippet": snippet} for i in range(results)
+    ]
+    return json.dumps({"results": hits}).encode()
+
+
+def measure(name: str, call: Callable[[], Any], calls: int) -> OverheadResult:
+    for _ in range(min(calls, 200)):  # Warm caches and lazily built adapters
+        call()
+    started = time.perf_counter()
+    for _ in range(calls):
+        call()
+    return OverheadResult(name, calls, (time.perf_counter() - started) / calls * 1e6)
+
+
+class _StubAdapter(HTTPAdapter):
+    """Answers every request with the same 200 JSON body, without touching the network."""
+
+    def __init__(self, body: bytes):
+        super().__init__()
+        self._body = body
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = self._body
+        response.headers["Content-Type"] = "application/json"
+        response.request = request
+        response.url = request.url or ""
+        return response
+
+
+def sync_client(body: bytes) -> RagulaClient:
+    client = RagulaClient(token="bench", base_url="http://bench.invalid", retry=RetryPolicy(max_attempts=1))
+    client._session.mount("http://", _StubAdapter(body))
+    return client
+
+
+def async_results(body: bytes, calls: int) -> List[OverheadResult]:
+    try:
+        import httpx
+        from ragula.sdk import AsyncRagulaClient
+    except ImportError:
+        return []
+
+    def handler(request: "httpx.Request") -> "httpx.Response":
+        return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+
+    async def run() -> OverheadResult:
+        client = AsyncRagulaClient(
+            token="bench",
+            base_url="http://bench.invalid",
+            retry=RetryPolicy(max_attempts=1),
+            transport=httpx.MockTransport(handler),
+        )
+        try:
+            for _ in range(min(calls, 200)):
+                await client.query.query_collection(COLLECTION_ID, QUERY)
+            started = time.perf_counter()
+            for _ in range(calls):
+                await client.query.query_collection(COLLECTION_ID, QUERY)
+            return OverheadResult("async query_collection", calls, (time.perf_counter() - started) / calls * 1e6)
+        finally:
+            await client.aclose()
+
+    return [asyncio.run(run())]
+
+
+def run_overhead(calls: int, results: int = 10, snippet_size: int = 500) -> List[OverheadResult]:
+    body = query_body(results, snippet_size)
+    payload = {"query": QUERY}
+    client = sync_client(body)
+    session_headers = client._session.headers
+    env_session = requests.Session()
+
+    def pydantic_payload() -> Dict[str, Any]:
+        return QueryPayload(query=QUERY).model_dump(by_alias=True, exclude_none=True)
+
+    measured = [
+        measure("payload: pydantic model_dump", pydantic_payload, calls),
+        measure("payload: build_query_payload", lambda: build_query_payload(QUERY), calls),
+        measure("headers: session copy", session_headers.copy, calls),
+        measure("environment: per-call scan", lambda: env_session.merge_environment_settings(
+            client.base_url, {}, None, None, None), calls),
+        measure("encode: json.dumps", lambda: json.dumps(payload).encode("utf-8"), calls),
+        measure(f"encode: dumps_json ({fast_json_backend()})", lambda: dumps_json(payload), calls),
+        measure("decode: json.loads", lambda: json.loads(body), calls),
+        measure(f"decode: decode_body ({fast_json_backend()})", lambda: decode_body(body, "json"), calls),
+        measure("sync query_collection", lambda: client.query.query_collection(COLLECTION_ID, QUERY), calls),
+        measure("sync list_collections", client.collections.list_collections, calls),
+    ]
+    client.close()
+    measured.extend(async_results(body, calls))
+    return measured
+
+
+def format_table(results: List[OverheadResult]) -> str:
+    header = f"{'step':<44}{'calls':>9}{'us/call':>10}"
+    lines = [header, "-" * len(header)]
+    lines.extend(f"{r.name:<44}{r.calls:>9}{r.us_per_call:>10.2f}" for r in results)
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=10000, help="Iterations per step.")
+    parser.add_argument("--results", type=int, default=10, help="Hits in the canned query response.")
+    parser.add_argument("--snippet-size", type=int, default=500, help="Characters per result snippet.")
+    parser.add_argument("--json", metavar="PATH", help="Also write the results as JSON.")
+    args = parser.parse_args(argv)
+
+    results = run_overhead(args.calls, args.results, args.snippet_size)
+    print(format_table(results))
+    if args.json:
+        with open(args.json, "w") as handle:
+            json.dump([asdict(r) for r in results], handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
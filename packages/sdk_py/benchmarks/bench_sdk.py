@@ -0,0 +1,231 @@
+"""
+End-to-end SDK benchmarks against MockRagulaServer.
+
+Measures throughput and p50/p99 latency of the query, listing and upload paths
+for the sync client, threaded fan-out and the async client, plus peak Python
+memory for large listings and uploads.
+
+    python -m benchmarks.bench_sdk --requests 2000 --concurrency 16 --latency 0.002
+    python -m benchmarks.bench_sdk --json results.json   # for comparing runs
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, List, Optional
+
+from ragula.sdk import AsyncRagulaClient, RagulaClient, RetryPolicy
+
+from .mock_server import MockConfig, ServerProcess
+
+COLLECTION_ID = "bench-collection"
+
+
+@dataclass
+class BenchResult:
+    """
+    Attributes:
+        name: Scenario name.
+        calls: Completed calls, failed ones included.
+        errors: Calls that raised.
+        seconds: Wall-clock time of the scenario.
+        throughput: Calls per second.
+        p50_ms / p99_ms: Per-call latency percentiles, in milliseconds.
+        peak_memory_kb: Peak traced Python allocations, for memory scenarios.
+    """
+    name: str
+    calls: int
+    errors: int
+    seconds: float
+    throughput: float
+    p50_ms: float
+    p99_ms: float
+    peak_memory_kb: Optional[float] = None
+
+
+def percentile(samples: List[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[max(0, min(98, int(q) - 1))]
+
+
+def summarize(name: str, latencies: List[float], errors: int, seconds: float, peak: Optional[int] = None) -> BenchResult:
+    return BenchResult(
+        name=name,
+        calls=len(latencies),
+        errors=errors,
+        seconds=seconds,
+        throughput=len(latencies) / seconds if seconds else 0.0,
+        p50_ms=percentile(latencies, 50) * 1000,
+        p99_ms=percentile(latencies, 99) * 1000,
+        peak_memory_kb=peak / 1024 if peak is not None else None,
+    )
+
+
+def timed_calls(name: str, call: Callable[[], Any], count: int) -> BenchResult:
+    """Runs call count times sequentially, timing each call."""
+    latencies, errors = [], 0
+    started = time.perf_counter()
+    for _ in range(count):
+        begin = time.perf_counter()
+        try:
+            call()
+        except Exception:
+            errors += 1
+        latencies.append(time.perf_counter() - begin)
+    return summarize(name, latencies, errors, time.perf_counter() - started)
+
+
+def traced(name: str, call: Callable[[], Any]) -> BenchResult:
+    """Runs call once while tracing Python allocations."""
+    tracemalloc.start()
+    try:
+        started = time.perf_counter()
+        call()
+        seconds = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return summarize(name, [seconds], 0, seconds, peak)
+
+
+def bench_threaded_queries(client: RagulaClient, count: int, concurrency: int) -> BenchResult:
+    queries = [f"query {i}" for i in range(count)]
+    started = time.perf_counter()
+    results = client.query.query_many(COLLECTION_ID, queries, concurrency=concurrency)
+    seconds = time.perf_counter() - started
+    errors = sum(1 for result in results if isinstance(result, Exception))
+    # query_many does not expose per-call timings; report the mean time per call at this concurrency.
+    per_call = [seconds * concurrency / count] * count
+    return summarize(f"threaded_query (x{concurrency})", per_call, errors, seconds)
+
+
+def bench_async_queries(base_url: str, count: int, concurrency: int, retry: RetryPolicy) -> Optional[BenchResult]:
+    try:
+        client = AsyncRagulaClient(token="bench", base_url=base_url, retry=retry, max_connections=concurrency)
+    except ImportError:
+        return None
+
+    async def run() -> BenchResult:
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies: List[float] = []
+        errors = 0
+
+        async def one(i: int) -> None:
+            nonlocal errors
+            async with semaphore:
+                begin = time.perf_counter()
+                try:
+                    await client.query.query_collection(COLLECTION_ID, f"query {i}")
+                except Exception:
+                    errors += 1
+                latencies.append(time.perf_counter() - begin)
+
+        async with client:
+            started = time.perf_counter()
+            await asyncio.gather(*(one(i) for i in range(count)))
+            return summarize(f"async_query (x{concurrency})", latencies, errors, time.perf_counter() - started)
+
+    return asyncio.run(run())
+
+
+def run_benchmarks(
+    config: MockConfig,
+    requests: int = 500,
+    concurrency: int = 8,
+    upload_mb: int = 16,
+    retries: int = 3,
+) -> List[BenchResult]:
+    """Starts a mock server in a child process and runs every scenario against it."""
+    retry = RetryPolicy(max_attempts=retries, backoff_base=0.001, jitter=False)
+    results: List[BenchResult] = []
+    with ServerProcess(config) as server:
+        client = RagulaClient(token="bench", base_url=server.base_url, retry=retry, pool_maxsize=concurrency)
+        with client:
+            # Warm up the connection pool so the first scenario is not penalized.
+            client.collections.list_collections()
+
+            results.append(timed_calls(
+                "sync_query", lambda: client.query.query_collection(COLLECTION_ID, "what is rag?"), requests
+            ))
+            results.append(bench_threaded_queries(client, requests, concurrency))
+            async_result = bench_async_queries(server.base_url, requests, concurrency, retry)
+            if async_result is not None:
+                results.append(async_result)
+            results.append(timed_calls(
+                "sync_list_files", lambda: client.files.list_files(COLLECTION_ID), max(1, requests // 10)
+            ))
+            results.append(traced("memory_list_files", lambda: client.files.list_files(COLLECTION_ID)))
+            results.append(traced(
+                "memory_iter_files", lambda: sum(1 for _ in client.files.iter_files(COLLECTION_ID, page_size=500))
+            ))
+
+            fd, path = tempfile.mkstemp(suffix=".bin")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    chunk = os.urandom(1 << 20)
+                    for _ in range(upload_mb):
+                        handle.write(chunk)
+                results.append(traced(
+                    f"memory_upload_{upload_mb}mb", lambda: client.files.upload_file(COLLECTION_ID, file_path=path)
+                ))
+                results.append(timed_calls(
+                    "sync_upload_small",
+                    lambda: client.files.upload_file(COLLECTION_ID, file_content=b"x" * 4096, file_name="small.txt"),
+                    max(1, requests // 10),
+                ))
+            finally:
+                os.unlink(path)
+    return results
+
+
+def format_table(results: List[BenchResult]) -> str:
+    header = f"{'scenario':<28}{'calls':>7}{'errors':>7}{'calls/s':>11}{'p50 ms':>9}{'p99 ms':>9}{'peak KiB':>11}"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        peak = f"{r.peak_memory_kb:.0f}" if r.peak_memory_kb is not None else "-"
+        lines.append(
+            f"{r.name:<28}{r.calls:>7}{r.errors:>7}{r.throughput:>11.1f}{r.p50_ms:>9.2f}{r.p99_ms:>9.2f}{peak:>11}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500, help="Calls per query scenario.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Parallelism of the fan-out scenarios.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Server latency per request, in seconds.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests failing with 503.")
+    parser.add_argument("--results", type=int, default=10, help="Hits per query response.")
+    parser.add_argument("--snippet-size", type=int, default=500, help="Characters per result snippet.")
+    parser.add_argument("--list-size", type=int, default=10000, help="Items per listing.")
+    parser.add_argument("--upload-mb", type=int, default=16, help="Size of the large upload, in MiB.")
+    parser.add_argument("--json", metavar="PATH", help="Also write the results as JSON.")
+    args = parser.parse_args(argv)
+
+    config = MockConfig(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        results=args.results,
+        snippet_size=args.snippet_size,
+        list_size=args.list_size,
+    )
+    results = run_benchmarks(config, args.requests, args.concurrency, args.upload_mb)
+    print(format_table(results))
+    if args.json:
+        with open(args.json, "w") as handle:
+            json.dump({"config": asdict(config), "results": [asdict(r) for r in results]}, handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+"""
+A local stand-in for the Ragula API, used by the benchmarks.
+
+It serves the endpoints the SDK calls with synthetic data of configurable size,
+adds a fixed latency per request and fails a configurable share of requests
+with 503, so client overhead can be measured without network noise.
+"""
+
+import json
+import multiprocessing
+import random
+import re
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+TIMESTAMP = "2024-01-01T00:00:00Z"
+
+_ROUTE = re.compile(r"^/api/collections(?:/(?P<collection>[^/]+)(?:/(?P<resource>[^/]+)(?:/(?P<item>[^/]+))?)?)?$")
+
+
+@dataclass
+class MockConfig:
+    """
+    Attributes:
+        latency: Seconds the server waits before answering each request.
+        error_rate: Share of requests (0-1) answered with 503 and Retry-After: 0.
+        results: Hits returned per query.
+        snippet_size: Characters per result snippet.
+        list_size: Files and folders in every listing.
+        seed: Seed for the error draw, so runs are repeatable.
+    """
+    latency: float = 0.0
+    error_rate: float = 0.0
+    results: int = 10
+    snippet_size: int = 500
+    list_size: int = 1000
+    seed: int = 0
+
+
+def _file(index: int, collection_id: str) -> Dict[str, Any]:
+    return {
+        "id": f"file-{index}", "name": f"document-{index}.pdf", "collectionId": collection_id,
+        "folderId": None, "createdAt": TIMESTAMP, "updatedAt": TIMESTAMP, "storagePath": f"/store/{index}",
+    }
+
+
+def _folder(index: int, collection_id: str) -> Dict[str, Any]:
+    return {
+        "id": f"folder-{index}", "name": f"folder-{index}", "parentId": None, "collectionId": collection_id,
+        "createdAt": TIMESTAMP, "updatedAt": TIMESTAMP,
+    }
+
+
+class MockRagulaServer:
+    """
+    Threaded HTTP/1.1 server answering like the Ragula API. Use as a context
+    manager; base_url is ready to pass to RagulaClient.
+    """
+
+    def __init__(self, config: Optional[MockConfig] = None):
+        self.config = config or MockConfig()
+        self.requests = 0
+        self.bytes_received = 0
+        self._lock = threading.Lock()
+        self._random = random.Random(self.config.seed)
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+        # Bodies are built once per shape; the benchmarks measure the client, not the server.
+        self._bodies: Dict[Tuple[str, str], bytes] = {}
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockRagulaServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-ragula", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockRagulaServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _fail(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            return self.config.error_rate > 0 and self._random.random() < self.config.error_rate
+
+    def _body(self, kind: str, collection_id: str, build: Any) -> bytes:
+        key = (kind, collection_id)
+        body = self._bodies.get(key)
+        if body is None:
+            body = self._bodies[key] = json.dumps(build()).encode()
+        return body
+
+    def _query_body(self, collection_id: str, answer: bool) -> bytes:
+        config = self.config
+
+        def build() -> Dict[str, Any]:
+            snippet = "x" * config.snippet_size
+            results = [
+                {"fileId": f"file-{i}", "score": 1.0 - i / (config.results + 1), "contentSnippet": snippet}
+                for i in range(config.results)
+            ]
+            return {"answer": "An answer.", "results": results} if answer else {"results": results}
+
+        return self._body("question" if answer else "query", collection_id, build)
+
+    def _listing(self, resource: str, collection_id: str, query: Dict[str, List[str]]) -> bytes:
+        build_item = _file if resource == "files" else _folder
+        total = self.config.list_size
+        if "limit" in query:
+            offset = int(query.get("offset", ["0"])[0])
+            limit = int(query["limit"][0])
+            page = [build_item(i, collection_id) for i in range(offset, min(total, offset + limit))]
+            return json.dumps(page).encode()
+        return self._body(resource, collection_id, lambda: [build_item(i, collection_id) for i in range(total)])
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, like the real API
+            # Headers and body go out in separate writes; without this, Nagle's algorithm
+            # and delayed ACKs add ~40 ms to every response.
+            disable_nagle_algorithm = True
+
+            def _answer(self, status: int, body: bytes = b"", headers: Optional[Dict[str, str]] = None) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _drain(self) -> int:
+                remaining = int(self.headers.get("Content-Length") or 0)
+                size = remaining
+                while remaining:
+                    chunk = self.rfile.read(min(remaining, 1 << 16))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                return size
+
+            def _handle(self) -> None:
+                size = self._drain()
+                with server._lock:
+                    server.bytes_received += size
+                if server.config.latency:
+                    threading.Event().wait(server.config.latency)
+                if server._fail():
+                    self._answer(503, b'{"message": "Service unavailable"}', {"Retry-After": "0"})
+                    return
+                url = urlparse(self.path)
+                match = _ROUTE.match(url.path)
+                if match is None:
+                    self._answer(404, b'{"message": "Not found"}')
+                    return
+                collection_id, resource, item = match.group("collection", "resource", "item")
+                self._answer(*self._route(self.command, collection_id, resource, item, parse_qs(url.query)))
+
+            def _route(self, method: str, collection_id: Optional[str], resource: Optional[str],
+                       item: Optional[str], query: Dict[str, List[str]]) -> Tuple[int, bytes]:
+                if method == "DELETE":
+                    return 204, b""
+                if resource in ("query", "question"):
+                    return 200, server._query_body(collection_id or "", resource == "question")
+                if resource == "status":
+                    total = server.config.list_size
+                    return 200, json.dumps({"status": "ready", "fileCount": total, "totalSize": total * 1024}).encode()
+                if resource in ("files", "folders") and method == "GET":
+                    return 200, server._listing(resource, collection_id or "", query)
+                if resource == "files":
+                    return 201, json.dumps(_file(0, collection_id or "")).encode()
+                if resource == "folders":
+                    return 201, json.dumps(_folder(0, collection_id or "")).encode()
+                collection = {"id": collection_id or "c", "name": "bench", "userId": "u",
+                              "createdAt": TIMESTAMP, "updatedAt": TIMESTAMP}
+                return 200, json.dumps(collection if collection_id else [collection]).encode()
+
+            do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        return Handler
+
+
+def _serve(config: MockConfig, conn: Any) -> None:
+    with MockRagulaServer(config) as server:
+        conn.send(server.base_url)
+        conn.recv()  # Blocks until the parent asks the server to stop
+
+
+class ServerProcess:
+    """
+    Runs a MockRagulaServer in a child process, so its allocations and GIL use
+    do not distort client-side measurements. Use as a context manager.
+    """
+
+    def __init__(self, config: Optional[MockConfig] = None):
+        self.config = config or MockConfig()
+        self.base_url = ""
+        self._process: Optional[multiprocessing.Process] = None
+        self._conn: Any = None
+
+    def __enter__(self) -> "ServerProcess":
+        parent, child = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(target=_serve, args=(self.config, child), daemon=True)
+        self._process.start()
+        self._conn = parent
+        self.base_url = parent.recv()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._conn.send("stop")
+        if self._process is not None:
+            self._process.join(timeout=10)
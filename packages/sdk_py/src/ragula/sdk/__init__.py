@@ -6,19 +6,150 @@ This SDK provides a Python interface to the Ragula REST API.
 
 __version__ = "0.1.0" # Initial version
 
-from .client import RagulaClient, RagulaError
-from .collections import CollectionsService
-from .folders import FoldersService
-from .files import FilesService
-from .query import QueryService
+from typing import TYPE_CHECKING, Any, Dict, List
+
+# Public names and the modules defining them. They are imported on first access
+# (PEP 562), so "from ragula.sdk import RagulaClient" does not load pydantic,
+# httpx, sqlite3 or asyncio.
+_EXPORTS: Dict[str, str] = {
+    "RagulaClient": "client",
+    "RagulaError": "client",
+    "RetryPolicy": "retry",
+    "Timeouts": "transport",
+    "RequestGovernor": "ratelimit",
+    "INTERACTIVE": "ratelimit",
+    "BACKGROUND": "ratelimit",
+    "AsyncRagulaClient": "async_client",
+    "CollectionsService": "collections",
+    "AsyncCollectionsService": "collections",
+    "FoldersService": "folders",
+    "AsyncFoldersService": "folders",
+    "FilesService": "files",
+    "AsyncFilesService": "files",
+    "QueryService": "query",
+    "AsyncQueryService": "query",
+    "SyncService": "sync",
+    "SyncSummary": "sync",
+    "SyncFailure": "sync",
+    "QueryCache": "cache",
+    "CacheBackend": "cache",
+    "MemoryCacheBackend": "cache",
+    "DiskCacheBackend": "cache",
+    "CacheStats": "cache",
+    "JSON_MODE": "parsing",
+    "MODEL_MODE": "parsing",
+    "RAW_MODE": "parsing",
+    "TreeCache": "tree",
+    "WalkEntry": "tree",
+    "DeletePlan": "bulk",
+    "DeleteReport": "bulk",
+    "DeleteResult": "bulk",
+    "PlannedDelete": "bulk",
+    "StatusChange": "status",
+    "StatusPolling": "status",
+    "RequestHook": "metrics",
+    "RequestEvent": "metrics",
+    "CallbackHook": "metrics",
+    "MetricsCollector": "metrics",
+    "Histogram": "metrics",
+    "OpenTelemetryHook": "metrics",
+    "FederatedHit": "federated",
+    "FederatedResponse": "federated",
+    "SingleFlight": "coalesce",
+    "AsyncSingleFlight": "coalesce",
+    "CoalescingStats": "coalesce",
+    "AnswerChunk": "streaming",
+    "AnswerStream": "streaming",
+    "AsyncAnswerStream": "streaming",
+}
+
+if TYPE_CHECKING:
+    from .client import RagulaClient, RagulaError
+    from .retry import RetryPolicy
+    from .transport import Timeouts
+    from .ratelimit import RequestGovernor, INTERACTIVE, BACKGROUND
+    from .async_client import AsyncRagulaClient
+    from .collections import CollectionsService, AsyncCollectionsService
+    from .folders import FoldersService, AsyncFoldersService
+    from .files import FilesService, AsyncFilesService
+    from .query import QueryService, AsyncQueryService
+    from .sync import SyncService, SyncSummary, SyncFailure
+    from .cache import QueryCache, CacheBackend, MemoryCacheBackend, DiskCacheBackend, CacheStats
+    from .parsing import JSON_MODE, MODEL_MODE, RAW_MODE
+    from .tree import TreeCache, WalkEntry
+    from .bulk import DeletePlan, DeleteReport, DeleteResult, PlannedDelete
+    from .status import StatusChange, StatusPolling
+    from .metrics import CallbackHook, Histogram, MetricsCollector, OpenTelemetryHook, RequestEvent, RequestHook
+    from .federated import FederatedHit, FederatedResponse
+    from .coalesce import AsyncSingleFlight, CoalescingStats, SingleFlight
+    from .streaming import AnswerChunk, AnswerStream, AsyncAnswerStream
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     "RagulaClient",
     "RagulaError",
+    "RetryPolicy",
+    "Timeouts",
+    "RequestGovernor",
+    "INTERACTIVE",
+    "BACKGROUND",
     "CollectionsService",
     "FoldersService",
     "FilesService",
     "QueryService",
+    "AsyncRagulaClient",
+    "AsyncCollectionsService",
+    "AsyncFoldersService",
+    "AsyncFilesService",
+    "AsyncQueryService",
+    "QueryCache",
+    "CacheBackend",
+    "MemoryCacheBackend",
+    "DiskCacheBackend",
+    "CacheStats",
+    "SyncService",
+    "SyncSummary",
+    "SyncFailure",
+    "JSON_MODE",
+    "MODEL_MODE",
+    "RAW_MODE",
+    "TreeCache",
+    "WalkEntry",
+    "DeletePlan",
+    "DeleteReport",
+    "DeleteResult",
+    "PlannedDelete",
+    "StatusChange",
+    "StatusPolling",
+    "RequestHook",
+    "RequestEvent",
+    "CallbackHook",
+    "MetricsCollector",
+    "Histogram",
+    "OpenTelemetryHook",
+    "FederatedHit",
+    "FederatedResponse",
+    "SingleFlight",
+    "AsyncSingleFlight",
+    "CoalescingStats",
+    "AnswerChunk",
+    "AnswerStream",
+    "AsyncAnswerStream",
 ]
 
 # Optional: Configure logging for the library
@@ -0,0 +1,331 @@
+import asyncio
+import time
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, Dict, Any, Sequence, Union
+
+from .client import RagulaError, _normalize_base_url, _rewind_body
+from .ratelimit import INTERACTIVE, RequestGovernor
+from .coalesce import AsyncSingleFlight, is_coalescible, request_key
+from .metrics import RequestHook, finish_event, record_response, start_event
+from .parsing import JSON_MODE, RAW_MODE, check_response_mode, decode_body, dumps_json
+from .retry import RetryPolicy
+from .transport import TimeoutPair, Timeouts, clamp_timeout
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the optional extra
+    httpx = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from .cache import QueryCache
+    from .collections import AsyncCollectionsService
+    from .files import AsyncFilesService
+    from .folders import AsyncFoldersService
+    from .query import AsyncQueryService
+    from .tree import TreeCache
+
+# JSON bodies are encoded by the SDK (see parsing.dumps_json) and sent as content.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class AsyncRagulaClient:
+    def __init__(
+        self,
+        base_url: str = "https://www.ragula.io",
+        token: Optional[str] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        timeouts: Optional[Timeouts] = None,
+        response_mode: str = JSON_MODE,
+        transport: Optional[Any] = None,
+        query_cache: Optional["QueryCache"] = None,
+        retry: Optional[RetryPolicy] = None,
+        governor: Optional[RequestGovernor] = None,
+        tree_cache: Optional["TreeCache"] = None,
+        hooks: Optional[Sequence[RequestHook]] = None,
+        coalesce: bool = False,
+    ):
+        """
+        Initializes the asyncio Ragula API client.
+
+        The client keeps a single pooled httpx.AsyncClient, so many coroutines can
+        issue requests concurrently without blocking the event loop. Use it as an
+        async context manager, or call aclose() when done.
+
+        Args:
+            base_url: The base URL for the Ragula API. Defaults to "https://www.ragula.io".
+            token: The API token (Bearer) for authentication.
+            max_connections: Maximum number of concurrent connections in the pool.
+            max_keepalive_connections: Maximum number of idle connections kept alive.
+            keepalive_expiry: Seconds an idle pooled connection is kept before closing.
+            http2: Negotiate HTTP/2, multiplexing concurrent requests over fewer
+                   connections. Requires the h2 package (pip install "httpx[http2]").
+            timeouts: Per-operation (connect, read) timeouts. Defaults to Timeouts().
+            response_mode: How service methods return bodies: "json" (dicts and lists),
+                           "model" (pydantic models from ragula.sdk.models) or "raw" (bytes).
+            transport: Optional httpx transport (e.g. httpx.MockTransport for tests).
+            query_cache: Optional QueryCache for query/question responses. Disabled by default.
+            retry: Retry policy for transient failures. Defaults to RetryPolicy();
+                   pass RetryPolicy(max_attempts=1) to disable retries.
+            governor: Optional RequestGovernor applying rate and concurrency limits.
+                      Can be shared with other clients, sync or async.
+            tree_cache: Optional TreeCache holding folders.walk() snapshots. Disabled by default.
+            hooks: RequestHooks (e.g. a MetricsCollector) called before and after every API call.
+            coalesce: Let concurrent identical reads share one request (see ragula.sdk.coalesce).
+                      Counters are available from client.coalescer.stats().
+
+        Raises:
+            ImportError: If httpx is not installed (pip install "ragula-sdk[async]").
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncRagulaClient requires httpx. Install it with: pip install \"ragula-sdk[async]\""
+            )
+
+        self.base_url = _normalize_base_url(base_url)
+        self.token = token
+        self.query_cache = query_cache
+        self.tree_cache = tree_cache
+        self.hooks = list(hooks or [])
+        self.coalescer = AsyncSingleFlight() if coalesce else None
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.governor = governor
+        self.response_mode = check_response_mode(response_mode)
+        self.timeouts = timeouts if timeouts is not None else Timeouts()
+
+        # Content-Type is left to httpx so that JSON and multipart bodies get the right header.
+        headers = {"Accept": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+
+        self._http = httpx.AsyncClient(
+            headers=headers,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
+            transport=transport,
+        )
+
+    # Services are created on first use, as in RagulaClient.
+    @cached_property
+    def collections(self) -> "AsyncCollectionsService":
+        from .collections import AsyncCollectionsService
+        return AsyncCollectionsService(self)
+
+    @cached_property
+    def folders(self) -> "AsyncFoldersService":
+        from .folders import AsyncFoldersService
+        return AsyncFoldersService(self)
+
+    @cached_property
+    def files(self) -> "AsyncFilesService":
+        from .files import AsyncFilesService
+        return AsyncFilesService(self)
+
+    @cached_property
+    def query(self) -> "AsyncQueryService":
+        from .query import AsyncQueryService
+        return AsyncQueryService(self)
+
+    def _invalidate_collection(self, collection_id: str) -> None:
+        """Drops cached query responses and tree snapshots after the collection was mutated through this client."""
+        if self.query_cache is not None:
+            self.query_cache.invalidate_collection(collection_id)
+        self._invalidate_tree(collection_id)
+
+    def _invalidate_tree(self, collection_id: str) -> None:
+        """Drops cached folder tree snapshots of the collection."""
+        if self.tree_cache is not None:
+            self.tree_cache.invalidate_collection(collection_id)
+
+    async def __aenter__(self) -> "AsyncRagulaClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the underlying connection pool."""
+        await self._http.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None, # Form data, or a streamed body such as a MultipartEncoder
+        headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None,
+        lane: str = INTERACTIVE,
+        timeout: Optional[TimeoutPair] = None,
+        response_type: Optional[Any] = None,
+        response_mode: Optional[str] = None,
+        coalesce: bool = True,
+        stream_response: bool = False,
+        deadline_at: Optional[float] = None,
+    ) -> Union[Dict[str, Any], Any]:
+        """
+        Makes an asynchronous HTTP request to the specified endpoint.
+
+        Args:
+            method: HTTP method (e.g., 'GET', 'POST', 'PUT', 'DELETE').
+            endpoint: API endpoint path (e.g., '/collections').
+            params: URL query parameters.
+            json_data: JSON payload for the request body.
+            files: Files to upload (for multipart/form-data).
+            data: Form data payload (used with files), or a streamed request body.
+            headers: Extra headers for this request (e.g. a multipart Content-Type).
+            idempotent: Whether the request may be repeated safely. Defaults to the
+                        retry policy's view of the HTTP method.
+            lane: Governor lane of the request (interactive or background).
+            timeout: (connect, read) timeout for each attempt. Defaults to
+                     timeouts.default; never exceeds the retry deadline budget.
+            response_type: Model type of the body (e.g. List[File]) used in model mode.
+            response_mode: Overrides the client's response_mode for this call.
+            coalesce: Set to False to bypass the client's coalescer for this call.
+            stream_response: Return the open httpx.Response of a successful call instead
+                             of its decoded body, for the caller to consume and aclose().
+            deadline_at: Monotonic time (time.monotonic()) by which the call gives up,
+                         retries included, on top of the retry policy's deadline.
+                         Such calls are not coalesced.
+
+        Returns:
+            The decoded response body, or None for 204 responses.
+
+        Raises:
+            RagulaError: If the API returns an error status code or the request fails,
+                         after any retries.
+        """
+        # A caller's deadline would not bind the leader of a coalesced call.
+        coalescible = coalesce and not stream_response and deadline_at is None and self.coalescer is not None
+        if coalescible and is_coalescible(method, idempotent, files, data):
+            # Callers share the raw body and decode it separately, so each gets its own objects.
+            content = await self.coalescer.do(
+                request_key(method, endpoint, params, json_data, headers),
+                lambda: self._request(
+                    method, endpoint, params=params, json_data=json_data, headers=headers, idempotent=idempotent,
+                    lane=lane, timeout=timeout, response_mode=RAW_MODE, coalesce=False,
+                ),
+            )
+            return None if content is None else self._decode(200, content, response_mode, response_type)
+
+        url = self.base_url + endpoint
+
+        json_body = None
+        if json_data is not None and not files:
+            json_body = dumps_json(json_data)
+            headers = dict(_JSON_HEADERS, **headers) if headers else _JSON_HEADERS
+
+        stream = None
+        if data is not None and not isinstance(data, dict):
+            # Streamed bodies are sent as raw content with an explicit length, so
+            # httpx does not fall back to chunked transfer encoding.
+            headers = dict(headers or {})
+            headers.setdefault("Content-Length", str(len(data)))
+            stream, data = data, None
+
+        policy = self.retry
+        timeout = timeout if timeout is not None else self.timeouts.default
+        if idempotent is None:
+            idempotent = policy.is_idempotent(method)
+        deadline_at = policy.start_deadline(deadline_at)
+        attempt = 0
+        hooks = self.hooks
+        event = start_event(method, endpoint, lane, hooks) if hooks else None
+        started = time.perf_counter()
+
+        try:
+            while True:
+                attempt += 1
+                if event is not None:
+                    event.attempts = attempt
+                connect_timeout, read_timeout = clamp_timeout(timeout, policy.remaining(deadline_at))
+                if self.governor is not None:
+                    await self.governor.acquire_async(lane)
+                try:
+                    request = self._http.build_request(
+                        method,
+                        url,
+                        params=params,
+                        files=files,
+                        data=data,
+                        # httpx treats anything iterable as a sync stream, so hand it the async iterator.
+                        content=stream.__aiter__() if stream is not None else json_body,
+                        headers=headers,
+                        timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+                    )
+                    response = await self._http.send(request, stream=stream_response)
+                except httpx.HTTPError as e:
+                    # Handle connection errors, timeouts, etc.
+                    connect_error = isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+                    delay = policy.next_delay(attempt, idempotent, deadline_at, connect_error=connect_error)
+                    if delay is None or not _rewind_body(stream):
+                        raise RagulaError(status_code=500, message=f"Request failed: {e}") from e
+                    await asyncio.sleep(delay)
+                    continue
+                finally:
+                    if self.governor is not None:
+                        self.governor.release(lane)
+
+                if event is not None:
+                    record_response(event, response, stream_response)
+                if response.is_error:
+                    delay = policy.next_delay(
+                        attempt,
+                        idempotent,
+                        deadline_at,
+                        status_code=response.status_code,
+                        retry_after=response.headers.get("Retry-After"),
+                    )
+                    if stream_response:
+                        await response.aread() # Error bodies are small; reading them releases the connection
+                    if delay is None or not _rewind_body(stream):
+                        raise self._error_from_response(response)
+                    await asyncio.sleep(delay)
+                    continue
+
+                # Handle successful responses
+                if stream_response:
+                    return response
+                if response.status_code == 204: # No Content
+                    return None
+                if event is None:
+                    return self._decode(response.status_code, response.content, response_mode, response_type)
+                decode_started = time.perf_counter()
+                try:
+                    return self._decode(response.status_code, response.content, response_mode, response_type)
+                finally:
+                    event.decode_time = time.perf_counter() - decode_started
+        except BaseException as e:
+            if event is not None:
+                event.error = e
+            raise
+        finally:
+            if event is not None:
+                finish_event(event, started, hooks)
+
+    def _decode(self, status_code: int, content: bytes, response_mode: Optional[str], response_type: Optional[Any]) -> Any:
+        """Decodes a successful body in the requested (or the client's) response mode."""
+        try:
+            return decode_body(content, response_mode or self.response_mode, response_type)
+        except ValueError as e: # pydantic's ValidationError, caught without importing pydantic
+            raise RagulaError(status_code=status_code, message=f"Unexpected response body: {e}") from e
+
+    @staticmethod
+    def _error_from_response(response: Any) -> RagulaError:
+        """Builds a RagulaError from an error response, preferring the API's message."""
+        try:
+            # Try to parse error message from JSON response
+            error_data = response.json()
+            message = error_data.get("message", response.text)
+        except ValueError:
+            # If error response is not JSON
+            message = response.text
+        return RagulaError(status_code=response.status_code, message=message)
@@ -0,0 +1,217 @@
+"""
+Bulk deletes: parallel file deletes and recursive folder deletes driven by a plan.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import groupby
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Set
+
+from .client import RagulaError
+from .ratelimit import BACKGROUND
+from .tree import WalkEntry, child_path, item_field
+
+if TYPE_CHECKING:
+    import asyncio
+    from .client import RagulaClient
+    from .async_client import AsyncRagulaClient
+
+DEFAULT_DELETE_CONCURRENCY = 16
+
+FILE = "file"
+FOLDER = "folder"
+
+
+@dataclass(frozen=True)
+class PlannedDelete:
+    """
+    One item of a delete plan.
+
+    Attributes:
+        kind: "file" or "folder".
+        item_id: The ID of the file or folder.
+        path: Path relative to the planned folder ("" for the folder itself), if known.
+        depth: Nesting depth below the planned folder; folders are deleted deepest first.
+    """
+    kind: str
+    item_id: str
+    path: Optional[str] = None
+    depth: int = 0
+
+
+@dataclass
+class DeletePlan:
+    """
+    Everything a recursive folder delete will remove: all files first, then the
+    folders bottom-up, ending with the planned folder itself.
+    """
+    collection_id: str
+    folder_id: str
+    files: List[PlannedDelete] = field(default_factory=list)
+    folders: List[PlannedDelete] = field(default_factory=list)
+
+    def __iter__(self) -> Iterator[PlannedDelete]:
+        yield from self.files
+        yield from self.folders
+
+    def __len__(self) -> int:
+        return len(self.files) + len(self.folders)
+
+
+@dataclass
+class DeleteResult:
+    """Outcome of one delete. A file or folder that was already gone counts as deleted."""
+    item: PlannedDelete
+    error: Optional[RagulaError] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class DeleteReport:
+    """Per-item results of an executed (or, with dry_run, only planned) delete, in plan order."""
+    plan: DeletePlan
+    results: List[DeleteResult] = field(default_factory=list)
+    dry_run: bool = False
+
+    @property
+    def deleted(self) -> List[PlannedDelete]:
+        return [result.item for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> List[DeleteResult]:
+        return [result for result in self.results if not result.ok]
+
+
+def check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError("'concurrency' must be at least 1.")
+
+
+def build_plan(collection_id: str, folder_id: str, entries: Iterable[WalkEntry]) -> DeletePlan:
+    """Builds a delete plan from a top-down walk starting at folder_id."""
+    plan = DeletePlan(collection_id, folder_id)
+    for entry in entries:
+        depth = entry.path.count("/") + 1 if entry.path else 0
+        plan.folders.append(PlannedDelete(FOLDER, entry.folder_id or folder_id, entry.path, depth))
+        for file in entry.files:
+            path = child_path(entry.path, item_field(file, "name", "name"))
+            plan.files.append(PlannedDelete(FILE, item_field(file, "id", "id"), path, depth + 1))
+    # A top-down walk lists folders by increasing depth; a stable sort reverses the levels.
+    plan.folders.sort(key=lambda item: item.depth, reverse=True)
+    return plan
+
+
+def folder_levels(plan: DeletePlan) -> List[List[PlannedDelete]]:
+    """Groups the plan's folders into levels, deepest first. Folders of a level can be deleted in parallel."""
+    return [list(level) for _, level in groupby(plan.folders, key=lambda item: item.depth)]
+
+
+def blocked_paths(results: Iterable[DeleteResult]) -> Set[str]:
+    """Paths of the folders that still contain an item that failed to delete."""
+    blocked: Set[str] = set()
+    for result in results:
+        if result.ok or result.item.path is None:
+            continue
+        path = result.item.path
+        while path:
+            path = path.rpartition("/")[0]
+            blocked.add(path)
+    return blocked
+
+
+def skipped(item: PlannedDelete) -> DeleteResult:
+    error = RagulaError(status_code=409, message="Skipped: the folder's contents could not be deleted.")
+    return DeleteResult(item, error)
+
+
+def level_results(level: List[PlannedDelete], blocked: Set[str], deleted: List[DeleteResult]) -> List[DeleteResult]:
+    """Results of a folder level in plan order: the skipped items merged with the deleted (ready) ones."""
+    ready = iter(deleted)
+    return [skipped(item) if item.path in blocked else next(ready) for item in level]
+
+
+def delete_endpoint(collection_id: str, item: PlannedDelete) -> str:
+    return f"/collections/{collection_id}/{item.kind}s/{item.item_id}"
+
+
+def _outcome(item: PlannedDelete, error: Optional[RagulaError]) -> DeleteResult:
+    # Already deleted (e.g. by a concurrent cleanup) is as good as deleted.
+    if error is not None and error.status_code == 404:
+        error = None
+    return DeleteResult(item, error)
+
+
+def delete_items(
+    client: "RagulaClient", collection_id: str, items: List[PlannedDelete], pool: ThreadPoolExecutor
+) -> List[DeleteResult]:
+    """Deletes items in parallel on pool. Results are in input order."""
+    def delete(item: PlannedDelete) -> DeleteResult:
+        try:
+            client._request("DELETE", delete_endpoint(collection_id, item), lane=BACKGROUND)
+        except RagulaError as e:
+            return _outcome(item, e)
+        return _outcome(item, None)
+
+    return list(pool.map(delete, items))
+
+
+async def delete_items_async(
+    client: "AsyncRagulaClient", collection_id: str, items: List[PlannedDelete], semaphore: "asyncio.Semaphore"
+) -> List[DeleteResult]:
+    """Asyncio counterpart of delete_items, bounded by semaphore."""
+    import asyncio
+
+    async def delete(item: PlannedDelete) -> DeleteResult:
+        async with semaphore:
+            try:
+                await client._request("DELETE", delete_endpoint(collection_id, item), lane=BACKGROUND)
+            except RagulaError as e:
+                return _outcome(item, e)
+        return _outcome(item, None)
+
+    return list(await asyncio.gather(*(delete(item) for item in items)))
+
+
+def execute_plan(client: "RagulaClient", plan: DeletePlan, concurrency: int) -> DeleteReport:
+    """Deletes all files in parallel, then the folders level by level, deepest first."""
+    check_concurrency(concurrency)
+    report = DeleteReport(plan)
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = delete_items(client, plan.collection_id, plan.files, pool)
+            blocked: Set[str] = set()
+            for level in folder_levels(plan):
+                report.results.extend(results)
+                blocked |= blocked_paths(results)
+                ready = [item for item in level if item.path not in blocked]
+                results = level_results(level, blocked, delete_items(client, plan.collection_id, ready, pool))
+            report.results.extend(results)
+    finally:
+        # Invalidated once for the whole batch rather than per item.
+        client._invalidate_collection(plan.collection_id)
+    return report
+
+
+async def execute_plan_async(client: "AsyncRagulaClient", plan: DeletePlan, concurrency: int) -> DeleteReport:
+    """Asyncio counterpart of execute_plan."""
+    import asyncio
+
+    check_concurrency(concurrency)
+    report = DeleteReport(plan)
+    semaphore = asyncio.Semaphore(concurrency)
+    try:
+        results = await delete_items_async(client, plan.collection_id, plan.files, semaphore)
+        blocked: Set[str] = set()
+        for level in folder_levels(plan):
+            report.results.extend(results)
+            blocked |= blocked_paths(results)
+            ready = [item for item in level if item.path not in blocked]
+            deleted = await delete_items_async(client, plan.collection_id, ready, semaphore)
+            results = level_results(level, blocked, deleted)
+        report.results.extend(results)
+    finally:
+        client._invalidate_collection(plan.collection_id)
+    return report
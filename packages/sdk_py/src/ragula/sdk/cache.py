@@ -0,0 +1,270 @@
+"""
+Client-side response cache for QueryService.
+
+The cache is opt-in: pass a QueryCache to RagulaClient(query_cache=...) and
+identical query_collection / ask_question calls are served locally until their
+TTL expires or the collection is mutated through the same client.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+
+class CacheBackend:
+    """
+    Storage interface used by QueryCache.
+
+    Values are JSON strings. Implementations must be safe to call from several threads.
+    """
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the cached value for key, or None if it is missing or expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, collection_id: str, value: str, ttl: float) -> None:
+        """Stores value under key for ttl seconds, tagged with its collection."""
+        raise NotImplementedError
+
+    def invalidate_collection(self, collection_id: str) -> None:
+        """Drops every entry that belongs to collection_id."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Drops every entry."""
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-process LRU store bounded by max_entries.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        if max_entries < 1:
+            raise ValueError("'max_entries' must be at least 1.")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[2] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, collection_id: str, value: str, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (collection_id, value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_collection(self, collection_id: str) -> None:
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if entry[0] == collection_id]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class DiskCacheBackend(CacheBackend):
+    """
+    LRU store kept in a local SQLite file.
+
+    Several processes (e.g. gunicorn workers) pointing at the same path share
+    entries, hits and invalidations. Expiry uses wall-clock time so it is
+    consistent across processes.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000):
+        if max_entries < 1:
+            raise ValueError("'max_entries' must be at least 1.")
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " collection_id TEXT NOT NULL,"
+            " value TEXT NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_collection ON entries (collection_id)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def set(self, key: str, collection_id: str, value: str, ttl: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, collection_id, value, expires_at, last_access)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, collection_id, value, now + ttl, now),
+            )
+            # Evict expired entries first, then the least recently used beyond the bound.
+            self._conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+            self._conn.execute(
+                "DELETE FROM entries WHERE key IN ("
+                " SELECT key FROM entries ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def invalidate_collection(self, collection_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE collection_id = ?", (collection_id,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """Closes the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class QueryCache:
+    """
+    Response cache for query_collection / ask_question.
+
+    Entries are keyed by collection, endpoint and the normalized payload (query
+    whitespace collapsed, keys sorted), so trivially different spellings of the
+    same request share an entry.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: float = 300.0):
+        """
+        Args:
+            backend: Where entries are stored. Defaults to a MemoryCacheBackend.
+            ttl: Default time-to-live of an entry, in seconds.
+        """
+        if ttl <= 0:
+            raise ValueError("'ttl' must be positive.")
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttl = ttl
+        self._stats = CacheStats()
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(collection_id: str, endpoint: str, payload: Dict[str, Any]) -> str:
+        """Builds the cache key for a request."""
+        normalized = dict(payload)
+        query = normalized.get("query")
+        if isinstance(query, str):
+            normalized["query"] = " ".join(query.split())
+        raw = json.dumps([collection_id, endpoint, normalized], sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, collection_id: str, endpoint: str, payload: Dict[str, Any]) -> Optional[Any]:
+        """Returns the cached response for the request, decoded, or None on a miss. See get_body."""
+        body = self.get_body(collection_id, endpoint, payload)
+        return None if body is None else json.loads(body)
+
+    def set(
+        self,
+        collection_id: str,
+        endpoint: str,
+        payload: Dict[str, Any],
+        response: Any,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Stores a JSON-serializable response. See set_body."""
+        body = json.dumps(response, separators=(",", ":")).encode("utf-8")
+        self.set_body(collection_id, endpoint, payload, body, ttl)
+
+    def get_body(self, collection_id: str, endpoint: str, payload: Dict[str, Any]) -> Optional[bytes]:
+        """Returns the cached response body undecoded, or None on a miss."""
+        value = self.backend.get(self.make_key(collection_id, endpoint, payload))
+        with self._stats_lock:
+            if value is None:
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+        return None if value is None else value.encode("utf-8")
+
+    def set_body(
+        self,
+        collection_id: str,
+        endpoint: str,
+        payload: Dict[str, Any],
+        body: bytes,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Stores a raw JSON response body, skipping a decode/encode round trip."""
+        self.backend.set(
+            self.make_key(collection_id, endpoint, payload),
+            collection_id,
+            body.decode("utf-8"),
+            self.ttl if ttl is None else ttl,
+        )
+
+    def invalidate_collection(self, collection_id: str) -> None:
+        """Drops all cached responses for a collection."""
+        self.backend.invalidate_collection(collection_id)
+
+    def clear(self) -> None:
+        """Drops all cached responses and resets the counters."""
+        self.backend.clear()
+        with self._stats_lock:
+            self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        """A snapshot of the hit/miss counters for this process."""
+        with self._stats_lock:
+            return CacheStats(hits=self._stats.hits, misses=self._stats.misses)
@@ -1,5 +1,32 @@
+import io
+import time
 import requests
-from typing import Optional, Dict, Any, Union
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, Dict, Any, Sequence, Union
+from urllib3.exceptions import NewConnectionError
+
+from .ratelimit import INTERACTIVE, RequestGovernor
+from .coalesce import SingleFlight, is_coalescible, request_key
+from .metrics import RequestHook, finish_event, record_response, start_event
+from .parsing import JSON_MODE, RAW_MODE, check_response_mode, decode_body, dumps_json
+from .retry import RetryPolicy
+from .transport import (
+    DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE, TimeoutPair, Timeouts, build_session, clamp_timeout,
+    resolve_environment,
+)
+
+if TYPE_CHECKING:
+    from .cache import QueryCache
+    from .collections import CollectionsService
+    from .files import FilesService
+    from .folders import FoldersService
+    from .query import QueryService
+    from .sync import SyncService
+    from .tree import TreeCache
+
+# Per-request header overrides for multipart uploads: requests drops headers set to
+# None, so it fills in the multipart Content-Type (and Accept) itself.
+_MULTIPART_HEADERS: Dict[str, Optional[str]] = {"Content-Type": None, "Accept": None}
 
 class RagulaError(Exception):
     """Base exception for Ragula SDK errors."""
@@ -8,40 +35,151 @@ class RagulaError(Exception):
         self.message = message
         super().__init__(f"[{status_code}] {message}")
 
+def _normalize_base_url(base_url: str) -> str:
+    """Strips a trailing slash from base_url and appends /api if not present."""
+    if base_url.endswith('/'):
+        base_url = base_url[:-1]
+    if not base_url.endswith('/api'):
+        return f"{base_url}/api"
+    return base_url
+
+def _is_connect_error(error: requests.exceptions.RequestException) -> bool:
+    """Whether a transport failure happened before any request bytes were sent."""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        reason = getattr(error.args[0], "reason", error.args[0])
+        return isinstance(reason, NewConnectionError)
+    return False
+
+def _rewind_body(data: Any) -> bool:
+    """Rewinds a streamed request body before a retry. Returns False if it cannot be replayed."""
+    reset = getattr(data, "reset", None)
+    if reset is None:
+        return True
+    try:
+        reset()
+    except (OSError, io.UnsupportedOperation):
+        return False
+    return True
+
 class RagulaClient:
-    def __init__(self, base_url: str = "https://www.ragula.io", token: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: str = "https://www.ragula.io",
+        token: Optional[str] = None,
+        query_cache: Optional["QueryCache"] = None,
+        retry: Optional[RetryPolicy] = None,
+        governor: Optional[RequestGovernor] = None,
+        timeouts: Optional[Timeouts] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        tcp_keepalive: bool = True,
+        response_mode: str = JSON_MODE,
+        tree_cache: Optional["TreeCache"] = None,
+        hooks: Optional[Sequence[RequestHook]] = None,
+        coalesce: bool = False,
+    ):
         """
         Initializes the Ragula API client.
 
+        The client is safe to share between threads: its pooled session is only
+        configured here and never mutated per request. Call close() (or use the
+        client as a context manager) to release pooled connections.
+
         Args:
             base_url: The base URL for the Ragula API. Defaults to "https://api.ragula.io".
             token: The API token (Bearer) for authentication.
+            query_cache: Optional QueryCache for query/question responses. Disabled by default.
+            retry: Retry policy for transient failures. Defaults to RetryPolicy();
+                   pass RetryPolicy(max_attempts=1) to disable retries.
+            governor: Optional RequestGovernor applying rate and concurrency limits.
+                      Can be shared with other clients, sync or async.
+            timeouts: Per-operation (connect, read) timeouts. Defaults to Timeouts().
+            pool_connections: Number of per-host connection pools to cache.
+            pool_maxsize: Connections kept alive per host; size it to the number of
+                          threads sharing the client.
+            pool_block: Block when all pooled connections are busy instead of
+                        opening throwaway extra connections.
+            tcp_keepalive: Enable TCP keep-alive probes on pooled connections.
+            response_mode: How service methods return bodies: "json" (dicts and lists),
+                           "model" (pydantic models from ragula.sdk.models) or "raw" (bytes).
+            tree_cache: Optional TreeCache holding folders.walk() snapshots. Disabled by default.
+            hooks: RequestHooks (e.g. a MetricsCollector) called before and after every API call.
+            coalesce: Let concurrent identical reads share one request (see ragula.sdk.coalesce).
+                      Counters are available from client.coalescer.stats().
         """
         # Ensure base_url doesn't end with a slash, and append /api if not present
-        if base_url.endswith('/'):
-            base_url = base_url[:-1]
-        if not base_url.endswith('/api'):
-             self.base_url = f"{base_url}/api"
-        else:
-             self.base_url = base_url
+        self.base_url = _normalize_base_url(base_url)
 
         self.token = token
-        self._session = requests.Session()
+        self.query_cache = query_cache
+        self.tree_cache = tree_cache
+        self.hooks = list(hooks or [])
+        self.coalescer = SingleFlight() if coalesce else None
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.governor = governor
+        self.response_mode = check_response_mode(response_mode)
+        self.timeouts = timeouts if timeouts is not None else Timeouts()
+        self._session = build_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            tcp_keepalive=tcp_keepalive,
+        )
         if self.token:
             self._session.headers.update({"Authorization": f"Bearer {self.token}"})
         self._session.headers.update({"Content-Type": "application/json", "Accept": "application/json"})
+        resolve_environment(self._session, self.base_url)
 
-        # Initialize services
+    # Services are created (and their modules imported) on first use, so a client
+    # that only runs queries never loads the models the other services need.
+    @cached_property
+    def collections(self) -> "CollectionsService":
         from .collections import CollectionsService
+        return CollectionsService(self)
+
+    @cached_property
+    def folders(self) -> "FoldersService":
         from .folders import FoldersService
+        return FoldersService(self)
+
+    @cached_property
+    def files(self) -> "FilesService":
         from .files import FilesService
+        return FilesService(self)
+
+    @cached_property
+    def query(self) -> "QueryService":
         from .query import QueryService
+        return QueryService(self)
+
+    @cached_property
+    def sync(self) -> "SyncService":
+        from .sync import SyncService
+        return SyncService(self)
 
-        self.collections = CollectionsService(self)
-        self.folders = FoldersService(self)
-        self.files = FilesService(self)
-        self.query = QueryService(self)
+    def close(self) -> None:
+        """Closes pooled connections."""
+        self._session.close()
 
+    def __enter__(self) -> "RagulaClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _invalidate_collection(self, collection_id: str) -> None:
+        """Drops cached query responses and tree snapshots after the collection was mutated through this client."""
+        if self.query_cache is not None:
+            self.query_cache.invalidate_collection(collection_id)
+        self._invalidate_tree(collection_id)
+
+    def _invalidate_tree(self, collection_id: str) -> None:
+        """Drops cached folder tree snapshots of the collection."""
+        if self.tree_cache is not None:
+            self.tree_cache.invalidate_collection(collection_id)
 
     def _request(
         self,
@@ -50,7 +188,16 @@ class RagulaClient:
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
-        data: Optional[Dict[str, Any]] = None, # For form data like multipart/form-data
+        data: Optional[Any] = None, # Form data, or a streamed body such as a MultipartEncoder
+        headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None,
+        lane: str = INTERACTIVE,
+        timeout: Optional[TimeoutPair] = None,
+        response_type: Optional[Any] = None,
+        response_mode: Optional[str] = None,
+        coalesce: bool = True,
+        stream_response: bool = False,
+        deadline_at: Optional[float] = None,
     ) -> Union[Dict[str, Any], Any]:
         """
         Makes an HTTP request to the specified endpoint.
@@ -61,56 +208,146 @@ class RagulaClient:
             params: URL query parameters.
             json_data: JSON payload for the request body.
             files: Files to upload (for multipart/form-data).
-            data: Form data payload (used with files).
+            data: Form data payload (used with files), or a file-like request body.
+            headers: Extra headers for this request (e.g. a multipart Content-Type).
+            idempotent: Whether the request may be repeated safely. Defaults to the
+                        retry policy's view of the HTTP method; read-only POSTs such
+                        as queries pass True.
+            lane: Governor lane of the request (interactive or background).
+            timeout: (connect, read) timeout for each attempt. Defaults to
+                     timeouts.default; never exceeds the retry deadline budget.
+            response_type: Model type of the body (e.g. List[File]) used in model mode.
+            response_mode: Overrides the client's response_mode for this call.
+            coalesce: Set to False to bypass the client's coalescer for this call.
+            stream_response: Return the open requests.Response of a successful call instead
+                             of its decoded body, for the caller to consume and close.
+            deadline_at: Monotonic time (time.monotonic()) by which the call gives up,
+                         retries included, on top of the retry policy's deadline.
+                         Such calls are not coalesced.
 
         Returns:
-            The JSON response from the API.
+            The decoded response body, or None for 204 responses.
 
         Raises:
-            RagulaError: If the API returns an error status code.
+            RagulaError: If the API returns an error status code, after any retries.
         """
-        url = f"{self.base_url}{endpoint}"
-        headers = self._session.headers.copy()
+        # A caller's deadline would not bind the leader of a coalesced call.
+        coalescible = coalesce and not stream_response and deadline_at is None and self.coalescer is not None
+        if coalescible and is_coalescible(method, idempotent, files, data):
+            # Callers share the raw body and decode it separately, so each gets its own objects.
+            content = self.coalescer.do(
+                request_key(method, endpoint, params, json_data, headers),
+                lambda: self._request(
+                    method, endpoint, params=params, json_data=json_data, headers=headers, idempotent=idempotent,
+                    lane=lane, timeout=timeout, response_mode=RAW_MODE, coalesce=False,
+                ),
+            )
+            return None if content is None else self._decode(200, content, response_mode, response_type)
 
-        # Adjust headers for file uploads
+        url = self.base_url + endpoint
+        # JSON calls rely on the session's default headers; only uploads and
+        # callers with extra headers pass (and merge) per-request headers.
+        request_headers: Optional[Dict[str, Optional[str]]] = None
         if files:
-            # requests handles Content-Type for multipart/form-data
-            # Remove Content-Type and Accept if they were set for JSON
-            headers.pop('Content-Type', None)
-            headers.pop('Accept', None) # Let requests handle Accept for file responses if needed
+            request_headers = dict(_MULTIPART_HEADERS, **headers) if headers else _MULTIPART_HEADERS
+        elif headers:
+            request_headers = headers
+        body = data
+        if json_data is not None and not files:
+            body = dumps_json(json_data)
+
+        policy = self.retry
+        timeout = timeout if timeout is not None else self.timeouts.default
+        if idempotent is None:
+            idempotent = policy.is_idempotent(method)
+        deadline_at = policy.start_deadline(deadline_at)
+        attempt = 0
+        hooks = self.hooks
+        event = start_event(method, endpoint, lane, hooks) if hooks else None
+        started = time.perf_counter()
 
         try:
-            response = self._session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json_data if not files else None, # Don't send json if files are present
-                files=files,
-                data=data if files else None, # Send data only if files are present
-                headers=headers
-            )
-            response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
-
-            # Handle successful responses
-            if response.status_code == 204: # No Content
-                return None
-            try:
-                return response.json()
-            except requests.exceptions.JSONDecodeError:
-                 # Handle cases where response might not be JSON (e.g., file download - though not in this spec)
-                 # Or if a 2xx response unexpectedly has no body or non-JSON body
-                 return response.text # Or response.content for binary
-
-        except requests.exceptions.HTTPError as e:
-            status_code = e.response.status_code
-            try:
-                # Try to parse error message from JSON response
-                error_data = e.response.json()
-                message = error_data.get("message", e.response.text)
-            except requests.exceptions.JSONDecodeError:
-                # If error response is not JSON
-                message = e.response.text
-            raise RagulaError(status_code=status_code, message=message) from e
-        except requests.exceptions.RequestException as e:
-            # Handle connection errors, timeouts, etc.
-            raise RagulaError(status_code=500, message=f"Request failed: {e}") from e
\ No newline at end of file
+            while True:
+                attempt += 1
+                if event is not None:
+                    event.attempts = attempt
+                if self.governor is not None:
+                    self.governor.acquire(lane)
+                try:
+                    response = self._session.request(
+                        method=method,
+                        url=url,
+                        params=params,
+                        files=files,
+                        data=body,
+                        headers=request_headers,
+                        timeout=clamp_timeout(timeout, policy.remaining(deadline_at)),
+                        stream=stream_response,
+                    )
+                except requests.exceptions.RequestException as e:
+                    # Handle connection errors, timeouts, etc.
+                    delay = policy.next_delay(
+                        attempt, idempotent, deadline_at, connect_error=_is_connect_error(e)
+                    )
+                    if delay is None or not _rewind_body(data):
+                        raise RagulaError(status_code=500, message=f"Request failed: {e}") from e
+                    time.sleep(delay)
+                    continue
+                finally:
+                    if self.governor is not None:
+                        self.governor.release(lane)
+
+                if event is not None:
+                    record_response(event, response, stream_response)
+                if response.status_code >= 400:
+                    delay = policy.next_delay(
+                        attempt,
+                        idempotent,
+                        deadline_at,
+                        status_code=response.status_code,
+                        retry_after=response.headers.get("Retry-After"),
+                    )
+                    if delay is None or not _rewind_body(data):
+                        raise self._error_from_response(response)
+                    response.close() # Return the connection to the pool before waiting
+                    time.sleep(delay)
+                    continue
+
+                # Handle successful responses
+                if stream_response:
+                    return response
+                if response.status_code == 204: # No Content
+                    return None
+                if event is None:
+                    return self._decode(response.status_code, response.content, response_mode, response_type)
+                decode_started = time.perf_counter()
+                try:
+                    return self._decode(response.status_code, response.content, response_mode, response_type)
+                finally:
+                    event.decode_time = time.perf_counter() - decode_started
+        except BaseException as e:
+            if event is not None:
+                event.error = e
+            raise
+        finally:
+            if event is not None:
+                finish_event(event, started, hooks)
+
+    def _decode(self, status_code: int, content: bytes, response_mode: Optional[str], response_type: Optional[Any]) -> Any:
+        """Decodes a successful body in the requested (or the client's) response mode."""
+        try:
+            return decode_body(content, response_mode or self.response_mode, response_type)
+        except ValueError as e: # pydantic's ValidationError, caught without importing pydantic
+            raise RagulaError(status_code=status_code, message=f"Unexpected response body: {e}") from e
+
+    @staticmethod
+    def _error_from_response(response: requests.Response) -> RagulaError:
+        """Builds a RagulaError from an error response, preferring the API's message."""
+        try:
+            # Try to parse error message from JSON response
+            error_data = response.json()
+            message = error_data.get("message", response.text)
+        except requests.exceptions.JSONDecodeError:
+            # If error response is not JSON
+            message = response.text
+        return RagulaError(status_code=response.status_code, message=message)
@@ -0,0 +1,187 @@
+"""
+Single-flight coalescing of identical in-flight reads.
+
+When a client is created with coalesce=True, concurrent identical reads (GETs
+and read-only POSTs such as queries) share one HTTP request: the first caller
+sends it and the others wait for its outcome. The shared response body is
+decoded separately for every caller, so no two callers receive the same object.
+Unlike QueryCache, nothing is kept once the request completes.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional
+
+from .parsing import dumps_json
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+@dataclass
+class CoalescingStats:
+    """
+    Attributes:
+        requests: Requests actually sent for coalescible calls.
+        coalesced: Calls that shared an in-flight request instead of sending their own.
+    """
+    requests: int = 0
+    coalesced: int = 0
+
+    @property
+    def coalesced_rate(self) -> float:
+        total = self.requests + self.coalesced
+        return self.coalesced / total if total else 0.0
+
+
+def is_coalescible(method: str, idempotent: Optional[bool], files: Any, data: Any) -> bool:
+    """Whether a call is a read that may share its request: a GET, or a POST marked idempotent."""
+    if files or data is not None:
+        return False
+    return method == "GET" or (method == "POST" and idempotent is True)
+
+
+def request_key(
+    method: str,
+    endpoint: str,
+    params: Optional[Dict[str, Any]],
+    json_data: Optional[Dict[str, Any]],
+    headers: Optional[Dict[str, str]],
+) -> bytes:
+    """Identifies a request; calls with equal keys are interchangeable."""
+    return dumps_json([method, endpoint, params, json_data, headers])
+
+
+def copy_error(error: BaseException) -> BaseException:
+    """
+    Returns an exception object of its own for one more caller of a shared call,
+    so tracebacks of different callers do not mix. Copies RagulaErrors; other
+    exceptions are returned as they are.
+    """
+    from .client import RagulaError
+
+    if isinstance(error, RagulaError):
+        copy = RagulaError(status_code=error.status_code, message=error.message)
+        copy.__cause__ = error.__cause__
+        return copy
+    return error
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces identical calls made concurrently from several threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: Dict[bytes, _Flight] = {}
+        self._stats = CoalescingStats()
+
+    def do(self, key: bytes, call: Callable[[], Any]) -> Any:
+        """
+        Runs call, or waits for the identical call already in flight, and returns
+        its result. An exception raised by the shared call is raised to every caller.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                self._stats.requests += 1
+                leader = True
+            else:
+                self._stats.coalesced += 1
+                leader = False
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is None:
+                return flight.result
+            if not isinstance(flight.error, Exception):
+                # The sending thread was interrupted (e.g. KeyboardInterrupt); send our own request.
+                return self.do(key, call)
+            raise copy_error(flight.error)
+
+        try:
+            flight.result = call()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+    def stats(self) -> CoalescingStats:
+        """A snapshot of the counters."""
+        with self._lock:
+            return CoalescingStats(requests=self._stats.requests, coalesced=self._stats.coalesced)
+
+
+class _AsyncFlight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future[Any]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio counterpart of SingleFlight, for one event loop. The shared request
+    runs as its own task: it is cancelled only once every waiting caller was.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[bytes, _AsyncFlight] = {}
+        self._stats = CoalescingStats()
+
+    async def do(self, key: bytes, call: Callable[[], Awaitable[Any]]) -> Any:
+        import asyncio
+
+        flight = self._flights.get(key)
+        leader = flight is None or flight.task.done()
+        if leader:
+            flight = self._flights[key] = _AsyncFlight(asyncio.ensure_future(call()))
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+            self._stats.requests += 1
+        else:
+            self._stats.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done() and flight.waiters == 1:
+                flight.task.cancel() # No one is waiting for the result any more
+            raise
+        except Exception as e:
+            if leader:
+                raise
+            raise copy_error(e) from e.__cause__
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, key: bytes, flight: _AsyncFlight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    def stats(self) -> CoalescingStats:
+        """A snapshot of the counters."""
+        return CoalescingStats(requests=self._stats.requests, coalesced=self._stats.coalesced)
@@ -1,12 +1,37 @@
-from typing import TYPE_CHECKING, List, Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
+from .client import RagulaError
 from .models import (
     Collection, CollectionStatus, CreateCollectionPayload, UpdateCollectionPayload,
     ListCollectionsResponse, CreateCollectionResponse, GetCollectionResponse,
     UpdateCollectionResponse, GetCollectionStatusResponse
 )
+from .pagination import DEFAULT_PAGE_SIZE, aiter_pages, item_mode, iter_pages, page_params
+from .parsing import JSON_MODE
+from .ratelimit import BACKGROUND
 
+# Status watching (and asyncio, which it needs) is imported on first use, so a
+# client that never waits on a collection does not load it.
 if TYPE_CHECKING:
     from .client import RagulaClient
+    from .async_client import AsyncRagulaClient
+    from .status import AsyncStatusWatcher, StatusChange, StatusPolling, StatusWatcher
+
+# Default wait_until_ready timeout, in seconds.
+DEFAULT_READY_TIMEOUT = 600.0
+
+
+def _check_ready(
+    collection_id: str, last: Optional["StatusChange"], polling: Optional["StatusPolling"]
+) -> "StatusChange":
+    """Returns the final status of a finished watch, raising if processing failed."""
+    from .status import StatusPolling
+
+    if last is None or (polling or StatusPolling()).is_failed(last.status):
+        status = last.status if last is not None else "unknown"
+        raise RagulaError(status_code=500, message=f"Collection {collection_id} failed processing (status: {status}).")
+    return last
+
 
 class CollectionsService:
     """
@@ -15,6 +40,11 @@ class CollectionsService:
     def __init__(self, client: 'RagulaClient'):
         self._client = client
 
+    @cached_property
+    def _status_watcher(self) -> "StatusWatcher":
+        from .status import StatusWatcher
+        return StatusWatcher(self._fetch_status)
+
     def list_collections(self) -> ListCollectionsResponse:
         """
         Lists all collections accessible by the authenticated user.
@@ -22,7 +52,29 @@ class CollectionsService:
         Returns:
             List[Collection]: A list of collection objects.
         """
-        return self._client._request("GET", "/collections")
+        return self._client._request("GET", "/collections", response_type=ListCollectionsResponse)
+
+    def iter_collections(self, page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = True) -> Iterator[Collection]:
+        """
+        Lazily iterates over the accessible collections, one page at a time.
+
+        Args:
+            page_size (int): Collections requested per page.
+            prefetch (bool): Fetch the next page in the background while the
+                             current one is consumed.
+
+        Returns:
+            Iterator[Collection]: The collections, in listing order.
+        """
+        mode = item_mode(self._client.response_mode)
+
+        def fetch(limit: int, offset: int) -> ListCollectionsResponse:
+            return self._client._request(
+                "GET", "/collections", params=page_params({}, limit, offset),
+                response_type=ListCollectionsResponse, response_mode=mode,
+            )
+
+        return iter_pages(fetch, page_size, prefetch)
 
     def create_collection(self, payload: CreateCollectionPayload) -> CreateCollectionResponse:
         """
@@ -38,7 +90,9 @@ class CollectionsService:
         """
         # Use model_dump to serialize, handling optional fields and aliases
         json_payload = payload.model_dump(exclude_unset=True, by_alias=True)
-        return self._client._request("POST", "/collections", json_data=json_payload)
+        return self._client._request(
+            "POST", "/collections", json_data=json_payload, response_type=CreateCollectionResponse
+        )
 
     def get_collection(self, collection_id: str) -> GetCollectionResponse:
         """
@@ -50,7 +104,7 @@ class CollectionsService:
         Returns:
             Collection: The collection object.
         """
-        return self._client._request("GET", f"/collections/{collection_id}")
+        return self._client._request("GET", f"/collections/{collection_id}", response_type=GetCollectionResponse)
 
     def update_collection(self, collection_id: str, payload: UpdateCollectionPayload) -> UpdateCollectionResponse:
         """
@@ -72,7 +126,9 @@ class CollectionsService:
         # The API should handle the case where json_payload is empty if allowed.
         # If not allowed, the API would return an error.
         # No need for the client to pre-emptively check for an empty payload.
-        return self._client._request("PUT", f"/collections/{collection_id}", json_data=json_payload)
+        return self._client._request(
+            "PUT", f"/collections/{collection_id}", json_data=json_payload, response_type=UpdateCollectionResponse
+        )
 
     def delete_collection(self, collection_id: str) -> None:
         """
@@ -82,6 +138,7 @@ class CollectionsService:
             collection_id: The ID of the collection to delete.
         """
         self._client._request("DELETE", f"/collections/{collection_id}")
+        self._client._invalidate_collection(collection_id)
         return None # Explicitly return None for 204 responses
 
     def get_collection_status(self, collection_id: str) -> GetCollectionStatusResponse:
@@ -95,4 +152,209 @@ class CollectionsService:
             CollectionStatus: An object containing the collection's status,
                               file count, and total size.
         """
-        return self._client._request("GET", f"/collections/{collection_id}/status")
\ No newline at end of file
+        return self._client._request(
+            "GET", f"/collections/{collection_id}/status", response_type=GetCollectionStatusResponse
+        )
+
+
+    def watch_status(
+        self, collection_id: str, timeout: Optional[float] = None, polling: Optional["StatusPolling"] = None
+    ) -> Iterator["StatusChange"]:
+        """
+        Yields the collection's status transitions until it is ready or failed.
+
+        The first item is the current status; later items carry file_count and
+        total_size deltas for progress reporting. Concurrent watches of the same
+        collection with equal polling settings through this client share one
+        poller; each keeps its own timeout.
+
+        Args:
+            collection_id (str): The ID of the collection.
+            timeout (Optional[float]): Seconds to watch before raising TimeoutError.
+            polling (Optional["StatusPolling"]): Poll intervals and terminal statuses.
+
+        Returns:
+            Iterator["StatusChange"]: The observed changes, oldest first.
+        """
+        return self._status_watcher.watch(collection_id, timeout, polling)
+
+    def wait_until_ready(
+        self,
+        collection_id: str,
+        timeout: Optional[float] = DEFAULT_READY_TIMEOUT,
+        polling: Optional["StatusPolling"] = None,
+        on_change: Optional[Callable[["StatusChange"], None]] = None,
+    ) -> "StatusChange":
+        """
+        Blocks until the collection has finished processing and can be queried.
+
+        Args:
+            collection_id (str): The ID of the collection.
+            timeout (Optional[float]): Seconds to wait; None waits indefinitely.
+            polling (Optional["StatusPolling"]): Poll intervals and terminal statuses.
+            on_change (Optional[Callable]): Called with every StatusChange, e.g. to report progress.
+
+        Returns:
+            StatusChange: The final, ready status.
+
+        Raises:
+            TimeoutError: If the collection was not ready within timeout seconds.
+            RagulaError: If processing failed or the status could not be fetched.
+        """
+        last = None
+        for change in self.watch_status(collection_id, timeout, polling):
+            if on_change is not None:
+                on_change(change)
+            last = change
+        return _check_ready(collection_id, last, polling)
+
+    def _fetch_status(self, collection_id: str) -> Dict[str, Any]:
+        return self._client._request(
+            "GET", f"/collections/{collection_id}/status", lane=BACKGROUND, response_mode=JSON_MODE
+        )
+
+class AsyncCollectionsService:
+    """
+    Asyncio counterpart of CollectionsService, used by AsyncRagulaClient.
+    """
+    def __init__(self, client: 'AsyncRagulaClient'):
+        self._client = client
+
+    @cached_property
+    def _status_watcher(self) -> "AsyncStatusWatcher":
+        from .status import AsyncStatusWatcher
+        return AsyncStatusWatcher(self._fetch_status)
+
+    async def list_collections(self) -> ListCollectionsResponse:
+        """
+        Lists all collections accessible by the authenticated user.
+
+        Returns:
+            List[Collection]: A list of collection objects.
+        """
+        return await self._client._request("GET", "/collections", response_type=ListCollectionsResponse)
+
+    def iter_collections(
+        self, page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = True
+    ) -> AsyncIterator[Collection]:
+        """
+        Lazily iterates over the accessible collections, one page at a time.
+
+        Args:
+            page_size (int): Collections requested per page.
+            prefetch (bool): Fetch the next page in the background while the
+                             current one is consumed.
+
+        Returns:
+            AsyncIterator[Collection]: The collections, in listing order.
+        """
+        mode = item_mode(self._client.response_mode)
+
+        async def fetch(limit: int, offset: int) -> ListCollectionsResponse:
+            return await self._client._request(
+                "GET", "/collections", params=page_params({}, limit, offset),
+                response_type=ListCollectionsResponse, response_mode=mode,
+            )
+
+        return aiter_pages(fetch, page_size, prefetch)
+
+    async def create_collection(self, payload: CreateCollectionPayload) -> CreateCollectionResponse:
+        """
+        Creates a new collection.
+
+        Args:
+            payload (CreateCollectionPayload): The details for the new collection.
+
+        Returns:
+            Collection: The newly created collection object.
+        """
+        json_payload = payload.model_dump(exclude_unset=True, by_alias=True)
+        return await self._client._request(
+            "POST", "/collections", json_data=json_payload, response_type=CreateCollectionResponse
+        )
+
+    async def get_collection(self, collection_id: str) -> GetCollectionResponse:
+        """
+        Retrieves details for a specific collection.
+
+        Args:
+            collection_id (str): The ID of the collection to retrieve.
+
+        Returns:
+            Collection: The collection object.
+        """
+        return await self._client._request("GET", f"/collections/{collection_id}", response_type=GetCollectionResponse)
+
+    async def update_collection(self, collection_id: str, payload: UpdateCollectionPayload) -> UpdateCollectionResponse:
+        """
+        Updates an existing collection. Only provided fields will be updated.
+
+        Args:
+            collection_id (str): The ID of the collection to update.
+            payload (UpdateCollectionPayload): The fields to update.
+
+        Returns:
+            Collection: The updated collection object.
+        """
+        json_payload = payload.model_dump(exclude_unset=True, by_alias=True)
+        return await self._client._request(
+            "PUT", f"/collections/{collection_id}", json_data=json_payload, response_type=UpdateCollectionResponse
+        )
+
+    async def delete_collection(self, collection_id: str) -> None:
+        """
+        Deletes a specific collection.
+
+        Args:
+            collection_id: The ID of the collection to delete.
+        """
+        await self._client._request("DELETE", f"/collections/{collection_id}")
+        self._client._invalidate_collection(collection_id)
+        return None # Explicitly return None for 204 responses
+
+    async def get_collection_status(self, collection_id: str) -> GetCollectionStatusResponse:
+        """
+        Retrieves the processing status for a specific collection.
+
+        Args:
+            collection_id (str): The ID of the collection.
+
+        Returns:
+            CollectionStatus: An object containing the collection's status,
+                              file count, and total size.
+        """
+        return await self._client._request(
+            "GET", f"/collections/{collection_id}/status", response_type=GetCollectionStatusResponse
+        )
+
+    def watch_status(
+        self, collection_id: str, timeout: Optional[float] = None, polling: Optional["StatusPolling"] = None
+    ) -> AsyncIterator["StatusChange"]:
+        """
+        Yields the collection's status transitions until it is ready or failed.
+        See CollectionsService.watch_status.
+        """
+        return self._status_watcher.watch(collection_id, timeout, polling)
+
+    async def wait_until_ready(
+        self,
+        collection_id: str,
+        timeout: Optional[float] = DEFAULT_READY_TIMEOUT,
+        polling: Optional["StatusPolling"] = None,
+        on_change: Optional[Callable[["StatusChange"], None]] = None,
+    ) -> "StatusChange":
+        """
+        Waits until the collection has finished processing and can be queried.
+        See CollectionsService.wait_until_ready.
+        """
+        last = None
+        async for change in self.watch_status(collection_id, timeout, polling):
+            if on_change is not None:
+                on_change(change)
+            last = change
+        return _check_ready(collection_id, last, polling)
+
+    async def _fetch_status(self, collection_id: str) -> Dict[str, Any]:
+        return await self._client._request(
+            "GET", f"/collections/{collection_id}/status", lane=BACKGROUND, response_mode=JSON_MODE
+        )
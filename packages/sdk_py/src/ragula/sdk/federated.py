@@ -0,0 +1,141 @@
+"""
+Federated search: one query over several collections, merged into a single ranked list.
+
+Scores from different collections are not directly comparable, so the merged
+list is ordered by a fused score:
+
+* "rrf"   - reciprocal rank fusion, 1 / (rrf_k + rank) with the rank of the hit
+            within its collection. Robust to differently scaled scores (default).
+* "score" - the hit's score min-max normalized within its collection to 0..1.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .client import RagulaError
+from .parsing import to_json_value
+from .tree import item_field
+
+RRF = "rrf"
+SCORE = "score"
+FUSION_METHODS = (RRF, SCORE)
+
+DEFAULT_FEDERATED_TOP_K = 10
+DEFAULT_RRF_K = 60
+
+
+@dataclass
+class FederatedHit:
+    """
+    One result of a federated query.
+
+    Attributes:
+        collection_id: The collection the hit came from.
+        item: The result as returned for that collection (a dict, or a QueryResultItem in model mode).
+        score: The fused score the merged list is ordered by.
+        rank: 1-based rank of the hit within its collection.
+    """
+    collection_id: str
+    item: Any
+    score: float
+    rank: int
+
+    @property
+    def file_id(self) -> str:
+        return item_field(self.item, "fileId", "file_id")
+
+    @property
+    def raw_score(self) -> float:
+        """The score the collection reported for the hit."""
+        return item_field(self.item, "score", "score")
+
+    @property
+    def content_snippet(self) -> Optional[str]:
+        return item_field(self.item, "contentSnippet", "content_snippet")
+
+
+@dataclass
+class FederatedResponse:
+    """
+    Merged results of a federated query.
+
+    Collections that failed or missed the deadline are listed in errors (a
+    missed deadline as a 504 RagulaError); the hits come from the others.
+    """
+    hits: List[FederatedHit] = field(default_factory=list)
+    errors: Dict[str, RagulaError] = field(default_factory=dict)
+
+    @property
+    def complete(self) -> bool:
+        """Whether every collection contributed its results."""
+        return not self.errors
+
+    def __iter__(self) -> Iterator[FederatedHit]:
+        return iter(self.hits)
+
+    def __len__(self) -> int:
+        return len(self.hits)
+
+
+def check_fusion(fusion: str, top_k: int, rrf_k: float) -> None:
+    if fusion not in FUSION_METHODS:
+        raise ValueError(f"'fusion' must be one of {FUSION_METHODS}, not {fusion!r}.")
+    if top_k < 1:
+        raise ValueError("'top_k' must be at least 1.")
+    if rrf_k < 0:
+        raise ValueError("'rrf_k' must not be negative.")
+
+
+def deadline_error(collection_id: str, deadline: float) -> RagulaError:
+    return RagulaError(status_code=504, message=f"Collection {collection_id} did not answer within {deadline} seconds.")
+
+
+def result_items(response: Any) -> List[Any]:
+    """The results of a query response in any response mode."""
+    if isinstance(response, (bytes, bytearray)):
+        response = to_json_value(response)
+    if isinstance(response, dict):
+        return list(response.get("results") or [])
+    return list(getattr(response, "results", None) or [])
+
+
+def _fused_scores(items: List[Any], fusion: str, rrf_k: float) -> List[Tuple[float, int, Any]]:
+    """(fused score, rank, item) for one collection's results, best first."""
+    ranked = sorted(items, key=lambda item: item_field(item, "score", "score") or 0.0, reverse=True)
+    if fusion == RRF:
+        return [(1.0 / (rrf_k + rank), rank, item) for rank, item in enumerate(ranked, 1)]
+    scores = [item_field(item, "score", "score") or 0.0 for item in ranked]
+    low, high = (min(scores), max(scores)) if scores else (0.0, 0.0)
+    spread = high - low
+    return [
+        ((score - low) / spread if spread else 1.0, rank, item)
+        for rank, (score, item) in enumerate(zip(scores, ranked), 1)
+    ]
+
+
+def fuse(
+    responses: Sequence[Tuple[str, Any]],
+    top_k: int = DEFAULT_FEDERATED_TOP_K,
+    fusion: str = RRF,
+    rrf_k: float = DEFAULT_RRF_K,
+) -> List[FederatedHit]:
+    """
+    Merges per-collection query responses into one top_k list.
+
+    Args:
+        responses: (collection_id, response) pairs, in any response mode.
+        top_k: Number of hits to keep.
+        fusion: "rrf" or "score", see the module docstring.
+        rrf_k: Damping constant of reciprocal rank fusion.
+
+    Ties are broken by the collection's own score, then by the order of responses.
+    """
+    check_fusion(fusion, top_k, rrf_k)
+    candidates = []
+    for order, (collection_id, response) in enumerate(responses):
+        for fused, rank, item in _fused_scores(result_items(response), fusion, rrf_k):
+            raw = item_field(item, "score", "score") or 0.0
+            candidates.append((fused, raw, -order, -rank, collection_id, item))
+    best = heapq.nlargest(top_k, candidates, key=lambda candidate: candidate[:4])
+    return [FederatedHit(collection_id, item, fused, -neg_rank) for fused, _, _, neg_rank, collection_id, item in best]
@@ -1,11 +1,60 @@
 
-import os
-import os
-from typing import TYPE_CHECKING, List, Optional, IO, Tuple, Union
-from .models import File, ListFilesResponse, UploadFileResponse
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, List, Optional, IO, Sequence, Union
+from .bulk import (
+    DEFAULT_DELETE_CONCURRENCY, FILE, DeleteResult, PlannedDelete, check_concurrency, delete_items,
+    delete_items_async,
+)
+from .multipart import DEFAULT_CHUNK_SIZE, MultipartEncoder, ProgressCallback
+from .pagination import DEFAULT_PAGE_SIZE, aiter_pages, item_mode, iter_pages, page_params
+from .ratelimit import BACKGROUND
 
+# asyncio and the models are imported where needed, as in query.py; response
+# types are passed by model name and only resolved in model mode.
 if TYPE_CHECKING:
     from .client import RagulaClient
+    from .async_client import AsyncRagulaClient
+    from .models import File, ListFilesResponse, UploadFileResponse
+
+
+def _build_upload_encoder(
+    file_path: Optional[str],
+    file_content: Optional[Union[bytes, IO[bytes]]],
+    file_name: Optional[str],
+    folder_id: Optional[str],
+    progress_callback: Optional[ProgressCallback],
+    chunk_size: int,
+) -> MultipartEncoder:
+    """
+    Validates upload arguments and builds the streaming multipart body.
+    Shared by FilesService and AsyncFilesService.
+    """
+    if not file_path and not (file_content and file_name):
+        raise ValueError("Either 'file_path' or both 'file_content' and 'file_name' must be provided.")
+    if file_path and file_content:
+        raise ValueError("Provide either 'file_path' or 'file_content', not both.")
+
+    fields = {}
+    if folder_id:
+        fields['folderId'] = folder_id
+
+    if file_path:
+        # The encoder owns this handle and closes it when the upload finishes.
+        return MultipartEncoder.from_path(
+            file_path,
+            fields=fields,
+            file_name=file_name,
+            progress_callback=progress_callback,
+            chunk_size=chunk_size,
+        )
+    return MultipartEncoder.from_content(
+        file_content,
+        file_name,
+        fields=fields,
+        progress_callback=progress_callback,
+        chunk_size=chunk_size,
+    )
+
 
 class FilesService:
     """
@@ -14,7 +63,7 @@ class FilesService:
     def __init__(self, client: 'RagulaClient'):
         self._client = client
 
-    def list_files(self, collection_id: str, folder_id: Optional[str] = None) -> ListFilesResponse:
+    def list_files(self, collection_id: str, folder_id: Optional[str] = None) -> "ListFilesResponse":
         """
         Lists files within a specific collection, optionally filtered by folder ID.
 
@@ -29,7 +78,42 @@ class FilesService:
         params = {}
         if folder_id:
             params["folderId"] = folder_id
-        return self._client._request("GET", f"/collections/{collection_id}/files", params=params)
+        return self._client._request(
+            "GET", f"/collections/{collection_id}/files", params=params, response_type="ListFilesResponse"
+        )
+
+    def iter_files(
+        self,
+        collection_id: str,
+        folder_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Iterator["File"]:
+        """
+        Lazily iterates over the files of a collection (or folder), one page at a time.
+
+        Args:
+            collection_id (str): The ID of the collection containing the files.
+            folder_id (Optional[str]): The ID of the folder to list files from.
+            page_size (int): Files requested per page.
+            prefetch (bool): Fetch the next page in the background while the
+                             current one is consumed.
+
+        Returns:
+            Iterator[File]: The files, in listing order.
+        """
+        params = {}
+        if folder_id:
+            params["folderId"] = folder_id
+        mode = item_mode(self._client.response_mode)
+
+        def fetch(limit: int, offset: int) -> "ListFilesResponse":
+            return self._client._request(
+                "GET", f"/collections/{collection_id}/files", params=page_params(params, limit, offset),
+                response_type="ListFilesResponse", response_mode=mode,
+            )
+
+        return iter_pages(fetch, page_size, prefetch)
 
     def upload_file(
         self,
@@ -37,20 +121,30 @@ class FilesService:
         file_path: Optional[str] = None,
         file_content: Optional[Union[bytes, IO[bytes]]] = None,
         file_name: Optional[str] = None,
-        folder_id: Optional[str] = None
-    ) -> UploadFileResponse:
+        folder_id: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> "UploadFileResponse":
         """
         Uploads a file to a specific collection, optionally placing it in a folder.
         You must provide either file_path OR file_content (with file_name).
 
+        The body is streamed in chunk_size pieces with an exact Content-Length, so
+        memory use stays flat regardless of the file size. A file opened from
+        file_path is closed before this method returns.
+
         Args:
             collection_id (str): The ID of the collection to upload the file to.
             file_path (Optional[str]): The local path to the file to upload.
             file_content (Optional[Union[bytes, IO[bytes]]]): The content of the file
                                                               as bytes or a file-like object.
                                                               If using this, file_name must also be provided.
-            file_name (Optional[str]): The name to give the uploaded file. Required if using file_content.
+            file_name (Optional[str]): The name to give the uploaded file. Required if using file_content,
+                                       optional override of the base name when using file_path.
             folder_id (Optional[str]): The ID of the folder to place the uploaded file in.
+            progress_callback (Optional[Callable[[int, int], None]]): Called with
+                (bytes_sent, total_bytes) as the body is streamed.
+            chunk_size (int): Size of the read buffer used while streaming.
 
         Returns:
             File: The file object representing the uploaded file.
@@ -58,35 +152,173 @@ class FilesService:
         Raises:
             ValueError: If required arguments are missing or conflicting.
         """
-        if not file_path and not (file_content and file_name):
-            raise ValueError("Either 'file_path' or both 'file_content' and 'file_name' must be provided.")
-        if file_path and file_content:
-            raise ValueError("Provide either 'file_path' or 'file_content', not both.")
+        with _build_upload_encoder(
+            file_path, file_content, file_name, folder_id, progress_callback, chunk_size
+        ) as encoder:
+            # The encoder is a sized file-like body, so requests streams it with a
+            # Content-Length instead of buffering or chunking it.
+            response = self._client._request(
+                "POST",
+                f"/collections/{collection_id}/files",
+                data=encoder,
+                headers={"Content-Type": encoder.content_type},
+                lane=BACKGROUND,
+                timeout=self._client.timeouts.upload,
+                response_type="UploadFileResponse",
+            )
+        self._client._invalidate_collection(collection_id)
+        return response
 
-        data = {}
-        if folder_id:
-            data['folderId'] = folder_id
 
-        files_payload: Dict[str, Tuple[Optional[str], Union[bytes, IO[bytes]]]] = {}
+    def delete_file(self, collection_id: str, file_id: str) -> None:
+        """
+        Deletes a specific file within a collection.
 
-        if file_path:
-            actual_file_name = os.path.basename(file_path)
-            files_payload['file'] = (actual_file_name, open(file_path, 'rb'))
-            # Note: The file handle will be closed by the requests library
-        elif file_content and file_name:
-             files_payload['file'] = (file_name, file_content)
+        Args:
+            collection_id (str): The ID of the collection containing the file.
+            file_id (str): The ID of the file to delete.
+        """
+        self._client._request("DELETE", f"/collections/{collection_id}/files/{file_id}", lane=BACKGROUND)
+        self._client._invalidate_collection(collection_id)
+        return None # Explicitly return None for 204 responses
 
-        # Use the _request method with files and data parameters
-        # The client's _request method handles multipart/form-data encoding
-        return self._client._request(
-            "POST",
-            f"/collections/{collection_id}/files",
-            files=files_payload,
-            data=data # Send folderId as form data part
+
+    def delete_files(
+        self,
+        collection_id: str,
+        file_ids: Sequence[str],
+        concurrency: int = DEFAULT_DELETE_CONCURRENCY,
+    ) -> List[DeleteResult]:
+        """
+        Deletes many files in parallel.
+
+        A failing delete does not stop the others; a file that is already gone
+        counts as deleted. The query cache is invalidated once for the batch.
+
+        Args:
+            collection_id (str): The ID of the collection containing the files.
+            file_ids (Sequence[str]): The IDs of the files to delete.
+            concurrency (int): Maximum number of requests in flight at once.
+
+        Returns:
+            List[DeleteResult]: One result per file ID, in input order.
+        """
+        check_concurrency(concurrency)
+        items = [PlannedDelete(FILE, file_id) for file_id in file_ids]
+        if not items:
+            return []
+        try:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as pool:
+                return delete_items(self._client, collection_id, items, pool)
+        finally:
+            self._client._invalidate_collection(collection_id)
+
+class AsyncFilesService:
+    """
+    Asyncio counterpart of FilesService, used by AsyncRagulaClient.
+    """
+    def __init__(self, client: 'AsyncRagulaClient'):
+        self._client = client
+
+    async def list_files(self, collection_id: str, folder_id: Optional[str] = None) -> "ListFilesResponse":
+        """
+        Lists files within a specific collection, optionally filtered by folder ID.
+
+        Args:
+            collection_id (str): The ID of the collection containing the files.
+            folder_id (Optional[str]): The ID of the folder to list files from.
+                                       If None, lists files at the root level.
+
+        Returns:
+            List[File]: A list of file objects.
+        """
+        params = {}
+        if folder_id:
+            params["folderId"] = folder_id
+        return await self._client._request(
+            "GET", f"/collections/{collection_id}/files", params=params, response_type="ListFilesResponse"
         )
 
+    def iter_files(
+        self,
+        collection_id: str,
+        folder_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> AsyncIterator["File"]:
+        """
+        Lazily iterates over the files of a collection (or folder), one page at a time.
 
-    def delete_file(self, collection_id: str, file_id: str) -> None:
+        Args:
+            collection_id (str): The ID of the collection containing the files.
+            folder_id (Optional[str]): The ID of the folder to list files from.
+            page_size (int): Files requested per page.
+            prefetch (bool): Fetch the next page in the background while the
+                             current one is consumed.
+
+        Returns:
+            AsyncIterator[File]: The files, in listing order.
+        """
+        params = {}
+        if folder_id:
+            params["folderId"] = folder_id
+        mode = item_mode(self._client.response_mode)
+
+        async def fetch(limit: int, offset: int) -> "ListFilesResponse":
+            return await self._client._request(
+                "GET", f"/collections/{collection_id}/files", params=page_params(params, limit, offset),
+                response_type="ListFilesResponse", response_mode=mode,
+            )
+
+        return aiter_pages(fetch, page_size, prefetch)
+
+    async def upload_file(
+        self,
+        collection_id: str,
+        file_path: Optional[str] = None,
+        file_content: Optional[Union[bytes, IO[bytes]]] = None,
+        file_name: Optional[str] = None,
+        folder_id: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> "UploadFileResponse":
+        """
+        Uploads a file to a specific collection, optionally placing it in a folder.
+        You must provide either file_path OR file_content (with file_name).
+
+        Args:
+            collection_id (str): The ID of the collection to upload the file to.
+            file_path (Optional[str]): The local path to the file to upload.
+            file_content (Optional[Union[bytes, IO[bytes]]]): The content of the file
+                                                              as bytes or a file-like object.
+            file_name (Optional[str]): The name to give the uploaded file. Required if using file_content.
+            folder_id (Optional[str]): The ID of the folder to place the uploaded file in.
+            progress_callback (Optional[Callable[[int, int], None]]): Called with
+                (bytes_sent, total_bytes) as the body is streamed.
+            chunk_size (int): Size of the read buffer used while streaming.
+
+        Returns:
+            File: The file object representing the uploaded file.
+
+        Raises:
+            ValueError: If required arguments are missing or conflicting.
+        """
+        with _build_upload_encoder(
+            file_path, file_content, file_name, folder_id, progress_callback, chunk_size
+        ) as encoder:
+            response = await self._client._request(
+                "POST",
+                f"/collections/{collection_id}/files",
+                data=encoder,
+                headers={"Content-Type": encoder.content_type},
+                lane=BACKGROUND,
+                timeout=self._client.timeouts.upload,
+                response_type="UploadFileResponse",
+            )
+        self._client._invalidate_collection(collection_id)
+        return response
+
+    async def delete_file(self, collection_id: str, file_id: str) -> None:
         """
         Deletes a specific file within a collection.
 
@@ -94,5 +326,27 @@ class FilesService:
             collection_id (str): The ID of the collection containing the file.
             file_id (str): The ID of the file to delete.
         """
-        self._client._request("DELETE", f"/collections/{collection_id}/files/{file_id}")
-        return None # Explicitly return None for 204 responses
\ No newline at end of file
+        await self._client._request("DELETE", f"/collections/{collection_id}/files/{file_id}", lane=BACKGROUND)
+        self._client._invalidate_collection(collection_id)
+        return None # Explicitly return None for 204 responses
+
+    async def delete_files(
+        self,
+        collection_id: str,
+        file_ids: Sequence[str],
+        concurrency: int = DEFAULT_DELETE_CONCURRENCY,
+    ) -> List[DeleteResult]:
+        """
+        Deletes many files concurrently. See FilesService.delete_files.
+
+        Returns:
+            List[DeleteResult]: One result per file ID, in input order.
+        """
+        import asyncio
+
+        check_concurrency(concurrency)
+        items = [PlannedDelete(FILE, file_id) for file_id in file_ids]
+        try:
+            return await delete_items_async(self._client, collection_id, items, asyncio.Semaphore(concurrency))
+        finally:
+            self._client._invalidate_collection(collection_id)
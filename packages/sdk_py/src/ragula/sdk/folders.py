@@ -1,8 +1,18 @@
-from typing import TYPE_CHECKING, List, Optional
-from .models import Folder, CreateFolderPayload, ListFoldersResponse, CreateFolderResponse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator, List, Optional, Tuple
+from .bulk import (
+    DEFAULT_DELETE_CONCURRENCY, DeletePlan, DeleteReport, build_plan, check_concurrency, execute_plan,
+    execute_plan_async,
+)
+from .models import Folder, CreateFolderPayload, ListFilesResponse, ListFoldersResponse, CreateFolderResponse
+from .pagination import DEFAULT_PAGE_SIZE, aiter_pages, item_mode, iter_pages, page_params
+from .ratelimit import BACKGROUND
+from .tree import DEFAULT_WALK_CONCURRENCY, TreeCache, WalkEntry, child_path, direct_children, item_field
 
 if TYPE_CHECKING:
     from .client import RagulaClient
+    from .async_client import AsyncRagulaClient
 
 class FoldersService:
     """
@@ -26,7 +36,42 @@ class FoldersService:
         params = {}
         if parent_id:
             params["parentId"] = parent_id
-        return self._client._request("GET", f"/collections/{collection_id}/folders", params=params)
+        return self._client._request(
+            "GET", f"/collections/{collection_id}/folders", params=params, response_type=ListFoldersResponse
+        )
+
+    def iter_folders(
+        self,
+        collection_id: str,
+        parent_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Iterator[Folder]:
+        """
+        Lazily iterates over the folders of a collection (or parent folder), one page at a time.
+
+        Args:
+            collection_id (str): The ID of the collection containing the folders.
+            parent_id (Optional[str]): The ID of the parent folder to list folders from.
+            page_size (int): Folders requested per page.
+            prefetch (bool): Fetch the next page in the background while the
+                             current one is consumed.
+
+        Returns:
+            Iterator[Folder]: The folders, in listing order.
+        """
+        params = {}
+        if parent_id:
+            params["parentId"] = parent_id
+        mode = item_mode(self._client.response_mode)
+
+        def fetch(limit: int, offset: int) -> ListFoldersResponse:
+            return self._client._request(
+                "GET", f"/collections/{collection_id}/folders", params=page_params(params, limit, offset),
+                response_type=ListFoldersResponse, response_mode=mode,
+            )
+
+        return iter_pages(fetch, page_size, prefetch)
 
     def create_folder(self, collection_id: str, payload: CreateFolderPayload) -> CreateFolderResponse:
         """
@@ -45,7 +90,12 @@ class FoldersService:
         # Use model_dump to serialize, handling optional fields and aliases.
         # parent_id=None will be correctly included as null in the JSON if set.
         json_payload = payload.model_dump(exclude_unset=True, by_alias=True)
-        return self._client._request("POST", f"/collections/{collection_id}/folders", json_data=json_payload)
+        folder = self._client._request(
+            "POST", f"/collections/{collection_id}/folders", json_data=json_payload, lane=BACKGROUND,
+            response_type=CreateFolderResponse,
+        )
+        self._client._invalidate_tree(collection_id)
+        return folder
 
     def delete_folder(self, collection_id: str, folder_id: str) -> None:
         """
@@ -55,5 +105,332 @@ class FoldersService:
             collection_id (str): The ID of the collection containing the folder.
             folder_id (str): The ID of the folder to delete.
         """
-        self._client._request("DELETE", f"/collections/{collection_id}/folders/{folder_id}")
-        return None # Explicitly return None for 204 responses
\ No newline at end of file
+        self._client._request("DELETE", f"/collections/{collection_id}/folders/{folder_id}", lane=BACKGROUND)
+        self._client._invalidate_collection(collection_id)
+        return None # Explicitly return None for 204 responses
+
+
+    def walk(
+        self,
+        collection_id: str,
+        folder_id: Optional[str] = None,
+        include_files: bool = True,
+        concurrency: int = DEFAULT_WALK_CONCURRENCY,
+        use_cache: bool = True,
+    ) -> Iterator[WalkEntry]:
+        """
+        Walks the folder tree top-down, like os.walk, one level at a time.
+
+        All folders of a level are listed in parallel from a bounded thread pool,
+        so a tree takes one round trip per level rather than one per folder.
+        When the client has a tree_cache, a complete walk is stored as a snapshot
+        and served from it until the collection is changed through this client.
+
+        Args:
+            collection_id (str): The ID of the collection to walk.
+            folder_id (Optional[str]): The folder to start from. Defaults to the root.
+            include_files (bool): Also list the files of every folder.
+            concurrency (int): Maximum number of listing requests in flight at once.
+            use_cache (bool): Read and fill the client's tree_cache, if it has one.
+
+        Returns:
+            Iterator[WalkEntry]: (path, folder_id, folders, files) for every folder, parents first.
+        """
+        if concurrency < 1:
+            raise ValueError("'concurrency' must be at least 1.")
+        cache = self._client.tree_cache if use_cache else None
+        if cache is not None:
+            snapshot = cache.get(collection_id, folder_id, include_files)
+            if snapshot is not None:
+                return iter(snapshot)
+        return self._walk(collection_id, folder_id, include_files, concurrency, cache)
+
+    def _walk(
+        self,
+        collection_id: str,
+        folder_id: Optional[str],
+        include_files: bool,
+        concurrency: int,
+        cache: Optional[TreeCache],
+    ) -> Iterator[WalkEntry]:
+        entries: List[WalkEntry] = []
+        level: List[Tuple[str, Optional[str]]] = [("", folder_id)]
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            while level:
+                listings = pool.map(lambda item: self._list_level(collection_id, item[1], include_files), level)
+                next_level = []
+                for (path, level_folder_id), (folders, files) in zip(level, listings):
+                    entries.append(WalkEntry(path, level_folder_id, folders, files))
+                    # The caller gets lists of its own, so changing them cannot alter the cached snapshot.
+                    yield WalkEntry(path, level_folder_id, list(folders), list(files))
+                    next_level.extend(
+                        (child_path(path, item_field(folder, "name", "name")), item_field(folder, "id", "id"))
+                        for folder in folders
+                    )
+                level = next_level
+        if cache is not None:
+            cache.set(collection_id, folder_id, include_files, entries)
+
+    def _list_level(
+        self, collection_id: str, folder_id: Optional[str], include_files: bool
+    ) -> Tuple[List[Any], List[Any]]:
+        """Lists the direct subfolders (and files) of one folder."""
+        mode = item_mode(self._client.response_mode)
+        params = {"parentId": folder_id} if folder_id else {}
+        folders = self._client._request(
+            "GET", f"/collections/{collection_id}/folders", params=params,
+            response_type=ListFoldersResponse, response_mode=mode,
+        )
+        files: List[Any] = []
+        if include_files:
+            params = {"folderId": folder_id} if folder_id else {}
+            files = self._client._request(
+                "GET", f"/collections/{collection_id}/files", params=params,
+                response_type=ListFilesResponse, response_mode=mode,
+            ) or []
+        return direct_children(folders, folder_id), direct_children(files, folder_id, "folderId", "folder_id")
+
+    def plan_delete(
+        self, collection_id: str, folder_id: str, concurrency: int = DEFAULT_WALK_CONCURRENCY
+    ) -> DeletePlan:
+        """
+        Lists everything a recursive delete of folder_id would remove, without deleting anything.
+
+        Args:
+            collection_id (str): The ID of the collection containing the folder.
+            folder_id (str): The ID of the folder to delete with all its contents.
+            concurrency (int): Maximum number of listing requests in flight at once.
+
+        Returns:
+            DeletePlan: The files, then the folders bottom-up, ending with folder_id.
+        """
+        entries = self.walk(collection_id, folder_id, concurrency=concurrency, use_cache=False)
+        return build_plan(collection_id, folder_id, entries)
+
+    def delete_folder_recursive(
+        self,
+        collection_id: str,
+        folder_id: str,
+        concurrency: int = DEFAULT_DELETE_CONCURRENCY,
+        dry_run: bool = False,
+        plan: Optional[DeletePlan] = None,
+    ) -> DeleteReport:
+        """
+        Deletes a folder with all its files and subfolders.
+
+        Files are deleted in parallel first, then folders level by level from the
+        deepest up. A folder whose contents could not all be deleted is skipped,
+        and the other items are still processed.
+
+        Args:
+            collection_id (str): The ID of the collection containing the folder.
+            folder_id (str): The ID of the folder to delete.
+            concurrency (int): Maximum number of requests in flight at once.
+            dry_run (bool): Only compute the plan; report.results stays empty.
+            plan (Optional[DeletePlan]): A plan from plan_delete() to execute,
+                e.g. after previewing it. Computed when omitted.
+
+        Returns:
+            DeleteReport: The plan and one DeleteResult per planned item.
+        """
+        check_concurrency(concurrency)
+        if plan is None:
+            plan = self.plan_delete(collection_id, folder_id, concurrency=concurrency)
+        if dry_run:
+            return DeleteReport(plan, dry_run=True)
+        return execute_plan(self._client, plan, concurrency)
+
+class AsyncFoldersService:
+    """
+    Asyncio counterpart of FoldersService, used by AsyncRagulaClient.
+    """
+    def __init__(self, client: 'AsyncRagulaClient'):
+        self._client = client
+
+    async def list_folders(self, collection_id: str, parent_id: Optional[str] = None) -> ListFoldersResponse:
+        """
+        Lists folders within a specific collection. Can be filtered by parent folder ID.
+
+        Args:
+            collection_id (str): The ID of the collection containing the folders.
+            parent_id (Optional[str]): The ID of the parent folder to list folders from.
+                                       If None, lists folders at the root level.
+
+        Returns:
+            List[Folder]: A list of folder objects.
+        """
+        params = {}
+        if parent_id:
+            params["parentId"] = parent_id
+        return await self._client._request(
+            "GET", f"/collections/{collection_id}/folders", params=params, response_type=ListFoldersResponse
+        )
+
+    def iter_folders(
+        self,
+        collection_id: str,
+        parent_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Folder]:
+        """
+        Lazily iterates over the folders of a collection (or parent folder), one page at a time.
+
+        Args:
+            collection_id (str): The ID of the collection containing the folders.
+            parent_id (Optional[str]): The ID of the parent folder to list folders from.
+            page_size (int): Folders requested per page.
+            prefetch (bool): Fetch the next page in the background while the
+                             current one is consumed.
+
+        Returns:
+            AsyncIterator[Folder]: The folders, in listing order.
+        """
+        params = {}
+        if parent_id:
+            params["parentId"] = parent_id
+        mode = item_mode(self._client.response_mode)
+
+        async def fetch(limit: int, offset: int) -> ListFoldersResponse:
+            return await self._client._request(
+                "GET", f"/collections/{collection_id}/folders", params=page_params(params, limit, offset),
+                response_type=ListFoldersResponse, response_mode=mode,
+            )
+
+        return aiter_pages(fetch, page_size, prefetch)
+
+    async def create_folder(self, collection_id: str, payload: CreateFolderPayload) -> CreateFolderResponse:
+        """
+        Creates a new folder within a collection.
+
+        Args:
+            collection_id (str): The ID of the collection where the folder will be created.
+            payload (CreateFolderPayload): The details for the new folder.
+
+        Returns:
+            Folder: The newly created folder object.
+        """
+        json_payload = payload.model_dump(exclude_unset=True, by_alias=True)
+        folder = await self._client._request(
+            "POST", f"/collections/{collection_id}/folders", json_data=json_payload, lane=BACKGROUND,
+            response_type=CreateFolderResponse,
+        )
+        self._client._invalidate_tree(collection_id)
+        return folder
+
+    async def delete_folder(self, collection_id: str, folder_id: str) -> None:
+        """
+        Deletes a specific folder within a collection.
+
+        Args:
+            collection_id (str): The ID of the collection containing the folder.
+            folder_id (str): The ID of the folder to delete.
+        """
+        await self._client._request("DELETE", f"/collections/{collection_id}/folders/{folder_id}", lane=BACKGROUND)
+        self._client._invalidate_collection(collection_id)
+        return None # Explicitly return None for 204 responses
+
+    def walk(
+        self,
+        collection_id: str,
+        folder_id: Optional[str] = None,
+        include_files: bool = True,
+        concurrency: int = DEFAULT_WALK_CONCURRENCY,
+        use_cache: bool = True,
+    ) -> AsyncIterator[WalkEntry]:
+        """
+        Walks the folder tree top-down, one level at a time, listing each level concurrently.
+        See FoldersService.walk.
+
+        Returns:
+            AsyncIterator[WalkEntry]: (path, folder_id, folders, files) for every folder, parents first.
+        """
+        if concurrency < 1:
+            raise ValueError("'concurrency' must be at least 1.")
+        cache = self._client.tree_cache if use_cache else None
+        return self._walk(collection_id, folder_id, include_files, concurrency, cache)
+
+    async def _walk(
+        self,
+        collection_id: str,
+        folder_id: Optional[str],
+        include_files: bool,
+        concurrency: int,
+        cache: Optional[TreeCache],
+    ) -> AsyncIterator[WalkEntry]:
+        if cache is not None:
+            snapshot = cache.get(collection_id, folder_id, include_files)
+            if snapshot is not None:
+                for entry in snapshot:
+                    yield entry
+                return
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def list_level(item: Tuple[str, Optional[str]]) -> Tuple[List[Any], List[Any]]:
+            async with semaphore:
+                return await self._list_level(collection_id, item[1], include_files)
+
+        entries: List[WalkEntry] = []
+        level: List[Tuple[str, Optional[str]]] = [("", folder_id)]
+        while level:
+            listings = await asyncio.gather(*(list_level(item) for item in level))
+            next_level = []
+            for (path, level_folder_id), (folders, files) in zip(level, listings):
+                entries.append(WalkEntry(path, level_folder_id, folders, files))
+                # The caller gets lists of its own, so changing them cannot alter the cached snapshot.
+                yield WalkEntry(path, level_folder_id, list(folders), list(files))
+                next_level.extend(
+                    (child_path(path, item_field(folder, "name", "name")), item_field(folder, "id", "id"))
+                    for folder in folders
+                )
+            level = next_level
+        if cache is not None:
+            cache.set(collection_id, folder_id, include_files, entries)
+
+    async def _list_level(
+        self, collection_id: str, folder_id: Optional[str], include_files: bool
+    ) -> Tuple[List[Any], List[Any]]:
+        """Lists the direct subfolders (and files) of one folder."""
+        mode = item_mode(self._client.response_mode)
+        params = {"parentId": folder_id} if folder_id else {}
+        folders = await self._client._request(
+            "GET", f"/collections/{collection_id}/folders", params=params,
+            response_type=ListFoldersResponse, response_mode=mode,
+        )
+        files: List[Any] = []
+        if include_files:
+            params = {"folderId": folder_id} if folder_id else {}
+            files = await self._client._request(
+                "GET", f"/collections/{collection_id}/files", params=params,
+                response_type=ListFilesResponse, response_mode=mode,
+            ) or []
+        return direct_children(folders, folder_id), direct_children(files, folder_id, "folderId", "folder_id")
+
+    async def plan_delete(
+        self, collection_id: str, folder_id: str, concurrency: int = DEFAULT_WALK_CONCURRENCY
+    ) -> DeletePlan:
+        """
+        Lists everything a recursive delete of folder_id would remove. See FoldersService.plan_delete.
+        """
+        entries = [
+            entry async for entry in self.walk(collection_id, folder_id, concurrency=concurrency, use_cache=False)
+        ]
+        return build_plan(collection_id, folder_id, entries)
+
+    async def delete_folder_recursive(
+        self,
+        collection_id: str,
+        folder_id: str,
+        concurrency: int = DEFAULT_DELETE_CONCURRENCY,
+        dry_run: bool = False,
+        plan: Optional[DeletePlan] = None,
+    ) -> DeleteReport:
+        """
+        Deletes a folder with all its files and subfolders. See FoldersService.delete_folder_recursive.
+        """
+        check_concurrency(concurrency)
+        if plan is None:
+            plan = await self.plan_delete(collection_id, folder_id, concurrency=concurrency)
+        if dry_run:
+            return DeleteReport(plan, dry_run=True)
+        return await execute_plan_async(self._client, plan, concurrency)
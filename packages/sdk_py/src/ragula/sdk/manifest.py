@@ -0,0 +1,181 @@
+"""
+Local manifest used by incremental directory syncs.
+
+The manifest maps each synced path to its size, mtime, content hash and remote
+file ID. Every change is committed to a SQLite file as soon as it happens, so a
+sync interrupted midway resumes from where it stopped.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: str) -> str:
+    """Returns the SHA-256 hex digest of a file, read in fixed-size chunks."""
+    digest = hashlib.sha256()
+    buffer = bytearray(_HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(path, "rb") as f:
+        while True:
+            read = f.readinto(buffer)
+            if not read:
+                break
+            digest.update(view[:read])
+    return digest.hexdigest()
+
+
+@dataclass
+class ManifestEntry:
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+    file_id: str
+
+
+class SyncManifest:
+    """
+    SQLite-backed record of what a directory sync has uploaded to one collection.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        collection_id: str,
+        local_path: Optional[str] = None,
+        parent_folder_id: Optional[str] = None,
+    ):
+        """
+        Args:
+            path: Location of the manifest file. Created if missing.
+            collection_id: The collection this manifest tracks.
+            local_path: The directory synced with this manifest. If given, it and
+                parent_folder_id (None for the collection root) must match the ones
+                the manifest was first used with.
+            parent_folder_id: The remote folder local_path is mirrored into.
+
+        Raises:
+            ValueError: If the manifest file already tracks a different collection,
+                directory or parent folder.
+        """
+        self.path = path
+        self.collection_id = collection_id
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " path TEXT PRIMARY KEY,"
+            " size INTEGER NOT NULL,"
+            " mtime_ns INTEGER NOT NULL,"
+            " sha256 TEXT NOT NULL,"
+            " file_id TEXT NOT NULL)"
+        )
+        # Remote files superseded by a newer upload but not yet deleted.
+        self._conn.execute("CREATE TABLE IF NOT EXISTS pending_deletes (file_id TEXT PRIMARY KEY)")
+        # Uploads started but not yet recorded; their remote copies may be untracked.
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pending_uploads (path TEXT PRIMARY KEY, folder_id TEXT NOT NULL)"
+        )
+        self._bind("collection_id", collection_id, "collection")
+        if local_path is not None:
+            # Paths missing here would otherwise look deleted, and be deleted remotely.
+            self._bind("local_path", os.path.realpath(local_path), "directory")
+            self._bind("parent_folder_id", parent_folder_id or "", "parent folder")
+
+    def _bind(self, key: str, value: str, label: str) -> None:
+        """Stores a meta value on first use; afterwards it must stay the same."""
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self._conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (key, value))
+        elif row[0] != value:
+            self._conn.close()
+            raise ValueError(f"Manifest '{self.path}' tracks {label} '{row[0]}', not '{value}'.")
+
+    def get(self, path: str) -> Optional[ManifestEntry]:
+        """Returns the entry for a relative path, or None if it was never synced."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT path, size, mtime_ns, sha256, file_id FROM files WHERE path = ?", (path,)
+            ).fetchone()
+        return ManifestEntry(*row) if row else None
+
+    def paths(self) -> List[str]:
+        """Returns every relative path recorded in the manifest."""
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT path FROM files")]
+
+    def record(self, entry: ManifestEntry, replaced_file_id: Optional[str] = None) -> None:
+        """
+        Stores an uploaded file and clears its pending upload. If it replaces an
+        older remote file, that file is queued for deletion in the same transaction.
+        """
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO files (path, size, mtime_ns, sha256, file_id) VALUES (?, ?, ?, ?, ?)",
+                    (entry.path, entry.size, entry.mtime_ns, entry.sha256, entry.file_id),
+                )
+                self._conn.execute("DELETE FROM pending_uploads WHERE path = ?", (entry.path,))
+                if replaced_file_id is not None and replaced_file_id != entry.file_id:
+                    self._conn.execute(
+                        "INSERT OR IGNORE INTO pending_deletes (file_id) VALUES (?)", (replaced_file_id,)
+                    )
+
+    def touch(self, path: str, size: int, mtime_ns: int) -> None:
+        """Updates the stat of an entry whose content hash did not change."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?", (size, mtime_ns, path)
+            )
+
+    def remove(self, path: str) -> None:
+        """Forgets a path after its remote file was deleted."""
+        with self._lock:
+            self._conn.execute("DELETE FROM files WHERE path = ?", (path,))
+
+    def pending_deletes(self) -> List[str]:
+        """Returns remote file IDs that were superseded but not yet deleted."""
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT file_id FROM pending_deletes")]
+
+    def clear_pending_delete(self, file_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM pending_deletes WHERE file_id = ?", (file_id,))
+
+    def begin_upload(self, path: str, folder_id: Optional[str]) -> None:
+        """Notes an upload about to start, so a run interrupted before record() can find its remote copy."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pending_uploads (path, folder_id) VALUES (?, ?)", (path, folder_id or "")
+            )
+
+    def pending_uploads(self) -> List[Tuple[str, Optional[str]]]:
+        """Returns (path, folder ID) of uploads that were started but never recorded."""
+        with self._lock:
+            rows = self._conn.execute("SELECT path, folder_id FROM pending_uploads").fetchall()
+        return [(path, folder_id or None) for path, folder_id in rows]
+
+    def clear_pending_upload(self, path: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM pending_uploads WHERE path = ?", (path,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "SyncManifest":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
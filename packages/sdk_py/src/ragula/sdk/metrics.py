@@ -0,0 +1,346 @@
+"""
+Request instrumentation for the Ragula clients.
+
+Clients call their hooks before and after every API call (once per call, not
+per retry attempt) with a RequestEvent describing it: endpoint template,
+service, status, attempts, latency, bytes on the wire and decode time.
+
+Two hooks ship with the SDK: MetricsCollector keeps in-memory latency
+histograms, and OpenTelemetryHook emits a span per call when the
+opentelemetry-api package is installed (and does nothing otherwise).
+"""
+
+import bisect
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# opentelemetry is imported by the first OpenTelemetryHook rather than with the
+# clients; None once the import failed.
+_NOT_LOADED: Any = object()
+otel_trace: Any = _NOT_LOADED
+
+logger = logging.getLogger(__name__)
+
+# Path segments followed by a resource ID.
+_ID_PARENTS = frozenset({"collections", "folders", "files"})
+_ACTIONS = frozenset({"query", "question", "status", "folders", "files"})
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(endpoint: str) -> str:
+    """
+    Replaces resource IDs in an endpoint path, e.g. "/collections/abc/query"
+    becomes "/collections/{id}/query", so calls aggregate per operation.
+    """
+    segments = endpoint.split("/")
+    for i in range(1, len(segments)):
+        if segments[i - 1] in _ID_PARENTS and segments[i] and segments[i] not in _ACTIONS:
+            segments[i] = "{id}"
+    return "/".join(segments)
+
+
+@lru_cache(maxsize=256)
+def service_for(template: str) -> str:
+    """Names the SDK service an endpoint template belongs to: collections, folders, files or query."""
+    last = template.rstrip("/").rpartition("/")[2]
+    if last in ("query", "question"):
+        return "query"
+    if "/files" in template:
+        return "files"
+    if "/folders" in template:
+        return "folders"
+    return "collections"
+
+
+@dataclass
+class RequestEvent:
+    """
+    One API call as seen by the hooks.
+
+    Fields after lane are filled in as the call progresses; after_request sees
+    the final values.
+
+    Attributes:
+        method: HTTP method.
+        endpoint: Endpoint template, e.g. "/collections/{id}/query".
+        path: The concrete endpoint path.
+        service: collections, folders, files or query.
+        lane: Governor lane of the call.
+        status_code: Final HTTP status, or None if no response was received.
+        attempts: Attempts made, including retries.
+        duration: Seconds from the first attempt to the decoded result or error.
+        bytes_sent: Request body size of the last attempt, from its Content-Length.
+        bytes_received: Response body size of the last attempt (its Content-Length when streamed).
+        decode_time: Seconds spent decoding the response body.
+        error: The exception raised to the caller, if any.
+        state: Scratch space for hooks to carry data from before_request to after_request.
+    """
+    method: str
+    endpoint: str
+    path: str
+    service: str
+    lane: str
+    status_code: Optional[int] = None
+    attempts: int = 0
+    duration: float = 0.0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    decode_time: float = 0.0
+    error: Optional[BaseException] = None
+    state: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def status(self) -> str:
+        """The status tag: the HTTP status code, or "error" for transport failures."""
+        return str(self.status_code) if self.status_code is not None else "error"
+
+
+class RequestHook:
+    """Base class for request hooks. Override either method; both are no-ops by default."""
+
+    def before_request(self, event: RequestEvent) -> None:
+        pass
+
+    def after_request(self, event: RequestEvent) -> None:
+        pass
+
+
+class CallbackHook(RequestHook):
+    """Adapts plain before/after callables to a RequestHook."""
+
+    def __init__(
+        self,
+        before: Optional[Callable[[RequestEvent], None]] = None,
+        after: Optional[Callable[[RequestEvent], None]] = None,
+    ):
+        self._before = before
+        self._after = after
+
+    def before_request(self, event: RequestEvent) -> None:
+        if self._before is not None:
+            self._before(event)
+
+    def after_request(self, event: RequestEvent) -> None:
+        if self._after is not None:
+            self._after(event)
+
+
+def start_event(method: str, endpoint: str, lane: str, hooks: Sequence[RequestHook]) -> RequestEvent:
+    """Creates the event for a call and runs the before_request hooks."""
+    template = endpoint_template(endpoint)
+    event = RequestEvent(method, template, endpoint, service_for(template), lane)
+    for hook in hooks:
+        try:
+            hook.before_request(event)
+        except Exception:
+            logger.exception("Ragula request hook %r failed in before_request", hook)
+    return event
+
+
+def finish_event(event: RequestEvent, started: float, hooks: Sequence[RequestHook]) -> None:
+    """Completes the event and runs the after_request hooks. Hook failures never reach the caller."""
+    event.duration = time.perf_counter() - started
+    for hook in hooks:
+        try:
+            hook.after_request(event)
+        except Exception:
+            logger.exception("Ragula request hook %r failed in after_request", hook)
+
+
+def record_response(event: RequestEvent, response: Any, streamed: bool = False) -> None:
+    """
+    Records an attempt's status and payload sizes (requests or httpx response) on the event.
+    The body of a streamed response is never read here: its size is taken from Content-Length.
+    """
+    event.status_code = response.status_code
+    try:
+        request_headers = response.request.headers
+    except (AttributeError, RuntimeError): # No request attached, e.g. a hand-built response
+        request_headers = {}
+    try:
+        event.bytes_sent = int(request_headers.get("Content-Length") or 0)
+    except (TypeError, ValueError):
+        event.bytes_sent = 0
+    if not streamed:
+        event.bytes_received = len(response.content or b"")
+        return
+    try:
+        event.bytes_received = int(response.headers.get("Content-Length") or 0)
+    except (TypeError, ValueError):
+        event.bytes_received = 0
+
+
+# Latency bucket upper bounds, in seconds.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Histogram:
+    """A fixed-bucket histogram of observed values, with approximate percentiles."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1) # The last bucket catches everything above
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimates the q-th percentile (0-100) by interpolating inside its bucket,
+        clamped to the observed min and max.
+        """
+        if not 0 <= q <= 100:
+            raise ValueError("'q' must be between 0 and 100.")
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.max
+                value = lower + (upper - lower) * (rank - seen) / bucket_count
+                return min(self.max, max(self.min, value))
+            seen += bucket_count
+        return self.max
+
+
+MetricKey = Tuple[str, str, str] # (service, endpoint template, status)
+
+
+@dataclass
+class EndpointStats:
+    """Aggregated calls for one (service, endpoint, status) key."""
+    latency: Histogram
+    decode_time: float = 0.0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    retries: int = 0
+
+
+class MetricsCollector(RequestHook):
+    """
+    Collects in-memory latency histograms and byte counters per service,
+    endpoint template and status. Thread-safe; one collector can be shared by
+    several clients.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._stats: Dict[MetricKey, EndpointStats] = {}
+
+    def after_request(self, event: RequestEvent) -> None:
+        key = (event.service, event.endpoint, event.status)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = EndpointStats(Histogram(self._buckets))
+            stats.latency.observe(event.duration)
+            stats.decode_time += event.decode_time
+            stats.bytes_sent += event.bytes_sent
+            stats.bytes_received += event.bytes_received
+            stats.retries += max(0, event.attempts - 1)
+
+    def keys(self) -> List[MetricKey]:
+        with self._lock:
+            return sorted(self._stats)
+
+    def stats(self, service: str, endpoint: str, status: str) -> Optional[EndpointStats]:
+        """The live stats for a key, or None if no such call was recorded."""
+        with self._lock:
+            return self._stats.get((service, endpoint, status))
+
+    def percentile(self, q: float, service: Optional[str] = None, endpoint: Optional[str] = None) -> float:
+        """Estimated latency percentile across all statuses of the matching keys."""
+        merged = Histogram(self._buckets)
+        with self._lock:
+            for (key_service, key_endpoint, _), stats in self._stats.items():
+                if service not in (None, key_service) or endpoint not in (None, key_endpoint):
+                    continue
+                latency = stats.latency
+                merged.counts = [a + b for a, b in zip(merged.counts, latency.counts)]
+                merged.count += latency.count
+                merged.sum += latency.sum
+                merged.min = min(merged.min, latency.min)
+                merged.max = max(merged.max, latency.max)
+        return merged.percentile(q)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+def _load_otel_trace() -> Any:
+    global otel_trace
+    if otel_trace is _NOT_LOADED:
+        try:
+            from opentelemetry import trace as otel_trace
+        except ImportError: # pragma: no cover - depends on the environment
+            otel_trace = None
+    return otel_trace
+
+
+class OpenTelemetryHook(RequestHook):
+    """
+    Emits one OpenTelemetry client span per API call. When opentelemetry-api
+    is not installed the hook does nothing.
+    """
+
+    def __init__(self, tracer: Optional[Any] = None, tracer_name: str = "ragula.sdk"):
+        """
+        Args:
+            tracer: Tracer to use. Defaults to the global provider's tracer.
+            tracer_name: Instrumentation name used for the default tracer.
+        """
+        self._otel = _load_otel_trace()
+        if tracer is None and self._otel is not None:
+            tracer = self._otel.get_tracer(tracer_name)
+        self._tracer = tracer
+
+    @property
+    def enabled(self) -> bool:
+        return self._tracer is not None
+
+    def before_request(self, event: RequestEvent) -> None:
+        if self._tracer is None:
+            return
+        kind = self._otel.SpanKind.CLIENT if self._otel is not None else None
+        span = self._tracer.start_span(f"{event.method} {event.endpoint}", kind=kind)
+        span.set_attribute("http.request.method", event.method)
+        span.set_attribute("url.template", event.endpoint)
+        span.set_attribute("ragula.service", event.service)
+        span.set_attribute("ragula.lane", event.lane)
+        event.state["otel_span"] = span
+
+    def after_request(self, event: RequestEvent) -> None:
+        span = event.state.pop("otel_span", None)
+        if span is None:
+            return
+        if event.status_code is not None:
+            span.set_attribute("http.response.status_code", event.status_code)
+        span.set_attribute("ragula.attempts", event.attempts)
+        span.set_attribute("ragula.bytes_sent", event.bytes_sent)
+        span.set_attribute("ragula.bytes_received", event.bytes_received)
+        span.set_attribute("ragula.decode_time", event.decode_time)
+        if event.error is not None:
+            span.record_exception(event.error)
+            if self._otel is not None:
+                span.set_status(self._otel.Status(self._otel.StatusCode.ERROR, str(event.error)))
+        span.end()
@@ -49,6 +49,10 @@ class QueryResultItem(BaseModel):
 class QueryResponse(BaseModel):
     results: List[QueryResultItem]
 
+class AskQuestionResponse(BaseModel):
+    answer: Optional[str] = None
+    results: List[QueryResultItem] = []
+
 # Payload Models for Requests
 
 class CreateCollectionPayload(BaseModel):
@@ -72,11 +76,13 @@ class CreateFolderPayload(BaseModel):
 class SimpleQueryPayload(BaseModel):
     query: str
 
-# Full Query Payload (defined for completeness, might be used internally)
+# Full Query Payload, sent when query options are given
 class QueryPayload(BaseModel):
     query: str
     top_k: Optional[int] = Field(default=None, alias="topK")
     filter: Optional[QueryFilter] = None
+    # False asks the server to omit contentSnippet from the results
+    include_snippets: Optional[bool] = Field(default=None, alias="includeSnippets")
 
 # Response Type Aliases (for clarity in function signatures)
 ListCollectionsResponse = List[Collection]
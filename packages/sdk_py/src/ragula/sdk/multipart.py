@@ -0,0 +1,238 @@
+"""
+Streaming multipart/form-data encoder for file uploads.
+
+The encoder exposes the request body as a file-like object of known length, so
+requests (and httpx, via async iteration) send it with an exact Content-Length
+while only ever holding one chunk of the file in memory.
+"""
+
+import io
+import mimetypes
+import os
+import uuid
+from typing import Any, AsyncIterator, Callable, Dict, IO, Iterator, Optional, Union
+
+# Size of the reused read buffer, and of each chunk handed to the transport.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+ProgressCallback = Callable[[int, int], None]
+
+
+def _quote(value: str) -> str:
+    """Escapes a Content-Disposition parameter value (HTML5 form encoding)."""
+    return value.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+class MultipartEncoder:
+    """
+    A multipart/form-data body made of plain text fields and one streamed file.
+
+    Use it as a context manager so the file is closed deterministically. read()
+    fills a single reused buffer with readinto(), so peak memory is bounded by
+    chunk_size regardless of the file size.
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, str],
+        file_field: str,
+        file_name: str,
+        fileobj: IO[bytes],
+        file_size: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        close_file: bool = False,
+    ):
+        """
+        Args:
+            fields: Form fields sent before the file part.
+            file_field: Name of the file form field.
+            file_name: File name reported to the server.
+            fileobj: Binary file object positioned at the start of the content.
+            file_size: Number of bytes to read from fileobj.
+            chunk_size: Size of the reused read buffer.
+            progress_callback: Called as progress_callback(bytes_sent, total_bytes)
+                after each chunk is produced.
+            close_file: Whether close() should also close fileobj.
+        """
+        if chunk_size < 1:
+            raise ValueError("'chunk_size' must be at least 1.")
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self._fileobj = fileobj
+        self._file_size = file_size
+        self._close_file = close_file
+        self._progress_callback = progress_callback
+        self._buffer = bytearray(chunk_size)
+        self._view = memoryview(self._buffer)
+        try:
+            self._file_start = fileobj.tell()
+        except (AttributeError, OSError):
+            self._file_start = None
+
+        head = io.BytesIO()
+        for name, value in fields.items():
+            head.write(f"--{self.boundary}\r\n".encode())
+            head.write(f'Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'.encode())
+            head.write(str(value).encode("utf-8"))
+            head.write(b"\r\n")
+        file_type = mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+        head.write(f"--{self.boundary}\r\n".encode())
+        head.write(
+            f'Content-Disposition: form-data; name="{_quote(file_field)}"; '
+            f'filename="{_quote(file_name)}"\r\n'.encode("utf-8")
+        )
+        head.write(f"Content-Type: {file_type}\r\n\r\n".encode())
+        self._head = head.getvalue()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+        self._length = len(self._head) + file_size + len(self._tail)
+        self._reset_state()
+
+    @classmethod
+    def from_path(
+        cls,
+        file_path: str,
+        fields: Optional[Dict[str, str]] = None,
+        file_field: str = "file",
+        file_name: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "MultipartEncoder":
+        """Opens file_path and returns an encoder that owns (and will close) the handle."""
+        fileobj = open(file_path, "rb")
+        try:
+            size = os.fstat(fileobj.fileno()).st_size
+            return cls(
+                fields or {},
+                file_field,
+                file_name or os.path.basename(file_path),
+                fileobj,
+                size,
+                close_file=True,
+                **kwargs,
+            )
+        except BaseException:
+            fileobj.close()
+            raise
+
+    @classmethod
+    def from_content(
+        cls,
+        content: Union[bytes, IO[bytes]],
+        file_name: str,
+        fields: Optional[Dict[str, str]] = None,
+        file_field: str = "file",
+        **kwargs: Any,
+    ) -> "MultipartEncoder":
+        """
+        Wraps in-memory bytes or a caller-owned file object.
+
+        Seekable file objects are streamed from their current position. Streams that
+        cannot seek have no knowable length, so they are read into memory first.
+        """
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            fileobj: IO[bytes] = io.BytesIO(content)
+            size = len(content)
+        else:
+            fileobj = content
+            try:
+                start = fileobj.tell()
+                size = fileobj.seek(0, os.SEEK_END) - start
+                fileobj.seek(start)
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                data = fileobj.read()
+                fileobj = io.BytesIO(data)
+                size = len(data)
+        return cls(fields or {}, file_field, file_name, fileobj, size, **kwargs)
+
+    def _reset_state(self) -> None:
+        self._stage = 0  # 0: head, 1: file, 2: tail, 3: done
+        self._offset = 0
+        self._file_remaining = self._file_size
+        self.bytes_sent = 0
+
+    def reset(self) -> None:
+        """
+        Rewinds the body so it can be sent again (e.g. on retry).
+
+        Raises:
+            io.UnsupportedOperation: If the underlying file object cannot seek.
+        """
+        if self._file_start is None:
+            raise io.UnsupportedOperation("The file object cannot be rewound.")
+        self._fileobj.seek(self._file_start)
+        self._reset_state()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _next_chunk(self, size: int) -> bytes:
+        """Returns up to size bytes from the current stage, or b"" at the end."""
+        while self._stage < 3:
+            if self._stage == 1:
+                if self._file_remaining <= 0:
+                    self._stage = 2
+                    continue
+                want = min(size, len(self._buffer), self._file_remaining)
+                readinto = getattr(self._fileobj, "readinto", None)
+                if readinto is not None:
+                    read = readinto(self._view[:want])
+                    chunk = bytes(self._view[:read]) if read else b""
+                else:
+                    chunk = self._fileobj.read(want)
+                if not chunk:
+                    raise IOError(
+                        f"File ended {self._file_remaining} bytes before its announced size."
+                    )
+                self._file_remaining -= len(chunk)
+                return chunk
+            part = self._head if self._stage == 0 else self._tail
+            if self._offset >= len(part):
+                self._stage += 1
+                self._offset = 0
+                continue
+            chunk = part[self._offset : self._offset + size]
+            self._offset += len(chunk)
+            return chunk
+        return b""
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Reads up to size bytes of the encoded body (one buffer's worth when size < 0).
+        """
+        if size is None or size < 0:
+            size = len(self._buffer)
+        chunk = self._next_chunk(size)
+        if chunk:
+            self.bytes_sent += len(chunk)
+            if self._progress_callback is not None:
+                self._progress_callback(self.bytes_sent, self._length)
+        return chunk
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read()
+            if not chunk:
+                return
+            yield chunk
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        while True:
+            # Disk reads run in the default executor so they never block the event loop.
+            chunk = await loop.run_in_executor(None, self.read)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self) -> None:
+        """Closes the file if the encoder owns it."""
+        if self._close_file:
+            self._fileobj.close()
+
+    def __enter__(self) -> "MultipartEncoder":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,139 @@
+"""
+Lazy, page-by-page iteration over the list endpoints.
+
+Pages are requested with "limit" / "offset" query parameters and decoded one at
+a time, so memory stays bounded by the page size and the first items are
+available after the first page. While the caller consumes a page, the next one
+is fetched in the background.
+
+Servers that do not paginate answer with the full list; this is detected (a
+page longer than the limit, or a second page repeating the first) and the
+items are yielded without further requests.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional
+
+from .parsing import JSON_MODE, RAW_MODE
+
+if TYPE_CHECKING:
+    import asyncio
+
+DEFAULT_PAGE_SIZE = 100
+
+# Fetches the page starting at offset: (limit, offset) -> items
+PageFetcher = Callable[[int, int], List[Any]]
+AsyncPageFetcher = Callable[[int, int], Awaitable[List[Any]]]
+
+
+def check_page_size(page_size: int) -> None:
+    if page_size < 1:
+        raise ValueError("'page_size' must be at least 1.")
+
+
+def page_params(params: Dict[str, Any], limit: int, offset: int) -> Dict[str, Any]:
+    """Returns a copy of params with the pagination parameters added."""
+    paged = dict(params)
+    paged["limit"] = limit
+    paged["offset"] = offset
+    return paged
+
+
+def item_mode(client_mode: str) -> Optional[str]:
+    """Raw bodies cannot be split into items, so raw-mode clients iterate plain JSON values."""
+    return JSON_MODE if client_mode == RAW_MODE else None
+
+
+def _is_last(page: List[Any], page_size: int) -> bool:
+    # A short page ends the listing; an oversized one means the server ignored "limit".
+    return len(page) != page_size
+
+
+def _repeats_first(page: List[Any], first: List[Any]) -> bool:
+    # A server ignoring "offset" returns the first page again.
+    return bool(page) and bool(first) and page[0] == first[0]
+
+
+def iter_pages(fetch: PageFetcher, page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = True) -> Iterator[Any]:
+    """
+    Yields the items of every page in order.
+
+    Args:
+        fetch: Callable returning the items of one page.
+        page_size: Items requested per page.
+        prefetch: Fetch the next page on a background thread while the current
+                  one is being consumed.
+    """
+    check_page_size(page_size)
+    return _iter_pages(fetch, page_size, prefetch)
+
+
+def _iter_pages(fetch: PageFetcher, page_size: int, prefetch: bool) -> Iterator[Any]:
+    first: List[Any] = []
+    if not prefetch:
+        offset = 0
+        while True:
+            page = fetch(page_size, offset) or []
+            if offset == 0:
+                first = page
+            elif _repeats_first(page, first):
+                return
+            yield from page
+            if _is_last(page, page_size):
+                return
+            offset += page_size
+
+    pool = ThreadPoolExecutor(max_workers=1)
+    pending: Optional[Future] = pool.submit(fetch, page_size, 0)
+    try:
+        offset = 0
+        while pending is not None:
+            page = pending.result() or []
+            if offset == 0:
+                first = page
+            elif _repeats_first(page, first):
+                return
+            offset += page_size
+            pending = None if _is_last(page, page_size) else pool.submit(fetch, page_size, offset)
+            yield from page
+    finally:
+        # Runs when the listing is exhausted or the caller stops early (generator close).
+        if pending is not None:
+            pending.cancel()
+        pool.shutdown(wait=False)
+
+
+def aiter_pages(
+    fetch: AsyncPageFetcher, page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = True
+) -> AsyncIterator[Any]:
+    """Asyncio counterpart of iter_pages; prefetching runs as a task on the current loop."""
+    check_page_size(page_size)
+    return _aiter_pages(fetch, page_size, prefetch)
+
+
+async def _aiter_pages(fetch: AsyncPageFetcher, page_size: int, prefetch: bool) -> AsyncIterator[Any]:
+    import asyncio
+
+    offset = 0
+    pending: Optional["asyncio.Task[List[Any]]"] = None
+    try:
+        page = first = await fetch(page_size, offset) or []
+        while True:
+            if offset and _repeats_first(page, first):
+                return
+            last = _is_last(page, page_size)
+            if not last and prefetch:
+                pending = asyncio.ensure_future(fetch(page_size, offset + page_size))
+            for item in page:
+                yield item
+            if last:
+                return
+            offset += page_size
+            if pending is not None:
+                task, pending = pending, None
+                page = await task or []
+            else:
+                page = await fetch(page_size, offset) or []
+    finally:
+        if pending is not None:
+            pending.cancel()
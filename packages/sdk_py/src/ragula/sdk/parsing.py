@@ -0,0 +1,121 @@
+"""
+Response decoding for the Ragula clients.
+
+Clients decode successful bodies according to their response_mode:
+
+* "json"  - plain dicts and lists (the default).
+* "model" - pydantic models from models.py, validated straight from the raw
+            bytes by a TypeAdapter that is built once per response type.
+* "raw"   - the undecoded body bytes, for proxies that forward the payload.
+
+JSON bodies are encoded and decoded with orjson when it is installed
+(pip install ragula-sdk[fast]), and with the standard library otherwise.
+
+pydantic is only imported once model mode (or a model) is actually used.
+"""
+
+import json
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError: # pragma: no cover - depends on the environment
+    orjson = None
+
+JSON_MODE = "json"
+MODEL_MODE = "model"
+RAW_MODE = "raw"
+RESPONSE_MODES = (JSON_MODE, MODEL_MODE, RAW_MODE)
+
+
+def check_response_mode(mode: str) -> str:
+    if mode not in RESPONSE_MODES:
+        raise ValueError(f"'response_mode' must be one of {RESPONSE_MODES}, not {mode!r}.")
+    return mode
+
+
+def fast_json_backend() -> str:
+    """Names the JSON library in use: "orjson" or "json"."""
+    return "orjson" if orjson is not None else "json"
+
+
+def dumps_json(value: Any) -> bytes:
+    """Encodes a request body as compact UTF-8 JSON."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            pass # e.g. non-str keys or integers beyond 64 bits; the standard library handles these
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads_json(content: Any) -> Any:
+    """
+    Decodes JSON from bytes or str.
+
+    Raises:
+        ValueError: If content is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def is_model(value: Any) -> bool:
+    """Whether value is a pydantic model, without importing pydantic to find out."""
+    pydantic = sys.modules.get("pydantic")
+    return pydantic is not None and isinstance(value, pydantic.BaseModel)
+
+
+@lru_cache(maxsize=None)
+def type_adapter(response_type: Any) -> "TypeAdapter":
+    """
+    Returns the (cached) TypeAdapter for a response type such as List[File].
+    A string names a model in models.py, so callers need not import the models.
+    """
+    from pydantic import TypeAdapter
+
+    if isinstance(response_type, str):
+        from . import models
+        response_type = getattr(models, response_type)
+    return TypeAdapter(response_type)
+
+
+def decode_body(content: bytes, mode: str, response_type: Optional[Any] = None) -> Any:
+    """
+    Decodes a successful response body.
+
+    Raises:
+        ValidationError: In model mode, if the body does not match response_type.
+    """
+    if mode == RAW_MODE:
+        return content
+    if mode == MODEL_MODE and response_type is not None:
+        return type_adapter(response_type).validate_json(content)
+    try:
+        return loads_json(content)
+    except ValueError:
+        # A 2xx response with an empty or non-JSON body
+        return content.decode("utf-8", errors="replace")
+
+
+def to_json_value(value: Any) -> Any:
+    """
+    Converts a service result in any response mode back to plain JSON values.
+
+    Used by SDK helpers (e.g. directory sync) that read fields from responses
+    regardless of how the client is configured.
+    """
+    if is_model(value):
+        return value.model_dump(mode="json", by_alias=True)
+    if isinstance(value, list):
+        return [to_json_value(item) for item in value]
+    if isinstance(value, (bytes, bytearray)):
+        return loads_json(value) if value else None
+    return value
+
@@ -1,9 +1,85 @@
-from typing import TYPE_CHECKING, Optional
-# Import QueryResponse directly, QueryCollectionResponse is an alias in models.py
-from .models import QueryResponse, SimpleQueryPayload, QueryCollectionResponse
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
+from .client import RagulaError
+from .federated import (
+    DEFAULT_FEDERATED_TOP_K, DEFAULT_RRF_K, RRF, FederatedResponse, check_fusion, deadline_error, fuse
+)
+from .parsing import RAW_MODE, is_model
+from .streaming import STREAM_HEADERS, AnswerStream, AsyncAnswerStream
+from .transport import TimeoutPair, clamp_timeout
 
+# asyncio and the models are imported where needed so a plain query does not load
+# them; response types are passed by model name and only resolved in model mode.
 if TYPE_CHECKING:
     from .client import RagulaClient
+    from .async_client import AsyncRagulaClient
+    # Import QueryResponse directly, QueryCollectionResponse is an alias in models.py
+    from .models import AskQuestionResponse, QueryResponse, QueryCollectionResponse
+
+# Default number of queries dispatched in parallel by the batch methods.
+DEFAULT_QUERY_CONCURRENCY = 8
+
+QueryBatchResult = Union["QueryCollectionResponse", RagulaError]
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError("'concurrency' must be at least 1.")
+
+
+def build_query_payload(
+    query: str,
+    top_k: Optional[int] = None,
+    folder_ids: Optional[Sequence[str]] = None,
+    file_types: Optional[Sequence[str]] = None,
+    include_snippets: bool = True,
+) -> Dict[str, Any]:
+    """
+    Builds the JSON body for the query endpoints.
+
+    Unset options are left out, so a plain query still sends { "query": query }
+    and shares cache entries with earlier SDK versions.
+    """
+    if top_k is None and not folder_ids and not file_types and include_snippets and isinstance(query, str):
+        # The common case needs no validation; skipping the model keeps it off the hot path.
+        return {"query": query}
+    if top_k is not None and top_k < 1:
+        raise ValueError("'top_k' must be at least 1.")
+    from .models import QueryFilter, QueryPayload
+
+    query_filter = None
+    if folder_ids or file_types:
+        query_filter = QueryFilter(
+            folderIds=list(folder_ids) if folder_ids else None,
+            fileTypes=list(file_types) if file_types else None,
+        )
+    payload = QueryPayload(
+        query=query,
+        topK=top_k,
+        filter=query_filter,
+        includeSnippets=None if include_snippets else False,
+    )
+    return payload.model_dump(by_alias=True, exclude_none=True)
+
+
+def _check_deadline(deadline: Optional[float]) -> None:
+    if deadline is not None and deadline <= 0:
+        raise ValueError("'deadline' must be positive.")
+
+
+def drop_snippets(response: Any) -> Any:
+    """
+    Removes contentSnippet from decoded results, for servers that ignore
+    includeSnippets. Raw bodies are returned untouched.
+    """
+    if is_model(response):
+        for item in response.results:
+            item.content_snippet = None
+    elif isinstance(response, dict):
+        for item in response.get("results") or []:
+            item.pop("contentSnippet", None)
+    return response
 
 class QueryService:
     """
@@ -12,36 +88,489 @@ class QueryService:
     def __init__(self, client: 'RagulaClient'):
         self._client = client
 
-    def query_collection(self, collection_id: str, query: str) -> QueryCollectionResponse:
+    def query_collection(
+        self,
+        collection_id: str,
+        query: str,
+        top_k: Optional[int] = None,
+        folder_ids: Optional[Sequence[str]] = None,
+        file_types: Optional[Sequence[str]] = None,
+        include_snippets: bool = True,
+    ) -> "QueryCollectionResponse":
+        """
+        Performs a semantic search query against a specific collection.
+        Without options this sends the simplified SDK payload { "query": query }.
+
+        Args:
+            collection_id (str): The ID of the collection to query.
+            query (str): The query string.
+            top_k (Optional[int]): Maximum number of results the server returns.
+            folder_ids (Optional[Sequence[str]]): Only search files in these folders.
+            file_types (Optional[Sequence[str]]): Only search files of these types, e.g. ["pdf"].
+            include_snippets (bool): Set to False when only file IDs and scores are
+                needed, so the server can leave out contentSnippet.
+
+        Returns:
+            QueryResponse: An object containing the query results.
+        """
+        json_payload = build_query_payload(query, top_k, folder_ids, file_types, include_snippets)
+        response = self._post(collection_id, "query", json_payload, "QueryCollectionResponse")
+        return response if include_snippets else drop_snippets(response)
+
+    def ask_question(
+        self,
+        collection_id: str,
+        query: str,
+        top_k: Optional[int] = None,
+        folder_ids: Optional[Sequence[str]] = None,
+        file_types: Optional[Sequence[str]] = None,
+        include_snippets: bool = True,
+    ) -> "AskQuestionResponse":
+        """
+        Asks a question to a specific collection (likely using RAG).
+        Accepts the same options as query_collection, applied to the retrieved context.
+
+        Args:
+            collection_id (str): The ID of the collection to ask the question to.
+            query (str): The question string.
+            top_k (Optional[int]): Maximum number of results the server uses and returns.
+            folder_ids (Optional[Sequence[str]]): Only search files in these folders.
+            file_types (Optional[Sequence[str]]): Only search files of these types.
+            include_snippets (bool): Set to False to leave contentSnippet out of the results.
+
+        Returns:
+            AskQuestionResponse: An object containing the answer and related results.
+        """
+        json_payload = build_query_payload(query, top_k, folder_ids, file_types, include_snippets)
+        response = self._post(collection_id, "question", json_payload, "AskQuestionResponse")
+        return response if include_snippets else drop_snippets(response)
+
+    def ask_question_stream(
+        self,
+        collection_id: str,
+        query: str,
+        top_k: Optional[int] = None,
+        folder_ids: Optional[Sequence[str]] = None,
+        file_types: Optional[Sequence[str]] = None,
+        include_snippets: bool = True,
+    ) -> AnswerStream:
+        """
+        Asks a question like ask_question, but yields the answer while it is generated.
+
+        Args:
+            collection_id (str): The ID of the collection to ask the question to.
+            query (str): The question string.
+            top_k (Optional[int]): Maximum number of results the server uses and returns.
+            folder_ids (Optional[Sequence[str]]): Only search files in these folders.
+            file_types (Optional[Sequence[str]]): Only search files of these types.
+            include_snippets (bool): Set to False to leave contentSnippet out of the results.
+
+        Returns:
+            AnswerStream: An iterator of AnswerChunks (answer text and sources as they
+            arrive). Use it as a context manager to release the connection when the
+            stream is abandoned early. The query cache is not used.
+        """
+        json_payload = build_query_payload(query, top_k, folder_ids, file_types, include_snippets)
+        response = self._client._request(
+            "POST", f"/collections/{collection_id}/question", json_data=json_payload, headers=STREAM_HEADERS,
+            idempotent=True, timeout=self._client.timeouts.query, stream_response=True,
+        )
+        return AnswerStream(response, self._client.response_mode, include_snippets)
+
+    def _post(
+        self,
+        collection_id: str,
+        endpoint: str,
+        json_payload: Dict[str, Any],
+        response_type: Any,
+        timeout: Optional[TimeoutPair] = None,
+        deadline_at: Optional[float] = None,
+    ) -> Any:
+        """Posts a query payload, serving it from the client's query cache when enabled."""
+        timeout = timeout or self._client.timeouts.query
+        cache = self._client.query_cache
+        if cache is None:
+            # Queries are read-only, so they are safe to retry despite being POSTs.
+            return self._client._request(
+                "POST", f"/collections/{collection_id}/{endpoint}", json_data=json_payload, idempotent=True,
+                timeout=timeout, response_type=response_type, deadline_at=deadline_at,
+            )
+        # The cache holds raw bodies, so hits are decoded once, straight into the client's response mode.
+        body = cache.get_body(collection_id, endpoint, json_payload)
+        if body is None:
+            body = self._client._request(
+                "POST", f"/collections/{collection_id}/{endpoint}", json_data=json_payload, idempotent=True,
+                timeout=timeout, response_mode=RAW_MODE, deadline_at=deadline_at,
+            )
+            if not body:
+                return None
+            cache.set_body(collection_id, endpoint, json_payload, body)
+        return self._client._decode(200, body, None, response_type)
+
+    def query_many(
+        self,
+        collection_id: str,
+        queries: Sequence[str],
+        concurrency: int = DEFAULT_QUERY_CONCURRENCY,
+    ) -> List[QueryBatchResult]:
+        """
+        Runs several queries against one collection in parallel.
+
+        Queries are dispatched over the client's shared session from a bounded
+        thread pool. A failing query does not cancel the others: its slot in the
+        result list holds the RagulaError instead of a response.
+
+        Args:
+            collection_id (str): The ID of the collection to query.
+            queries (Sequence[str]): The query strings.
+            concurrency (int): Maximum number of requests in flight at once.
+
+        Returns:
+            List[Union[QueryResponse, RagulaError]]: One entry per query, in input order.
+        """
+        return self._fan_out([(collection_id, query) for query in queries], concurrency)
+
+    def query_collections(
+        self,
+        collection_ids: Sequence[str],
+        query: str,
+        concurrency: int = DEFAULT_QUERY_CONCURRENCY,
+    ) -> List[QueryBatchResult]:
+        """
+        Runs one query against several collections in parallel.
+
+        Args:
+            collection_ids (Sequence[str]): The IDs of the collections to query.
+            query (str): The query string.
+            concurrency (int): Maximum number of requests in flight at once.
+
+        Returns:
+            List[Union[QueryResponse, RagulaError]]: One entry per collection, in input order.
+        """
+        return self._fan_out([(collection_id, query) for collection_id in collection_ids], concurrency)
+
+    def federated_query(
+        self,
+        collection_ids: Sequence[str],
+        query: str,
+        top_k: int = DEFAULT_FEDERATED_TOP_K,
+        deadline: Optional[float] = None,
+        fusion: str = RRF,
+        rrf_k: float = DEFAULT_RRF_K,
+        folder_ids: Optional[Sequence[str]] = None,
+        file_types: Optional[Sequence[str]] = None,
+        include_snippets: bool = True,
+        concurrency: int = DEFAULT_QUERY_CONCURRENCY,
+    ) -> FederatedResponse:
+        """
+        Runs one query against several collections concurrently and merges the
+        results into one ranked list, each hit tagged with its collection.
+
+        Every collection gets at most deadline seconds, counted from the start
+        of the call. Collections that fail or miss it are reported in the
+        response's errors instead of failing the call or holding up the others.
+
+        Args:
+            collection_ids (Sequence[str]): The IDs of the collections to query.
+            query (str): The query string.
+            top_k (int): Number of merged hits to return; also sent to each collection.
+            deadline (Optional[float]): Seconds each collection has to answer. No limit if None.
+            fusion (str): How scores are made comparable: "rrf" (reciprocal rank
+                fusion) or "score" (per-collection min-max normalization).
+            rrf_k (float): Damping constant of reciprocal rank fusion.
+            folder_ids (Optional[Sequence[str]]): Only search files in these folders.
+            file_types (Optional[Sequence[str]]): Only search files of these types.
+            include_snippets (bool): Set to False to leave contentSnippet out of the results.
+            concurrency (int): Maximum number of requests in flight at once.
+
+        Returns:
+            FederatedResponse: The merged hits, best first, and the per-collection errors.
+        """
+        check_fusion(fusion, top_k, rrf_k)
+        _check_concurrency(concurrency)
+        _check_deadline(deadline)
+        json_payload = build_query_payload(query, top_k, folder_ids, file_types, include_snippets)
+        # Attempts and retries both stop at the deadline, so abandoned stragglers end by then.
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+        timeout = clamp_timeout(self._client.timeouts.query, deadline)
+        collection_ids = list(dict.fromkeys(collection_ids))
+        report = FederatedResponse()
+        if not collection_ids:
+            return report
+
+        def run(collection_id: str) -> Any:
+            response = self._post(
+                collection_id, "query", json_payload, "QueryCollectionResponse", timeout, deadline_at
+            )
+            return response if include_snippets else drop_snippets(response)
+
+        pool = ThreadPoolExecutor(max_workers=min(concurrency, len(collection_ids)))
+        futures: List["Future[Any]"] = []
+        try:
+            futures = [pool.submit(run, collection_id) for collection_id in collection_ids]
+            done, _ = wait(futures, timeout=deadline)
+        finally:
+            for future in futures:
+                future.cancel() # Only stops collections still waiting for a worker
+            pool.shutdown(wait=False) # Running requests end by the deadline (see above)
+
+        responses = []
+        for collection_id, future in zip(collection_ids, futures):
+            if future not in done:
+                report.errors[collection_id] = deadline_error(collection_id, deadline)
+                continue
+            try:
+                responses.append((collection_id, future.result()))
+            except RagulaError as e:
+                report.errors[collection_id] = e
+        report.hits = fuse(responses, top_k, fusion, rrf_k)
+        return report
+
+    def _fan_out(self, requests: List[Tuple[str, str]], concurrency: int) -> List[QueryBatchResult]:
+        _check_concurrency(concurrency)
+        if not requests:
+            return []
+
+        def run(request: Tuple[str, str]) -> QueryBatchResult:
+            try:
+                return self.query_collection(*request)
+            except RagulaError as e:
+                return e
+
+        if concurrency == 1 or len(requests) == 1:
+            return [run(request) for request in requests]
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(requests))) as pool:
+            # map() yields results in submission order, preserving input order.
+            return list(pool.map(run, requests))
+
+
+class AsyncQueryService:
+    """
+    Asyncio counterpart of QueryService, used by AsyncRagulaClient.
+    """
+    def __init__(self, client: 'AsyncRagulaClient'):
+        self._client = client
+
+    async def query_collection(
+        self,
+        collection_id: str,
+        query: str,
+        top_k: Optional[int] = None,
+        folder_ids: Optional[Sequence[str]] = None,
+        file_types: Optional[Sequence[str]] = None,
+        include_snippets: bool = True,
+    ) -> "QueryCollectionResponse":
         """
         Performs a semantic search query against a specific collection.
-        Note: This uses the simplified SDK payload { "query": query }.
 
         Args:
             collection_id (str): The ID of the collection to query.
             query (str): The query string.
+            top_k (Optional[int]): Maximum number of results the server returns.
+            folder_ids (Optional[Sequence[str]]): Only search files in these folders.
+            file_types (Optional[Sequence[str]]): Only search files of these types, e.g. ["pdf"].
+            include_snippets (bool): Set to False when only file IDs and scores are
+                needed, so the server can leave out contentSnippet.
 
         Returns:
             QueryResponse: An object containing the query results.
         """
-        # Use the simplified payload as per the Node.js SDK definition
-        payload = SimpleQueryPayload(query=query)
-        json_payload = payload.model_dump(by_alias=True) # Ensures correct field names if aliases were used
-        return self._client._request("POST", f"/collections/{collection_id}/query", json_data=json_payload)
+        json_payload = build_query_payload(query, top_k, folder_ids, file_types, include_snippets)
+        response = await self._post(collection_id, "query", json_payload, "QueryCollectionResponse")
+        return response if include_snippets else drop_snippets(response)
 
-    def ask_question(self, collection_id: str, query: str) -> QueryCollectionResponse:
+    async def ask_question(
+        self,
+        collection_id: str,
+        query: str,
+        top_k: Optional[int] = None,
+        folder_ids: Optional[Sequence[str]] = None,
+        file_types: Optional[Sequence[str]] = None,
+        include_snippets: bool = True,
+    ) -> "AskQuestionResponse":
         """
         Asks a question to a specific collection (likely using RAG).
-        Note: This uses the simplified SDK payload { "query": query }.
+        Accepts the same options as query_collection, applied to the retrieved context.
 
         Args:
             collection_id (str): The ID of the collection to ask the question to.
             query (str): The question string.
+            top_k (Optional[int]): Maximum number of results the server uses and returns.
+            folder_ids (Optional[Sequence[str]]): Only search files in these folders.
+            file_types (Optional[Sequence[str]]): Only search files of these types.
+            include_snippets (bool): Set to False to leave contentSnippet out of the results.
+
+        Returns:
+            AskQuestionResponse: An object containing the answer and related results.
+        """
+        json_payload = build_query_payload(query, top_k, folder_ids, file_types, include_snippets)
+        response = await self._post(collection_id, "question", json_payload, "AskQuestionResponse")
+        return response if include_snippets else drop_snippets(response)
+
+    async def ask_question_stream(
+        self,
+        collection_id: str,
+        query: str,
+        top_k: Optional[int] = None,
+        folder_ids: Optional[Sequence[str]] = None,
+        file_types: Optional[Sequence[str]] = None,
+        include_snippets: bool = True,
+    ) -> AsyncAnswerStream:
+        """
+        Asks a question like ask_question, but yields the answer while it is generated.
+        Takes the same arguments as ask_question.
 
         Returns:
-            QueryResponse: An object containing the answer or related results.
+            AsyncAnswerStream: An async iterator of AnswerChunks. Use it with "async with"
+            to release the connection when the stream is abandoned early.
+        """
+        json_payload = build_query_payload(query, top_k, folder_ids, file_types, include_snippets)
+        response = await self._client._request(
+            "POST", f"/collections/{collection_id}/question", json_data=json_payload, headers=STREAM_HEADERS,
+            idempotent=True, timeout=self._client.timeouts.query, stream_response=True,
+        )
+        return AsyncAnswerStream(response, self._client.response_mode, include_snippets)
+
+    async def _post(
+        self,
+        collection_id: str,
+        endpoint: str,
+        json_payload: Dict[str, Any],
+        response_type: Any,
+        timeout: Optional[TimeoutPair] = None,
+        deadline_at: Optional[float] = None,
+    ) -> Any:
+        """Posts a query payload, serving it from the client's query cache when enabled."""
+        timeout = timeout or self._client.timeouts.query
+        cache = self._client.query_cache
+        if cache is None:
+            # Queries are read-only, so they are safe to retry despite being POSTs.
+            return await self._client._request(
+                "POST", f"/collections/{collection_id}/{endpoint}", json_data=json_payload, idempotent=True,
+                timeout=timeout, response_type=response_type, deadline_at=deadline_at,
+            )
+        # The cache holds raw bodies, so hits are decoded once, straight into the client's response mode.
+        body = cache.get_body(collection_id, endpoint, json_payload)
+        if body is None:
+            body = await self._client._request(
+                "POST", f"/collections/{collection_id}/{endpoint}", json_data=json_payload, idempotent=True,
+                timeout=timeout, response_mode=RAW_MODE, deadline_at=deadline_at,
+            )
+            if not body:
+                return None
+            cache.set_body(collection_id, endpoint, json_payload, body)
+        return self._client._decode(200, body, None, response_type)
+
+    async def query_many(
+        self,
+        collection_id: str,
+        queries: Sequence[str],
+        concurrency: int = DEFAULT_QUERY_CONCURRENCY,
+    ) -> List[QueryBatchResult]:
         """
-        # Uses the same simplified payload structure
-        payload = SimpleQueryPayload(query=query)
-        json_payload = payload.model_dump(by_alias=True)
-        return self._client._request("POST", f"/collections/{collection_id}/question", json_data=json_payload)
\ No newline at end of file
+        Runs several queries against one collection concurrently.
+
+        A failing query does not cancel the others: its slot in the result list
+        holds the RagulaError instead of a response.
+
+        Args:
+            collection_id (str): The ID of the collection to query.
+            queries (Sequence[str]): The query strings.
+            concurrency (int): Maximum number of requests in flight at once.
+
+        Returns:
+            List[Union[QueryResponse, RagulaError]]: One entry per query, in input order.
+        """
+        return await self._fan_out([(collection_id, query) for query in queries], concurrency)
+
+    async def query_collections(
+        self,
+        collection_ids: Sequence[str],
+        query: str,
+        concurrency: int = DEFAULT_QUERY_CONCURRENCY,
+    ) -> List[QueryBatchResult]:
+        """
+        Runs one query against several collections concurrently.
+
+        Args:
+            collection_ids (Sequence[str]): The IDs of the collections to query.
+            query (str): The query string.
+            concurrency (int): Maximum number of requests in flight at once.
+
+        Returns:
+            List[Union[QueryResponse, RagulaError]]: One entry per collection, in input order.
+        """
+        return await self._fan_out([(collection_id, query) for collection_id in collection_ids], concurrency)
+
+    async def federated_query(
+        self,
+        collection_ids: Sequence[str],
+        query: str,
+        top_k: int = DEFAULT_FEDERATED_TOP_K,
+        deadline: Optional[float] = None,
+        fusion: str = RRF,
+        rrf_k: float = DEFAULT_RRF_K,
+        folder_ids: Optional[Sequence[str]] = None,
+        file_types: Optional[Sequence[str]] = None,
+        include_snippets: bool = True,
+        concurrency: int = DEFAULT_QUERY_CONCURRENCY,
+    ) -> FederatedResponse:
+        """See QueryService.federated_query. Collections that miss the deadline are cancelled."""
+        check_fusion(fusion, top_k, rrf_k)
+        _check_concurrency(concurrency)
+        _check_deadline(deadline)
+        json_payload = build_query_payload(query, top_k, folder_ids, file_types, include_snippets)
+        # Attempts and retries both stop at the deadline, so abandoned stragglers end by then.
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+        timeout = clamp_timeout(self._client.timeouts.query, deadline)
+        collection_ids = list(dict.fromkeys(collection_ids))
+        report = FederatedResponse()
+        if not collection_ids:
+            return report
+        import asyncio
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(collection_id: str) -> Any:
+            async with semaphore:
+                response = await self._post(
+                    collection_id, "query", json_payload, "QueryCollectionResponse", timeout, deadline_at
+                )
+            return response if include_snippets else drop_snippets(response)
+
+        tasks = [asyncio.ensure_future(run(collection_id)) for collection_id in collection_ids]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=deadline)
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            # Lets cancelled requests hand their connections back to the pool.
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        responses = []
+        for collection_id, task in zip(collection_ids, tasks):
+            if task not in done:
+                report.errors[collection_id] = deadline_error(collection_id, deadline)
+                continue
+            try:
+                responses.append((collection_id, task.result()))
+            except RagulaError as e:
+                report.errors[collection_id] = e
+        report.hits = fuse(responses, top_k, fusion, rrf_k)
+        return report
+
+    async def _fan_out(self, requests: List[Tuple[str, str]], concurrency: int) -> List[QueryBatchResult]:
+        _check_concurrency(concurrency)
+        import asyncio
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(request: Tuple[str, str]) -> QueryBatchResult:
+            async with semaphore:
+                try:
+                    return await self.query_collection(*request)
+                except RagulaError as e:
+                    return e
+
+        return list(await asyncio.gather(*(run(request) for request in requests)))
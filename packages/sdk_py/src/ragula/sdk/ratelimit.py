@@ -0,0 +1,191 @@
+"""
+Client-side rate limiting and concurrency control.
+
+A RequestGovernor combines a token bucket (requests per second) with a cap on
+requests in flight, and orders waiting requests by lane priority so interactive
+traffic is served before background work. One governor can be shared by several
+RagulaClient and AsyncRagulaClient instances, across threads and event loops.
+"""
+
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import asyncio
+
+# Lanes used by the SDK services, highest priority first.
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+DEFAULT_LANES = (INTERACTIVE, BACKGROUND)
+
+
+class RequestGovernor:
+    """
+    Token-bucket rate limiter and in-flight semaphore with priority lanes.
+
+    A request in a lane may only start when no request in a higher-priority lane
+    is waiting, a rate token is available and the in-flight limits allow it.
+    Background work therefore only uses capacity that interactive traffic leaves
+    over, and lane_limits can reserve in-flight slots for interactive requests.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        lane_limits: Optional[Dict[str, int]] = None,
+        lanes: Sequence[str] = DEFAULT_LANES,
+    ):
+        """
+        Args:
+            rate: Sustained requests per second. Unlimited if None.
+            burst: Bucket size, i.e. requests allowed back to back. Defaults to
+                   max(1, rate).
+            max_in_flight: Maximum concurrent requests across all lanes.
+            lane_limits: Optional per-lane caps on concurrent requests, e.g.
+                         {"background": 4} keeps slots free for queries.
+            lanes: Lane names, highest priority first.
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("'rate' must be positive.")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("'max_in_flight' must be at least 1.")
+        self.rate = rate
+        self.burst = float(burst if burst is not None else max(1.0, rate or 1.0))
+        self.max_in_flight = max_in_flight
+        self.lanes = tuple(lanes)
+        self.lane_limits = dict(lane_limits or {})
+        unknown = set(self.lane_limits) - set(self.lanes)
+        if unknown:
+            raise ValueError(f"Unknown lanes in 'lane_limits': {sorted(unknown)}")
+
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._async_waiters: List[Tuple["asyncio.AbstractEventLoop", "asyncio.Future[None]"]] = []
+        self._tokens = self.burst
+        self._refilled_at = time.monotonic()
+        self._in_flight = 0
+        self._lane_in_flight = {lane: 0 for lane in self.lanes}
+        self._waiting = {lane: 0 for lane in self.lanes}
+
+    def _check_lane(self, lane: str) -> None:
+        if lane not in self._lane_in_flight:
+            raise ValueError(f"Unknown lane '{lane}'. Expected one of {self.lanes}.")
+
+    def _try_acquire(self, lane: str) -> Optional[float]:
+        """
+        Takes a slot if possible. Must be called with the lock held.
+
+        Returns:
+            0.0 if acquired, the seconds until a token is due if only the rate
+            blocks, or None if the request must wait for another one to finish.
+        """
+        for higher in self.lanes[: self.lanes.index(lane)]:
+            if self._waiting[higher]:
+                return None
+        if self.max_in_flight is not None and self._in_flight >= self.max_in_flight:
+            return None
+        limit = self.lane_limits.get(lane)
+        if limit is not None and self._lane_in_flight[lane] >= limit:
+            return None
+        if self.rate is not None:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+            self._refilled_at = now
+            if self._tokens < 1.0:
+                return (1.0 - self._tokens) / self.rate
+            self._tokens -= 1.0
+        self._in_flight += 1
+        self._lane_in_flight[lane] += 1
+        return 0.0
+
+    def _wake_all(self) -> None:
+        """Wakes every waiter so it re-checks the limits. Must be called with the lock held."""
+        self._condition.notify_all()
+        waiters, self._async_waiters = self._async_waiters, []
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_resolve, future)
+
+    def _wake_lower(self, lane: str) -> None:
+        """Wakes waiters if a lower-priority lane was held back by lane. Must be called with the lock held."""
+        if any(self._waiting[lower] for lower in self.lanes[self.lanes.index(lane) + 1 :]):
+            self._wake_all()
+
+    def acquire(self, lane: str = INTERACTIVE) -> None:
+        """Blocks the calling thread until a request in lane may start."""
+        self._check_lane(lane)
+        with self._condition:
+            self._waiting[lane] += 1
+            try:
+                while True:
+                    wait = self._try_acquire(lane)
+                    if wait == 0.0:
+                        return
+                    self._condition.wait(timeout=wait)
+            finally:
+                self._waiting[lane] -= 1
+                # A lower-priority waiter may have been held back by this one.
+                self._wake_lower(lane)
+
+    async def acquire_async(self, lane: str = INTERACTIVE) -> None:
+        """Waits, without blocking the event loop, until a request in lane may start."""
+        import asyncio # Not needed by sync clients, which should not pay for importing it
+
+        self._check_lane(lane)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._waiting[lane] += 1
+        try:
+            while True:
+                with self._lock:
+                    wait = self._try_acquire(lane)
+                    if wait == 0.0:
+                        return
+                    future = loop.create_future()
+                    self._async_waiters.append((loop, future))
+                try:
+                    await asyncio.wait_for(future, timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            with self._lock:
+                self._waiting[lane] -= 1
+                self._wake_lower(lane)
+
+    def release(self, lane: str = INTERACTIVE) -> None:
+        """Marks a request in lane as finished."""
+        with self._lock:
+            self._in_flight -= 1
+            self._lane_in_flight[lane] -= 1
+            self._wake_all()
+
+    @contextmanager
+    def slot(self, lane: str = INTERACTIVE) -> Iterator[None]:
+        """Holds a request slot in lane for the duration of the block."""
+        self.acquire(lane)
+        try:
+            yield
+        finally:
+            self.release(lane)
+
+    @asynccontextmanager
+    async def slot_async(self, lane: str = INTERACTIVE) -> AsyncIterator[None]:
+        """Async counterpart of slot()."""
+        await self.acquire_async(lane)
+        try:
+            yield
+        finally:
+            self.release(lane)
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return self._in_flight
+
+
+def _resolve(future: "asyncio.Future[Any]") -> None:
+    if not future.done():
+        future.set_result(None)
@@ -0,0 +1,137 @@
+"""
+Retry policy shared by RagulaClient and AsyncRagulaClient.
+"""
+
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+# Statuses that signal a transient, server-side condition.
+DEFAULT_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Methods that can be repeated without changing the outcome.
+DEFAULT_RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a failed request.
+
+    Idempotent requests (retry_methods, plus calls the SDK marks as read-only such
+    as query POSTs) are retried on transport failures and on retry_statuses.
+    Other requests, such as file uploads, are only retried when the server cannot
+    have acted on them: the connection was never established, or the server
+    answered 429. Use RetryPolicy(max_attempts=1) to disable retries.
+
+    Attributes:
+        max_attempts: Total attempts per call, including the first one.
+        backoff_base: Delay before the first retry, in seconds. Doubles per attempt.
+        backoff_cap: Upper bound for a single delay, including Retry-After waits.
+        jitter: Use "full jitter" (a random delay up to the backoff) to spread retries.
+        retry_statuses: HTTP statuses considered transient.
+        retry_methods: HTTP methods considered idempotent.
+        respect_retry_after: Wait at least as long as the server's Retry-After header.
+        deadline: Total time budget per call across all attempts, in seconds.
+    """
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_cap: float = 30.0
+    jitter: bool = True
+    retry_statuses: FrozenSet[int] = DEFAULT_RETRY_STATUSES
+    retry_methods: FrozenSet[str] = DEFAULT_RETRY_METHODS
+    respect_retry_after: bool = True
+    deadline: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("'max_attempts' must be at least 1.")
+        if self.deadline is not None and self.deadline <= 0:
+            raise ValueError("'deadline' must be positive.")
+
+    def is_idempotent(self, method: str) -> bool:
+        return method.upper() in self.retry_methods
+
+    def backoff(self, attempt: int) -> float:
+        """Returns the delay before retry number `attempt` (1-based)."""
+        delay = min(self.backoff_cap, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def start_deadline(self, deadline_at: Optional[float] = None) -> Optional[float]:
+        """Returns the monotonic time at which a call started now must give up, no later than deadline_at."""
+        if self.deadline is None:
+            return deadline_at
+        own = time.monotonic() + self.deadline
+        return own if deadline_at is None else min(own, deadline_at)
+
+    def next_delay(
+        self,
+        attempt: int,
+        idempotent: bool,
+        deadline_at: Optional[float],
+        status_code: Optional[int] = None,
+        retry_after: Optional[str] = None,
+        connect_error: bool = False,
+    ) -> Optional[float]:
+        """
+        Decides whether a failed attempt is retried.
+
+        Args:
+            attempt: Number of attempts made so far.
+            idempotent: Whether repeating the request is safe.
+            deadline_at: Monotonic deadline of the call, if any.
+            status_code: The error status, or None for a transport failure.
+            retry_after: The response's Retry-After header, if any.
+            connect_error: Whether the transport failure happened before the
+                request was sent.
+
+        Returns:
+            Seconds to wait before retrying, or None to give up.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if status_code is None:
+            retryable = idempotent or connect_error
+        else:
+            retryable = status_code in self.retry_statuses and (idempotent or status_code == 429)
+        if not retryable:
+            return None
+
+        delay = self.backoff(attempt)
+        if self.respect_retry_after and status_code is not None:
+            server_delay = parse_retry_after(retry_after)
+            if server_delay is not None:
+                if server_delay > self.backoff_cap:
+                    return None
+                delay = max(delay, server_delay)
+
+        if deadline_at is not None and time.monotonic() + delay >= deadline_at:
+            return None
+        return delay
+
+    @staticmethod
+    def remaining(deadline_at: Optional[float]) -> Optional[float]:
+        """Seconds left before deadline_at, or None if the call has no deadline."""
+        if deadline_at is None:
+            return None
+        return max(0.0, deadline_at - time.monotonic())
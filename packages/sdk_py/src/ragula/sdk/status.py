@@ -0,0 +1,321 @@
+"""
+Collection status watching: adaptive polling of /collections/{id}/status with
+one shared poller per collection, however many callers are waiting on it.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+from .coalesce import copy_error
+
+# Statuses after which a collection's status no longer changes on its own.
+DEFAULT_READY_STATUSES = frozenset({"ready"})
+DEFAULT_FAILED_STATUSES = frozenset({"failed", "error"})
+
+StatusFetcher = Callable[[str], Dict[str, Any]]
+AsyncStatusFetcher = Callable[[str], Awaitable[Dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class StatusPolling:
+    """
+    How often a collection's status is polled.
+
+    The interval starts at initial_interval and grows by multiplier after every
+    poll that shows no change, up to max_interval. Any change (status, file
+    count or size) resets it, so active ingestion is tracked closely while a
+    long-idle collection is polled rarely.
+
+    Attributes:
+        initial_interval: Seconds between the first polls.
+        max_interval: Upper bound for the interval, in seconds.
+        multiplier: Growth factor applied while nothing changes.
+        ready_statuses: Statuses (case-insensitive) meaning the collection is queryable.
+        failed_statuses: Statuses (case-insensitive) meaning ingestion failed.
+    """
+    initial_interval: float = 0.5
+    max_interval: float = 10.0
+    multiplier: float = 1.5
+    ready_statuses: FrozenSet[str] = DEFAULT_READY_STATUSES
+    failed_statuses: FrozenSet[str] = DEFAULT_FAILED_STATUSES
+
+    def __post_init__(self) -> None:
+        if self.initial_interval <= 0 or self.max_interval < self.initial_interval:
+            raise ValueError("Intervals must be positive, with 'max_interval' >= 'initial_interval'.")
+        if self.multiplier < 1:
+            raise ValueError("'multiplier' must be at least 1.")
+
+    def is_ready(self, status: str) -> bool:
+        return status.lower() in self.ready_statuses
+
+    def is_failed(self, status: str) -> bool:
+        return status.lower() in self.failed_statuses
+
+    def is_terminal(self, status: str) -> bool:
+        return self.is_ready(status) or self.is_failed(status)
+
+    def next_interval(self, interval: float, changed: bool) -> float:
+        return self.initial_interval if changed else min(self.max_interval, interval * self.multiplier)
+
+
+@dataclass(frozen=True)
+class StatusChange:
+    """
+    An observed change of a collection's status, file count or total size.
+
+    The first change of a watch reports the current status, with deltas of 0.
+    """
+    collection_id: str
+    status: str
+    file_count: int
+    total_size: int
+    previous_status: Optional[str] = None
+    file_count_delta: int = 0
+    total_size_delta: int = 0
+    elapsed: float = 0.0
+
+
+def _observe(
+    collection_id: str, body: Dict[str, Any], previous: Optional[StatusChange], started: float
+) -> Optional[StatusChange]:
+    """Returns the change from previous to body, or None if nothing changed."""
+    status = str(body.get("status", ""))
+    file_count = int(body.get("fileCount") or 0)
+    total_size = int(body.get("totalSize") or 0)
+    if previous is None:
+        return StatusChange(collection_id, status, file_count, total_size, elapsed=time.monotonic() - started)
+    if (status, file_count, total_size) == (previous.status, previous.file_count, previous.total_size):
+        return None
+    return StatusChange(
+        collection_id,
+        status,
+        file_count,
+        total_size,
+        previous_status=previous.status,
+        file_count_delta=file_count - previous.file_count,
+        total_size_delta=total_size - previous.total_size,
+        elapsed=time.monotonic() - started,
+    )
+
+
+def _timeout_error(collection_id: str, timeout: Optional[float]) -> TimeoutError:
+    return TimeoutError(f"Collection {collection_id} did not finish processing within {timeout} seconds.")
+
+
+def _start_index(changes: List[StatusChange]) -> int:
+    # Late joiners start at the current status instead of replaying the history.
+    return max(0, len(changes) - 1)
+
+
+@dataclass
+class _SharedPoll:
+    """State of one collection's poller, shared by its subscribers."""
+    polling: StatusPolling
+    condition: threading.Condition = field(default_factory=threading.Condition)
+    changes: List[StatusChange] = field(default_factory=list)
+    subscribers: int = 0
+    finished: bool = False
+    error: Optional[BaseException] = None
+
+
+class StatusWatcher:
+    """
+    Polls collection statuses on background threads. Concurrent watches of the
+    same collection with equal StatusPolling settings share one poller, which
+    stops once the collection reaches a terminal status or no one is watching
+    any more. Each watch keeps its own timeout.
+    """
+
+    def __init__(self, fetch: StatusFetcher):
+        self._fetch = fetch
+        self._lock = threading.Lock()
+        self._polls: Dict[Tuple[str, StatusPolling], _SharedPoll] = {}
+
+    def watch(
+        self, collection_id: str, timeout: Optional[float] = None, polling: Optional[StatusPolling] = None
+    ) -> Iterator[StatusChange]:
+        """
+        Yields status changes until the collection is ready or failed.
+
+        Raises:
+            TimeoutError: If no terminal status was seen within timeout seconds.
+            RagulaError: If polling the status failed.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        poll = self._subscribe(collection_id, polling or StatusPolling())
+        try:
+            with poll.condition:
+                index = _start_index(poll.changes)
+            while True:
+                with poll.condition:
+                    while index >= len(poll.changes) and not poll.finished:
+                        remaining = None if deadline is None else deadline - time.monotonic()
+                        if remaining is not None and remaining <= 0:
+                            raise _timeout_error(collection_id, timeout)
+                        poll.condition.wait(remaining)
+                    pending = poll.changes[index:]
+                    index = len(poll.changes)
+                    done, error = poll.finished, poll.error
+                yield from pending
+                if error is not None:
+                    raise copy_error(error)
+                if done and not pending:
+                    return
+        finally:
+            self._unsubscribe(poll)
+
+    def _subscribe(self, collection_id: str, polling: StatusPolling) -> _SharedPoll:
+        with self._lock:
+            poll = self._polls.get((collection_id, polling))
+            if poll is not None:
+                with poll.condition:
+                    poll.subscribers += 1
+                return poll
+            poll = self._polls[(collection_id, polling)] = _SharedPoll(polling, subscribers=1)
+        thread = threading.Thread(
+            target=self._run, args=(collection_id, poll), name=f"ragula-status-{collection_id}", daemon=True
+        )
+        thread.start()
+        return poll
+
+    def _unsubscribe(self, poll: _SharedPoll) -> None:
+        with poll.condition:
+            poll.subscribers -= 1
+            # Wakes the poller so it can stop without finishing its sleep.
+            poll.condition.notify_all()
+
+    def _finish(self, collection_id: str, poll: _SharedPoll, error: Optional[BaseException] = None) -> bool:
+        """Stops the poller if its work is done. Returns whether it stopped."""
+        with self._lock, poll.condition:
+            if error is None and not poll.finished and poll.subscribers > 0:
+                return False
+            poll.finished = True
+            poll.error = error
+            if self._polls.get((collection_id, poll.polling)) is poll:
+                del self._polls[(collection_id, poll.polling)]
+            poll.condition.notify_all()
+            return True
+
+    def _run(self, collection_id: str, poll: _SharedPoll) -> None:
+        started = time.monotonic()
+        interval = poll.polling.initial_interval
+        previous: Optional[StatusChange] = None
+        while True:
+            try:
+                body = self._fetch(collection_id)
+            except Exception as e:
+                self._finish(collection_id, poll, e)
+                return
+            change = _observe(collection_id, body or {}, previous, started)
+            with poll.condition:
+                if change is not None:
+                    previous = change
+                    poll.changes.append(change)
+                    poll.finished = poll.polling.is_terminal(change.status)
+                    poll.condition.notify_all()
+            if self._finish(collection_id, poll):
+                return
+            interval = poll.polling.next_interval(interval, change is not None)
+            with poll.condition:
+                poll.condition.wait_for(lambda: poll.subscribers == 0, timeout=interval)
+            # Stops without another request once the last subscriber has left.
+            if self._finish(collection_id, poll):
+                return
+
+
+@dataclass
+class _AsyncSharedPoll:
+    polling: StatusPolling
+    changes: List[StatusChange] = field(default_factory=list)
+    subscribers: int = 0
+    finished: bool = False
+    error: Optional[BaseException] = None
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+    task: Optional["asyncio.Task[None]"] = None
+
+    def notify(self) -> None:
+        # Events cannot be re-armed safely while waiters are pending, so each notification uses a fresh one.
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+
+class AsyncStatusWatcher:
+    """Asyncio counterpart of StatusWatcher: one polling task per watched collection and StatusPolling."""
+
+    def __init__(self, fetch: AsyncStatusFetcher):
+        self._fetch = fetch
+        self._polls: Dict[Tuple[str, StatusPolling], _AsyncSharedPoll] = {}
+
+    async def watch(
+        self, collection_id: str, timeout: Optional[float] = None, polling: Optional[StatusPolling] = None
+    ) -> AsyncIterator[StatusChange]:
+        """See StatusWatcher.watch."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        polling = polling or StatusPolling()
+        poll = self._polls.get((collection_id, polling))
+        if poll is None:
+            poll = self._polls[(collection_id, polling)] = _AsyncSharedPoll(polling)
+            poll.task = asyncio.ensure_future(self._run(collection_id, poll))
+        poll.subscribers += 1
+        index = _start_index(poll.changes)
+        try:
+            while True:
+                if index < len(poll.changes):
+                    change = poll.changes[index]
+                    index += 1
+                    yield change
+                    continue
+                if poll.error is not None:
+                    raise copy_error(poll.error)
+                if poll.finished:
+                    return
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise _timeout_error(collection_id, timeout)
+                try:
+                    await asyncio.wait_for(poll.changed.wait(), remaining)
+                except asyncio.TimeoutError:
+                    raise _timeout_error(collection_id, timeout) from None
+        finally:
+            poll.subscribers -= 1
+            if poll.subscribers == 0 and not poll.finished:
+                self._finish(collection_id, poll)
+                if poll.task is not None:
+                    poll.task.cancel()
+
+    def _finish(self, collection_id: str, poll: _AsyncSharedPoll, error: Optional[BaseException] = None) -> None:
+        poll.finished = True
+        poll.error = error
+        if self._polls.get((collection_id, poll.polling)) is poll:
+            del self._polls[(collection_id, poll.polling)]
+        poll.notify()
+
+    async def _run(self, collection_id: str, poll: _AsyncSharedPoll) -> None:
+        started = time.monotonic()
+        interval = poll.polling.initial_interval
+        previous: Optional[StatusChange] = None
+        while True:
+            try:
+                body = await self._fetch(collection_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._finish(collection_id, poll, e)
+                return
+            change = _observe(collection_id, body or {}, previous, started)
+            if change is not None:
+                previous = change
+                poll.changes.append(change)
+                if poll.polling.is_terminal(change.status):
+                    self._finish(collection_id, poll)
+                    return
+                poll.notify()
+            interval = poll.polling.next_interval(interval, change is not None)
+            await asyncio.sleep(interval)
+            # Stops without another request once the last subscriber has left.
+            if poll.subscribers == 0:
+                self._finish(collection_id, poll)
+                return
@@ -0,0 +1,297 @@
+"""
+Streamed answers for ask_question_stream.
+
+The question endpoint is asked for an event stream, and the answer is handed to
+the caller chunk by chunk while it is generated. Supported response bodies:
+
+* text/event-stream    - Server-Sent Events, with a JSON object as each event's data.
+* application/x-ndjson - one JSON object per line.
+* application/json     - a server without streaming support; the whole answer
+                         arrives as a single chunk once it is complete.
+
+Each object may carry answer text under "delta", "text" or "answer" (appended to
+the answer so far) and sources under "results" or "sources". An "error" event,
+or an object with an "error" key, raises RagulaError. A "done" event or the data
+"[DONE]" ends the stream.
+"""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator, List, Optional
+
+from .client import RagulaError
+from .parsing import MODEL_MODE, loads_json, type_adapter
+
+if TYPE_CHECKING:
+    import httpx
+    import requests
+
+# Accept header of streamed questions; plain JSON is still accepted from servers that cannot stream.
+STREAM_HEADERS = {"Accept": "text/event-stream, application/x-ndjson;q=0.9, application/json;q=0.5"}
+
+SSE = "sse"
+NDJSON = "ndjson"
+JSON = "json"
+
+_TEXT_KEYS = ("delta", "text", "answer")
+_SOURCE_KEYS = ("results", "sources")
+
+
+@dataclass
+class AnswerChunk:
+    """
+    A piece of a streamed answer.
+
+    Attributes:
+        text: Answer text generated since the previous chunk (may be empty).
+        results: Sources that arrived with this chunk: dicts, or QueryResultItems in model mode.
+    """
+    text: str = ""
+    results: List[Any] = field(default_factory=list)
+
+
+def body_kind(content_type: str) -> str:
+    """How a streamed body is framed, from its Content-Type."""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type == "text/event-stream":
+        return SSE
+    if media_type in ("application/x-ndjson", "application/jsonl", "application/json-seq"):
+        return NDJSON
+    return JSON
+
+
+class AnswerParser:
+    """
+    Incremental parser turning the bytes of a streamed answer into AnswerChunks.
+
+    Bytes may be fed in arbitrary pieces, which may split lines and UTF-8
+    sequences; a line is only decoded and parsed once it is complete.
+    """
+
+    def __init__(self, content_type: str, response_mode: Optional[str] = None, include_snippets: bool = True):
+        self.kind = body_kind(content_type)
+        self.done = False
+        self._model_mode = response_mode == MODEL_MODE
+        self._include_snippets = include_snippets
+        self._buffer = b""
+        self._pieces: List[bytes] = []
+        self._event: Optional[str] = None
+        self._data: List[str] = []
+
+    def feed(self, data: bytes) -> List[AnswerChunk]:
+        """Parses a piece of the body and returns the chunks it completed."""
+        if self.done:
+            return []
+        if self.kind == JSON:
+            self._pieces.append(data) # Parsed as a whole by finish()
+            return []
+        self._buffer += data
+        *lines, self._buffer = self._buffer.split(b"\n")
+        chunks = []
+        for line in lines:
+            chunk = self._line(line.rstrip(b"\r").decode("utf-8"))
+            if chunk is not None:
+                chunks.append(chunk)
+            if self.done:
+                break
+        return chunks
+
+    def finish(self) -> List[AnswerChunk]:
+        """Parses what is left once the body ended."""
+        if self.done:
+            return []
+        if self.kind == JSON:
+            self.done = True
+            body = b"".join(self._pieces).decode("utf-8")
+            chunk = self._chunk("message", body) if body.strip() else None
+            return [chunk] if chunk is not None else []
+        buffer, self._buffer = self._buffer, b""
+        chunks = [chunk for chunk in (self._line(buffer.decode("utf-8")), self._line("")) if chunk is not None]
+        self.done = True
+        return chunks
+
+    def _line(self, line: str) -> Optional[AnswerChunk]:
+        if self.kind == NDJSON:
+            return self._chunk("message", line) if line.strip() else None
+        if not line: # A blank line dispatches the event
+            event, data = self._event or "message", "\n".join(self._data)
+            self._event, self._data = None, []
+            return self._chunk(event, data) if data or event == "done" else None
+        if line.startswith(":"): # Comment, e.g. a keep-alive
+            return None
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if name == "event":
+            self._event = value
+        elif name == "data":
+            self._data.append(value)
+        return None
+
+    def _chunk(self, event: str, data: str) -> Optional[AnswerChunk]:
+        if event == "done" or data.strip() == "[DONE]":
+            self.done = True
+            if not data.strip() or data.strip() == "[DONE]":
+                return None
+        try:
+            value = loads_json(data)
+        except ValueError as e:
+            if event == "error":
+                raise RagulaError(status_code=500, message=data) from None
+            raise RagulaError(status_code=502, message=f"Malformed answer stream: {e}") from e
+        if not isinstance(value, dict):
+            return AnswerChunk(text=value) if isinstance(value, str) else None
+        if event == "error" or "error" in value:
+            self.done = True
+            error = value.get("error", value)
+            message = error.get("message", str(error)) if isinstance(error, dict) else str(error)
+            raise RagulaError(status_code=int(value.get("statusCode") or 500), message=message)
+
+        text = next((value[key] for key in _TEXT_KEYS if isinstance(value.get(key), str)), "")
+        results = next((value[key] for key in _SOURCE_KEYS if isinstance(value.get(key), list)), [])
+        if not text and not results:
+            return None
+        return AnswerChunk(text=text, results=[self._result(item) for item in results])
+
+    def _result(self, item: Any) -> Any:
+        if not self._include_snippets and isinstance(item, dict):
+            item.pop("contentSnippet", None)
+        if not self._model_mode:
+            return item
+        try:
+            return type_adapter("QueryResultItem").validate_python(item)
+        except ValueError as e: # pydantic's ValidationError
+            raise RagulaError(status_code=502, message=f"Unexpected answer stream: {e}") from e
+
+
+class _Answer:
+    """The answer and sources received so far."""
+
+    def __init__(self) -> None:
+        self.parts: List[str] = []
+        self.results: List[Any] = []
+        self.complete = False
+
+    def accept(self, chunk: AnswerChunk) -> AnswerChunk:
+        if chunk.text:
+            self.parts.append(chunk.text)
+        self.results.extend(chunk.results)
+        return chunk
+
+
+# The readers are module functions so a stream and its reader do not reference each
+# other: a stream dropped unread is freed (and its connection released) right away.
+def _read(response: "requests.Response", parser: AnswerParser, answer: _Answer) -> Iterator[AnswerChunk]:
+    try:
+        # chunk_size=None hands over data as it arrives instead of waiting for a full buffer.
+        for data in response.iter_content(chunk_size=None):
+            for chunk in parser.feed(data):
+                yield answer.accept(chunk)
+            if parser.done:
+                break
+        for chunk in parser.finish():
+            yield answer.accept(chunk)
+        answer.complete = True
+    finally:
+        response.close()
+
+
+async def _aread(response: "httpx.Response", parser: AnswerParser, answer: _Answer) -> AsyncIterator[AnswerChunk]:
+    try:
+        async for data in response.aiter_bytes():
+            for chunk in parser.feed(data):
+                yield answer.accept(chunk)
+            if parser.done:
+                break
+        for chunk in parser.finish():
+            yield answer.accept(chunk)
+        answer.complete = True
+    finally:
+        await response.aclose()
+
+
+class _AnswerStreamBase:
+    def __init__(self, response: Any, response_mode: Optional[str], include_snippets: bool) -> None:
+        self._response = response
+        self._parser = AnswerParser(response.headers.get("Content-Type", ""), response_mode, include_snippets)
+        self._answer = _Answer()
+
+    @property
+    def answer(self) -> str:
+        """The answer text received so far."""
+        return "".join(self._answer.parts)
+
+    @property
+    def results(self) -> List[Any]:
+        """The sources received so far."""
+        return self._answer.results
+
+    @property
+    def complete(self) -> bool:
+        """Whether the whole answer was received."""
+        return self._answer.complete
+
+
+class AnswerStream(_AnswerStreamBase):
+    """
+    Iterator over the AnswerChunks of a streamed answer, returned by
+    QueryService.ask_question_stream.
+
+    The pooled connection is released when the stream is exhausted, closed, left
+    as a context manager, or dropped, including when it is abandoned early.
+    """
+
+    def __init__(self, response: "requests.Response", response_mode: Optional[str] = None,
+                 include_snippets: bool = True):
+        super().__init__(response, response_mode, include_snippets)
+        self._chunks = _read(response, self._parser, self._answer)
+
+    def __iter__(self) -> Iterator[AnswerChunk]:
+        return self
+
+    def __next__(self) -> AnswerChunk:
+        return next(self._chunks)
+
+    def __enter__(self) -> "AnswerStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stops reading and releases the connection."""
+        self._chunks.close()
+        self._response.close()
+
+    def __del__(self) -> None:
+        self._response.close()
+
+
+class AsyncAnswerStream(_AnswerStreamBase):
+    """
+    Asyncio counterpart of AnswerStream, returned by AsyncQueryService.ask_question_stream.
+
+    Use it with "async with" (or call aclose()) when it may be abandoned early;
+    cancelling the consuming task also releases the connection.
+    """
+
+    def __init__(self, response: "httpx.Response", response_mode: Optional[str] = None,
+                 include_snippets: bool = True):
+        super().__init__(response, response_mode, include_snippets)
+        self._chunks = _aread(response, self._parser, self._answer)
+
+    def __aiter__(self) -> AsyncIterator[AnswerChunk]:
+        return self
+
+    async def __anext__(self) -> AnswerChunk:
+        return await self._chunks.__anext__()
+
+    async def __aenter__(self) -> "AsyncAnswerStream":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Stops reading and releases the connection."""
+        await self._chunks.aclose()
+        await self._response.aclose()
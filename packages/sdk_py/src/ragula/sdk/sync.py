@@ -0,0 +1,410 @@
+import fnmatch
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set, Tuple
+
+from .client import RagulaError
+from .manifest import ManifestEntry, SyncManifest, hash_file
+from .models import CreateFolderPayload
+from .parsing import to_json_value
+
+if TYPE_CHECKING:
+    from .client import RagulaClient
+
+# Default number of uploads in flight during a directory sync.
+DEFAULT_SYNC_CONCURRENCY = 8
+
+
+@dataclass
+class SyncFailure:
+    """A local file that could not be synced, and why."""
+    path: str
+    error: Exception
+
+
+@dataclass
+class SyncSummary:
+    """Outcome of a sync_directory run. Paths are relative to the synced directory."""
+    uploaded: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    failed: List[SyncFailure] = field(default_factory=list)
+    folders_created: int = 0
+    bytes_uploaded: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_uploaded / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _matches(rel_path: str, patterns: Sequence[str]) -> bool:
+    """Matches a relative POSIX path, or its final component, against glob patterns."""
+    name = rel_path.rsplit("/", 1)[-1]
+    return any(
+        fnmatch.fnmatchcase(rel_path, pattern) or fnmatch.fnmatchcase(name, pattern)
+        for pattern in patterns
+    )
+
+
+def _scan(
+    local_path: str,
+    include: Optional[Sequence[str]],
+    exclude: Optional[Sequence[str]],
+    follow_symlinks: bool,
+) -> List[Tuple[str, str]]:
+    """Returns (relative POSIX path, absolute path) for every selected file, sorted."""
+    selected = []
+    for dirpath, dirnames, filenames in os.walk(local_path, followlinks=follow_symlinks):
+        rel_dir = os.path.relpath(dirpath, local_path).replace(os.sep, "/")
+        rel_dir = "" if rel_dir == "." else rel_dir + "/"
+        if exclude:
+            dirnames[:] = [d for d in dirnames if not _matches(rel_dir + d, exclude)]
+        dirnames.sort()
+        for filename in sorted(filenames):
+            rel_path = rel_dir + filename
+            if include and not _matches(rel_path, include):
+                continue
+            if exclude and _matches(rel_path, exclude):
+                continue
+            abs_path = os.path.join(dirpath, filename)
+            if not follow_symlinks and os.path.islink(abs_path):
+                continue
+            selected.append((rel_path, abs_path))
+    return selected
+
+
+def _same_stat(before: os.stat_result, after: os.stat_result) -> bool:
+    return before.st_size == after.st_size and before.st_mtime_ns == after.st_mtime_ns
+
+
+def _changed_error(rel_path: str) -> RagulaError:
+    return RagulaError(status_code=409, message=f"Skipped: {rel_path} changed while it was being synced.")
+
+
+class SyncService:
+    """
+    Bulk ingestion of local directory trees into a collection.
+    """
+    def __init__(self, client: 'RagulaClient'):
+        self._client = client
+
+    def sync_directory(
+        self,
+        collection_id: str,
+        local_path: str,
+        parent_folder_id: Optional[str] = None,
+        include: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        concurrency: int = DEFAULT_SYNC_CONCURRENCY,
+        follow_symlinks: bool = False,
+        manifest_path: Optional[str] = None,
+        delete_missing: bool = False,
+    ) -> SyncSummary:
+        """
+        Uploads a local directory tree into a collection, mirroring its folders.
+
+        Subdirectories that contain files to upload are mirrored as Ragula folders,
+        reusing existing folders with the same name and creating the rest parents
+        before children. Files are then uploaded through a bounded thread pool. A
+        failed upload is recorded in the summary and does not stop the run.
+
+        With manifest_path set, the sync is incremental: files whose size and mtime
+        match the manifest are skipped without being read, files whose stat changed
+        are hashed and only re-uploaded if their content changed (the superseded
+        remote file is then deleted), and, with delete_missing, remote files whose
+        local path disappeared are deleted. The manifest is updated after every
+        file, so rerunning an interrupted sync resumes where it stopped; remote
+        copies of uploads it did not record are deleted. A manifest belongs to one
+        collection, local_path and parent_folder_id.
+
+        Args:
+            collection_id (str): The ID of the collection to upload into.
+            local_path (str): The local directory to sync.
+            parent_folder_id (Optional[str]): Remote folder to mirror into. If None,
+                                              the tree is mirrored at the collection root.
+            include (Optional[Sequence[str]]): Glob patterns a file must match to be
+                                               uploaded (matched against the relative path
+                                               and the file name). All files if None.
+            exclude (Optional[Sequence[str]]): Glob patterns for files and directories to skip.
+            concurrency (int): Maximum number of uploads in flight at once.
+            follow_symlinks (bool): Whether to follow symbolic links.
+            manifest_path (Optional[str]): Location of the local sync manifest. Enables
+                                           incremental mode.
+            delete_missing (bool): In incremental mode, delete remote files whose local
+                                   file no longer exists (or is no longer selected).
+                                   Off by default.
+
+        Returns:
+            SyncSummary: Uploaded, skipped, deleted and failed paths, folders created
+                         and throughput.
+
+        Raises:
+            ValueError: If local_path is not a directory, concurrency is below 1, or the
+                        manifest belongs to another collection, directory or parent folder.
+        """
+        if not os.path.isdir(local_path):
+            raise ValueError(f"'{local_path}' is not a directory.")
+        if concurrency < 1:
+            raise ValueError("'concurrency' must be at least 1.")
+
+        started = time.monotonic()
+        summary = SyncSummary()
+        files = _scan(local_path, include, exclude, follow_symlinks)
+        selected = {rel_path for rel_path, _ in files}
+        manifest = None
+        if manifest_path:
+            manifest = SyncManifest(manifest_path, collection_id, local_path, parent_folder_id)
+
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                if manifest is not None:
+                    # Finish deletions left over from an interrupted run first.
+                    self._reconcile_uploads(collection_id, manifest, pool)
+                    self._delete_superseded(collection_id, manifest, pool)
+                    files = self._select_changed(files, manifest, summary)
+
+                folder_ids, folder_errors = self._mirror_folders(
+                    collection_id, [rel for rel, _ in files], parent_folder_id, pool, summary
+                )
+
+                def upload(item: Tuple[str, str]) -> Tuple[str, int, Optional[Exception]]:
+                    rel_path, abs_path = item
+                    rel_dir = rel_path.rpartition("/")[0]
+                    if rel_dir in folder_errors:
+                        return rel_path, -1, folder_errors[rel_dir]
+                    try:
+                        return self._upload_one(
+                            collection_id, rel_path, abs_path, folder_ids[rel_dir], manifest
+                        )
+                    except (RagulaError, OSError) as e:
+                        return rel_path, -1, e
+
+                for rel_path, size, error in pool.map(upload, files):
+                    if error is not None:
+                        summary.failed.append(SyncFailure(rel_path, error))
+                    elif size < 0:
+                        summary.skipped.append(rel_path)
+                    else:
+                        summary.uploaded.append(rel_path)
+                        summary.bytes_uploaded += size
+
+                if manifest is not None:
+                    self._delete_superseded(collection_id, manifest, pool)
+                    if delete_missing:
+                        self._delete_missing(collection_id, manifest, selected, summary, pool)
+        finally:
+            if manifest is not None:
+                manifest.close()
+
+        summary.elapsed = time.monotonic() - started
+        return summary
+
+    def _select_changed(
+        self, files: List[Tuple[str, str]], manifest: SyncManifest, summary: SyncSummary
+    ) -> List[Tuple[str, str]]:
+        """Skips files whose size and mtime match the manifest; returns the rest."""
+        changed = []
+        for rel_path, abs_path in files:
+            entry = manifest.get(rel_path)
+            if entry is not None:
+                try:
+                    stat = os.stat(abs_path)
+                except OSError as e:
+                    summary.failed.append(SyncFailure(rel_path, e))
+                    continue
+                if entry.size == stat.st_size and entry.mtime_ns == stat.st_mtime_ns:
+                    summary.skipped.append(rel_path)
+                    continue
+            changed.append((rel_path, abs_path))
+        return changed
+
+    def _upload_one(
+        self,
+        collection_id: str,
+        rel_path: str,
+        abs_path: str,
+        folder_id: Optional[str],
+        manifest: Optional[SyncManifest],
+    ) -> Tuple[str, int, Optional[Exception]]:
+        """Uploads one file. Returns a size of -1 if its content was unchanged."""
+        stat = os.stat(abs_path)
+        if manifest is None:
+            self._client.files.upload_file(collection_id, file_path=abs_path, folder_id=folder_id)
+            return rel_path, stat.st_size, None
+
+        previous = manifest.get(rel_path)
+        digest = hash_file(abs_path)
+        if not _same_stat(stat, os.stat(abs_path)):
+            # The digest may not match the stat; nothing is recorded, so the next run retries.
+            raise _changed_error(rel_path)
+        if previous is not None and previous.sha256 == digest:
+            # Only the stat changed (e.g. the file was touched); nothing to upload.
+            manifest.touch(rel_path, stat.st_size, stat.st_mtime_ns)
+            return rel_path, -1, None
+
+        manifest.begin_upload(rel_path, folder_id)
+        uploaded = to_json_value(
+            self._client.files.upload_file(collection_id, file_path=abs_path, folder_id=folder_id)
+        )
+        file_id = uploaded.get("id") if isinstance(uploaded, dict) else None
+        if not file_id:
+            raise RagulaError(status_code=502, message=f"Upload of {rel_path} returned no file id.")
+        manifest.record(
+            ManifestEntry(rel_path, stat.st_size, stat.st_mtime_ns, digest, file_id),
+            replaced_file_id=previous.file_id if previous is not None else None,
+        )
+        if not _same_stat(stat, os.stat(abs_path)):
+            # Changed during the upload: the recorded stat no longer matches, so the next run re-checks it.
+            raise _changed_error(rel_path)
+        return rel_path, stat.st_size, None
+
+    def _delete_remote(self, collection_id: str, file_id: str) -> Optional[RagulaError]:
+        """Deletes a remote file, treating an already-missing file as deleted."""
+        try:
+            self._client.files.delete_file(collection_id, file_id)
+        except RagulaError as e:
+            if e.status_code != 404:
+                return e
+        return None
+
+    def _delete_superseded(self, collection_id: str, manifest: SyncManifest, pool: ThreadPoolExecutor) -> None:
+        """Deletes remote files replaced by newer uploads. Failures are retried next run."""
+        def delete(file_id: str) -> None:
+            if self._delete_remote(collection_id, file_id) is None:
+                manifest.clear_pending_delete(file_id)
+
+        list(pool.map(delete, manifest.pending_deletes()))
+
+    def _reconcile_uploads(self, collection_id: str, manifest: SyncManifest, pool: ThreadPoolExecutor) -> None:
+        """
+        Deletes remote copies of uploads an interrupted run did not record, so they are
+        not duplicated when the file is uploaded again. Failures are retried next run.
+        """
+        def reconcile(item: Tuple[str, Optional[str]]) -> None:
+            rel_path, folder_id = item
+            name = rel_path.rpartition("/")[2]
+            entry = manifest.get(rel_path)
+            try:
+                listed = [
+                    to_json_value(file)
+                    for file in self._client.files.iter_files(collection_id, folder_id, prefetch=False)
+                ]
+            except RagulaError:
+                return
+            untracked = [
+                file["id"] for file in listed
+                # The API lists every file when no folder is given; keep only direct children.
+                if file.get("name") == name and file.get("folderId") == folder_id
+                and (entry is None or file["id"] != entry.file_id)
+            ]
+            errors = [self._delete_remote(collection_id, file_id) for file_id in untracked]
+            if not any(errors):
+                manifest.clear_pending_upload(rel_path)
+
+        list(pool.map(reconcile, manifest.pending_uploads()))
+
+    def _delete_missing(
+        self,
+        collection_id: str,
+        manifest: SyncManifest,
+        selected: Set[str],
+        summary: SyncSummary,
+        pool: ThreadPoolExecutor,
+    ) -> None:
+        """Deletes remote files whose local path is no longer part of the sync."""
+        missing = [path for path in manifest.paths() if path not in selected]
+
+        def delete(path: str) -> Tuple[str, Optional[RagulaError]]:
+            entry = manifest.get(path)
+            error = self._delete_remote(collection_id, entry.file_id) if entry else None
+            if error is None:
+                manifest.remove(path)
+            return path, error
+
+        for path, error in pool.map(delete, sorted(missing)):
+            if error is None:
+                summary.deleted.append(path)
+            else:
+                summary.failed.append(SyncFailure(path, error))
+
+    def _mirror_folders(
+        self,
+        collection_id: str,
+        rel_files: List[str],
+        root_id: Optional[str],
+        pool: ThreadPoolExecutor,
+        summary: SyncSummary,
+    ) -> Tuple[Dict[str, Optional[str]], Dict[str, Exception]]:
+        """
+        Ensures a remote folder exists for every directory holding a selected file.
+
+        Directories are processed one depth level at a time so parents always exist
+        before their children; folders within a level are resolved concurrently.
+
+        Returns:
+            A map of relative directory -> remote folder ID ("" maps to root_id), and a
+            map of relative directory -> error for directories that could not be created.
+        """
+        needed = set()
+        for rel_path in rel_files:
+            rel_dir = rel_path.rpartition("/")[0]
+            while rel_dir and rel_dir not in needed:
+                needed.add(rel_dir)
+                rel_dir = rel_dir.rpartition("/")[0]
+
+        folder_ids: Dict[str, Optional[str]] = {"": root_id}
+        errors: Dict[str, Exception] = {}
+        by_depth: Dict[int, List[str]] = {}
+        for rel_dir in needed:
+            by_depth.setdefault(rel_dir.count("/"), []).append(rel_dir)
+
+        for depth in sorted(by_depth):
+            by_parent: Dict[str, List[str]] = {}
+            for rel_dir in sorted(by_depth[depth]):
+                parent = rel_dir.rpartition("/")[0]
+                if parent in errors:
+                    errors[rel_dir] = errors[parent]
+                else:
+                    by_parent.setdefault(parent, []).append(rel_dir)
+
+            def resolve(item: Tuple[str, List[str]]) -> List[Tuple[str, Optional[str], Optional[Exception], bool]]:
+                parent, children = item
+                parent_id = folder_ids[parent]
+                try:
+                    existing = {
+                        folder["name"]: folder["id"]
+                        for folder in to_json_value(
+                            self._client.folders.list_folders(collection_id, parent_id=parent_id)
+                        ) or []
+                        # The API lists root folders when no parent is given; keep only direct children.
+                        if folder.get("parentId") == parent_id
+                    }
+                except RagulaError as e:
+                    return [(child, None, e, False) for child in children]
+                outcome = []
+                for child in children:
+                    name = child.rpartition("/")[2]
+                    if name in existing:
+                        outcome.append((child, existing[name], None, False))
+                        continue
+                    try:
+                        created = to_json_value(self._client.folders.create_folder(
+                            collection_id, CreateFolderPayload(name=name, parentId=parent_id)
+                        ))
+                        outcome.append((child, created["id"], None, True))
+                    except RagulaError as e:
+                        outcome.append((child, None, e, False))
+                return outcome
+
+            for outcome in pool.map(resolve, sorted(by_parent.items())):
+                for rel_dir, folder_id, error, created in outcome:
+                    if error is not None:
+                        errors[rel_dir] = error
+                    else:
+                        folder_ids[rel_dir] = folder_id
+                        summary.folders_created += int(created)
+
+        return folder_ids, errors
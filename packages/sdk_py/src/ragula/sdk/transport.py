@@ -0,0 +1,119 @@
+"""
+Connection pool and timeout configuration for the Ragula clients.
+"""
+
+import socket
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+# (connect timeout, read timeout) in seconds, as accepted by requests.
+TimeoutPair = Tuple[float, float]
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 32
+
+
+@dataclass(frozen=True)
+class Timeouts:
+    """
+    Per-operation (connect, read) timeouts in seconds.
+
+    Attributes:
+        default: Used for collection, folder and file metadata calls.
+        query: Used for query_collection / ask_question, which should fail fast.
+        upload: Used for file uploads, where the read timeout covers server-side
+                processing of a large body.
+    """
+    default: TimeoutPair = (5.0, 60.0)
+    query: TimeoutPair = (5.0, 30.0)
+    upload: TimeoutPair = (10.0, 600.0)
+
+
+def clamp_timeout(timeout: TimeoutPair, remaining: Optional[float]) -> TimeoutPair:
+    """Shortens a timeout pair so it never exceeds the remaining deadline budget."""
+    if remaining is None:
+        return timeout
+    return (min(timeout[0], remaining), min(timeout[1], remaining))
+
+
+def keepalive_socket_options(idle: int = 60, interval: int = 10, count: int = 5) -> List[Tuple[int, int, int]]:
+    """
+    Socket options enabling TCP keep-alive probes, so idle pooled connections are
+    kept open through NATs and load balancers and dead peers are detected.
+    Options the platform does not support are skipped.
+    """
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    for name, value in (("TCP_KEEPIDLE", idle), ("TCP_KEEPINTVL", interval), ("TCP_KEEPCNT", count)):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections carry extra socket options."""
+
+    def __init__(self, socket_options: List[Tuple[int, int, int]], **kwargs: Any):
+        self._socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + self._socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+def build_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False,
+    tcp_keepalive: bool = True,
+) -> requests.Session:
+    """
+    Creates a requests.Session with a sized connection pool.
+
+    Args:
+        pool_connections: Number of per-host pools to cache.
+        pool_maxsize: Connections kept per host. Set it to at least the number of
+                      threads sharing the client to avoid "connection pool is full"
+                      discards and repeated TLS handshakes.
+        pool_block: Block when the pool is exhausted instead of opening (and then
+                    discarding) extra connections.
+        tcp_keepalive: Enable TCP keep-alive probes on pooled connections.
+    """
+    session = requests.Session()
+    adapter_kwargs = dict(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        max_retries=0, # Retries are handled by RetryPolicy
+    )
+    if tcp_keepalive:
+        adapter: HTTPAdapter = _KeepAliveAdapter(keepalive_socket_options(), **adapter_kwargs)
+    else:
+        adapter = HTTPAdapter(**adapter_kwargs)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def resolve_environment(session: requests.Session, url: str) -> None:
+    """
+    Applies the proxy, CA bundle and netrc settings the environment defines for
+    url to the session once, and stops requests from re-reading them.
+
+    With trust_env set, requests scans os.environ (and may read ~/.netrc) on
+    every call, which costs more than the rest of the request pipeline. All
+    calls of a client go to the same host, so the result never changes.
+    """
+    if not session.trust_env:
+        return
+    settings = session.merge_environment_settings(url, {}, None, None, None)
+    netrc_auth = requests.utils.get_netrc_auth(url)
+    session.trust_env = False
+    session.proxies.update(settings["proxies"])
+    session.verify = settings["verify"]
+    if netrc_auth and session.auth is None:
+        session.auth = netrc_auth
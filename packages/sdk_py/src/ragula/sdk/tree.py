@@ -0,0 +1,107 @@
+"""
+Folder tree walking support: walk() results and the optional snapshot cache.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+DEFAULT_WALK_CONCURRENCY = 8
+
+
+class WalkEntry(NamedTuple):
+    """
+    One folder visited by walk(), in the spirit of os.walk's (dirpath, dirnames, filenames).
+
+    Attributes:
+        path: Slash-separated folder names from the walk's top ("" for the top itself).
+        folder_id: The folder's ID, or None for the collection root.
+        folders: Direct subfolders, as returned by the client (dicts or models).
+        files: Files directly in the folder; empty when files were not requested.
+    """
+    path: str
+    folder_id: Optional[str]
+    folders: List[Any]
+    files: List[Any]
+
+
+def item_field(item: Any, key: str, attr: str) -> Any:
+    """Reads a field from a JSON dict (by API key) or a model (by attribute)."""
+    if isinstance(item, dict):
+        return item.get(key)
+    return getattr(item, attr)
+
+
+def child_path(path: str, name: str) -> str:
+    return f"{path}/{name}" if path else name
+
+
+def direct_children(
+    items: Optional[List[Any]], parent_id: Optional[str], key: str = "parentId", attr: str = "parent_id"
+) -> List[Any]:
+    """
+    Keeps the items listed directly in parent_id: folders by parentId, or files
+    with key="folderId", attr="folder_id".
+    """
+    # The API lists root folders when no parent is given; keep only direct children.
+    return [item for item in items or [] if item_field(item, key, attr) == parent_id]
+
+
+_SnapshotKey = Tuple[str, Optional[str], bool]
+# A stored level: (path, folder_id, folders, files), frozen so no caller can change it.
+_FrozenEntry = Tuple[str, Optional[str], Tuple[Any, ...], Tuple[Any, ...]]
+
+
+class TreeCache:
+    """
+    In-memory snapshots of walked folder trees.
+
+    A snapshot is keyed by collection, top folder and whether files were listed.
+    The owning client drops a collection's snapshots when it creates or deletes
+    folders or files in it; ttl bounds staleness from changes made elsewhere.
+    Every get() returns new folder and file lists, so callers may change them;
+    the items in them are shared and should be treated as read-only.
+    """
+
+    def __init__(self, ttl: float = 60.0):
+        """
+        Args:
+            ttl: Seconds a snapshot is served before the tree is walked again.
+        """
+        if ttl <= 0:
+            raise ValueError("'ttl' must be positive.")
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._snapshots: Dict[_SnapshotKey, Tuple[float, List[_FrozenEntry]]] = {}
+
+    def get(self, collection_id: str, folder_id: Optional[str], include_files: bool) -> Optional[List[WalkEntry]]:
+        """Returns the snapshot for a walk, or None if there is none or it expired."""
+        key = (collection_id, folder_id, include_files)
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is None:
+                return None
+            if snapshot[0] <= time.monotonic():
+                del self._snapshots[key]
+                return None
+            frozen = snapshot[1]
+        return [WalkEntry(path, entry_id, list(folders), list(files)) for path, entry_id, folders, files in frozen]
+
+    def set(self, collection_id: str, folder_id: Optional[str], include_files: bool, entries: List[WalkEntry]) -> None:
+        frozen = [(entry.path, entry.folder_id, tuple(entry.folders), tuple(entry.files)) for entry in entries]
+        with self._lock:
+            self._snapshots[(collection_id, folder_id, include_files)] = (time.monotonic() + self.ttl, frozen)
+
+    def invalidate_collection(self, collection_id: str) -> None:
+        """Drops every snapshot of a collection."""
+        with self._lock:
+            for key in [key for key in self._snapshots if key[0] == collection_id]:
+                del self._snapshots[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshots.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._snapshots)
@@ -0,0 +1,40 @@
+"""Shared fixtures for the SDK tests."""
+
+import asyncio
+import inspect
+import threading
+
+import pytest
+from ragula.sdk.async_client import AsyncRagulaClient
+from ragula.sdk.client import RagulaClient
+
+
+@pytest.fixture
+def fake_transport(monkeypatch):
+    """
+    Fixture returning a factory for clients whose _request is answered by a serve function.
+
+    serve(client, method, endpoint, **kwargs) receives the keyword arguments of _request and
+    returns the decoded body or raises a RagulaError; for an AsyncRagulaClient it may also be
+    a coroutine function. The threads that made requests are recorded in client.threads.
+    """
+    def make(serve, client_class=RagulaClient, **options):
+        client = client_class(token="t", base_url="http://localhost:8000", **options)
+        client.threads = set()
+        lock = threading.Lock()
+
+        def fake_request(method, endpoint, **kwargs):
+            with lock:
+                client.threads.add(threading.get_ident())
+            return serve(client, method, endpoint, **kwargs)
+
+        async def fake_async_request(method, endpoint, **kwargs):
+            await asyncio.sleep(0)
+            result = fake_request(method, endpoint, **kwargs)
+            return await result if inspect.isawaitable(result) else result
+
+        is_async = issubclass(client_class, AsyncRagulaClient)
+        monkeypatch.setattr(client, "_request", fake_async_request if is_async else fake_request)
+        return client
+
+    return make
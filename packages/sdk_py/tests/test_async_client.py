@@ -0,0 +1,121 @@
+"""Tests for the AsyncRagulaClient and its asyncio services."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from ragula.sdk import AsyncRagulaClient, RagulaError, RetryPolicy
+
+
+def make_client(handler):
+    """Builds an AsyncRagulaClient backed by an httpx.MockTransport."""
+    return AsyncRagulaClient(
+        token="test_api_key",
+        base_url="http://localhost:8000",
+        transport=httpx.MockTransport(handler),
+        retry=RetryPolicy(max_attempts=1),
+    )
+
+
+def test_async_client_initialization():
+    """Tests basic async client initialization."""
+    client = make_client(lambda request: httpx.Response(200, json={}))
+    assert client.base_url == "http://localhost:8000/api"
+    assert client.collections is not None
+    assert client.files is not None
+    assert client.folders is not None
+    assert client.query is not None
+    asyncio.run(client.aclose())
+
+
+def test_async_query_collection_sends_payload():
+    """Tests that query_collection posts the query and returns the JSON body."""
+    seen = {}
+
+    def handler(request):
+        seen["url"] = str(request.url)
+        seen["auth"] = request.headers.get("Authorization")
+        seen["body"] = json.loads(request.content)
+        return httpx.Response(200, json={"results": []})
+
+    async def run():
+        async with make_client(handler) as client:
+            return await client.query.query_collection("col-1", "What is RAG?")
+
+    assert asyncio.run(run()) == {"results": []}
+    assert seen["url"] == "http://localhost:8000/api/collections/col-1/query"
+    assert seen["auth"] == "Bearer test_api_key"
+    assert seen["body"] == {"query": "What is RAG?"}
+
+
+def test_async_error_maps_to_ragula_error():
+    """Tests that error responses raise RagulaError with the API message."""
+    def handler(request):
+        return httpx.Response(404, json={"message": "Collection not found"})
+
+    async def run():
+        async with make_client(handler) as client:
+            await client.collections.get_collection("missing")
+
+    with pytest.raises(RagulaError) as exc_info:
+        asyncio.run(run())
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.message == "Collection not found"
+
+
+def test_async_concurrent_queries():
+    """Tests that many queries can be awaited concurrently on one client."""
+    def handler(request):
+        query = json.loads(request.content)["query"]
+        return httpx.Response(200, json={"results": [{"fileId": query, "score": 1.0}]})
+
+    async def run():
+        async with make_client(handler) as client:
+            return await asyncio.gather(
+                *(client.query.query_collection("col-1", f"q{i}") for i in range(50))
+            )
+
+    responses = asyncio.run(run())
+    assert [r["results"][0]["fileId"] for r in responses] == [f"q{i}" for i in range(50)]
+
+
+def test_async_query_many_isolates_errors():
+    """Tests that a failing query in a batch is returned, not raised."""
+    def handler(request):
+        query = json.loads(request.content)["query"]
+        if query == "bad":
+            return httpx.Response(503, json={"message": "unavailable"})
+        return httpx.Response(200, json={"results": [{"fileId": query, "score": 1.0}]})
+
+    async def run():
+        async with make_client(handler) as client:
+            return await client.query.query_many("col-1", ["a", "bad", "c"], concurrency=2)
+
+    results = asyncio.run(run())
+    assert results[0]["results"][0]["fileId"] == "a"
+    assert isinstance(results[1], RagulaError) and results[1].status_code == 503
+    assert results[2]["results"][0]["fileId"] == "c"
+
+
+def test_async_upload_streams_with_content_length(tmp_path):
+    """Tests that async uploads send the streamed body with an exact length."""
+    path = tmp_path / "notes.txt"
+    path.write_bytes(b"hello" * 50000)
+    seen = {}
+
+    async def handler(request):
+        body = b"".join([chunk async for chunk in request.stream])
+        seen["length"] = int(request.headers["Content-Length"])
+        seen["chunked"] = "Transfer-Encoding" in request.headers
+        seen["body"] = body
+        return httpx.Response(201, json={"id": "file-1"})
+
+    async def run():
+        async with make_client(handler) as client:
+            return await client.files.upload_file("col-1", file_path=str(path))
+
+    assert asyncio.run(run()) == {"id": "file-1"}
+    assert seen["length"] == len(seen["body"])
+    assert not seen["chunked"]
+    assert b'filename="notes.txt"' in seen["body"]
@@ -0,0 +1,33 @@
+"""Smoke tests keeping the benchmark harness and mock server working."""
+
+import pytest
+from benchmarks.bench_sdk import format_table, run_benchmarks
+from benchmarks.mock_server import MockConfig, MockRagulaServer
+from ragula.sdk.client import RagulaClient, RagulaError
+from ragula.sdk.retry import RetryPolicy
+
+
+def test_mock_server_serves_sdk_calls():
+    """Tests the mock API against the real client, including injected errors."""
+    with MockRagulaServer(MockConfig(results=3, list_size=7)) as server:
+        with RagulaClient(token="t", base_url=server.base_url) as client:
+            assert len(client.query.query_collection("c1", "q")["results"]) == 3
+            assert len(list(client.files.iter_files("c1", page_size=3))) == 7
+            assert client.collections.get_collection_status("c1")["status"] == "ready"
+
+    config = MockConfig(error_rate=1.0)
+    with MockRagulaServer(config) as server:
+        client = RagulaClient(token="t", base_url=server.base_url, retry=RetryPolicy(max_attempts=2, backoff_base=0.001))
+        with pytest.raises(RagulaError) as excinfo:
+            client.collections.list_collections()
+        assert excinfo.value.status_code == 503
+        assert server.requests == 2
+
+
+def test_run_benchmarks_reports_every_scenario():
+    """Tests a tiny end-to-end benchmark run."""
+    results = run_benchmarks(MockConfig(list_size=50), requests=20, concurrency=4, upload_mb=1)
+    names = [result.name for result in results]
+    assert "sync_query" in names and "memory_upload_1mb" in names
+    assert all(result.calls and result.throughput > 0 for result in results)
+    assert "p99 ms" in format_table(results)
@@ -0,0 +1,100 @@
+"""Tests for bulk file deletes and recursive folder deletes."""
+
+import asyncio
+
+import pytest
+from ragula.sdk.async_client import AsyncRagulaClient
+from ragula.sdk.client import RagulaError
+from ragula.sdk.retry import RetryPolicy
+
+# id -> (name, parent id); "top" is the folder being deleted.
+FOLDERS = {"top": ("top", None), "a": ("a", "top"), "b": ("b", "top"), "c": ("c", "a")}
+FILES = {"top": ["f1"], "a": ["f2", "f3"], "c": ["f4"]}
+
+
+def serve(client, method, endpoint, params=None, **kwargs):
+    """Serves listings of a fixed tree and records deletes."""
+    params = params or {}
+    if method == "DELETE":
+        kind, item_id = endpoint.split("/")[-2:]
+        client.deleted.append((kind, item_id))
+        if item_id in client.failing:
+            raise RagulaError(status_code=500, message="boom")
+        if item_id in client.missing:
+            raise RagulaError(status_code=404, message="not found")
+        return None
+    if endpoint.endswith("/folders"):
+        parent = params.get("parentId")
+        return [{"id": fid, "name": name, "parentId": pid} for fid, (name, pid) in FOLDERS.items() if pid == parent]
+    folder_id = params.get("folderId")
+    return [{"id": fid, "name": fid, "folderId": folder_id} for fid in FILES.get(folder_id, [])]
+
+
+@pytest.fixture
+def bulk_client(fake_transport, monkeypatch):
+    """Fixture creating a client that serves a fixed tree and records deletes."""
+    client = fake_transport(serve)
+    client.deleted, client.failing, client.missing = [], set(), set()
+    monkeypatch.setattr(client, "_invalidate_collection", lambda collection_id: client.deleted.append("invalidate"))
+    return client
+
+
+def test_delete_files_reports_per_item(bulk_client):
+    """Tests input-ordered results, 404 as success and a single invalidation."""
+    bulk_client.failing.add("bad")
+    bulk_client.missing.add("gone")
+    results = bulk_client.files.delete_files("c1", ["x", "bad", "gone", "y"], concurrency=4)
+    assert [(r.item.item_id, r.ok) for r in results] == [("x", True), ("bad", False), ("gone", True), ("y", True)]
+    assert bulk_client.deleted.count("invalidate") == 1
+
+
+def test_dry_run_plans_bottom_up_without_deleting(bulk_client):
+    """Tests that the plan lists files first, then folders deepest first."""
+    report = bulk_client.folders.delete_folder_recursive("c1", "top", dry_run=True)
+    assert report.dry_run and report.results == []
+    assert bulk_client.deleted == []
+    plan = report.plan
+    assert sorted(item.path for item in plan.files) == ["a/c/f4", "a/f2", "a/f3", "f1"]
+    assert [(item.item_id, item.depth) for item in plan.folders] == [("c", 2), ("a", 1), ("b", 1), ("top", 0)]
+    assert len(plan) == 8
+
+
+def test_recursive_delete_executes_plan(bulk_client):
+    """Tests that every file is deleted before any folder, and parents after children."""
+    plan = bulk_client.folders.plan_delete("c1", "top")
+    report = bulk_client.folders.delete_folder_recursive("c1", "top", plan=plan, concurrency=4)
+    assert report.failed == []
+    order = [entry for entry in bulk_client.deleted if entry != "invalidate"]
+    assert {kind for kind, _ in order[:4]} == {"files"}
+    folders = [item_id for kind, item_id in order if kind == "folders"]
+    assert folders.index("c") < folders.index("a") < folders.index("top")
+
+
+def test_failure_skips_ancestor_folders(bulk_client):
+    """Tests that folders still holding a failed item are skipped, others proceed."""
+    bulk_client.failing.add("f4")
+    report = bulk_client.folders.delete_folder_recursive("c1", "top")
+    failed = {result.item.item_id: result.error.status_code for result in report.failed}
+    assert failed == {"f4": 500, "c": 409, "a": 409, "top": 409}
+    assert ("folders", "b") in bulk_client.deleted
+
+
+def test_results_follow_plan_order(bulk_client, monkeypatch):
+    """Tests that skipped and deleted items of a level are reported in plan order."""
+    monkeypatch.setitem(FILES, "b", ["f5"])
+    bulk_client.failing.add("f5") # Blocks "b", which the plan lists after "a"
+    report = bulk_client.folders.delete_folder_recursive("c1", "top")
+    assert [result.item for result in report.results] == list(report.plan)
+    assert [(r.item.item_id, r.ok) for r in report.results if r.item.kind == "folder"] == [
+        ("c", True), ("a", True), ("b", False), ("top", False)
+    ]
+
+
+def test_async_recursive_delete(fake_transport):
+    """Tests the asyncio recursive delete against the same tree."""
+    client = fake_transport(serve, AsyncRagulaClient, retry=RetryPolicy(max_attempts=1))
+    client.deleted, client.failing, client.missing = [], set(), set()
+    report = asyncio.run(client.folders.delete_folder_recursive("c1", "top", concurrency=2))
+    assert len(report.deleted) == 8
+    assert [result.item for result in report.results] == list(report.plan)
+    assert client.deleted[-1] == ("folders", "top")
@@ -0,0 +1,122 @@
+"""Tests for the QueryCache and its backends."""
+
+import json
+import time
+
+import pytest
+from ragula.sdk.cache import DiskCacheBackend, MemoryCacheBackend, QueryCache
+from ragula.sdk.client import RagulaClient
+
+
+@pytest.fixture(params=["memory", "disk"])
+def backend(request, tmp_path):
+    """Fixture yielding each cache backend with room for two entries."""
+    if request.param == "memory":
+        yield MemoryCacheBackend(max_entries=2)
+    else:
+        disk = DiskCacheBackend(str(tmp_path / "cache.sqlite3"), max_entries=2)
+        yield disk
+        disk.close()
+
+
+@pytest.fixture
+def counting_client(monkeypatch):
+    """Fixture creating a cached client whose _request counts network calls."""
+    client = RagulaClient(token="test_api_key", base_url="http://localhost:8000", query_cache=QueryCache())
+    calls = []
+
+    def fake_request(method, endpoint, json_data=None, response_mode=None, **kwargs):
+        calls.append((method, endpoint))
+        if method == "POST" and endpoint.endswith("/query"):
+            body = b'{"results": [{"fileId": "f1", "score": 0.9}]}'
+            return body if response_mode == "raw" else json.loads(body)
+        return None
+
+    monkeypatch.setattr(client, "_request", fake_request)
+    client.calls = calls
+    return client
+
+
+def test_backend_lru_eviction(backend):
+    """Tests that the least recently used entry is evicted first."""
+    backend.set("a", "c1", '"A"', ttl=60)
+    time.sleep(0.01)
+    backend.set("b", "c1", '"B"', ttl=60)
+    time.sleep(0.01)
+    assert backend.get("a") == '"A"'  # "a" becomes most recently used
+    time.sleep(0.01)
+    backend.set("c", "c1", '"C"', ttl=60)
+    assert backend.get("b") is None
+    assert backend.get("a") == '"A"'
+    assert backend.get("c") == '"C"'
+
+
+def test_backend_ttl_and_invalidation(backend):
+    """Tests per-entry expiry and per-collection invalidation."""
+    backend.set("short", "c1", "1", ttl=0.01)
+    backend.set("other", "c2", "2", ttl=60)
+    time.sleep(0.02)
+    assert backend.get("short") is None
+    backend.invalidate_collection("c2")
+    assert backend.get("other") is None
+    assert len(backend) == 0
+
+
+def test_disk_backend_shared_between_instances(tmp_path):
+    """Tests that two handles on the same file see each other's entries."""
+    path = str(tmp_path / "shared.sqlite3")
+    first, second = DiskCacheBackend(path), DiskCacheBackend(path)
+    first.set("k", "c1", '{"x": 1}', ttl=60)
+    assert second.get("k") == '{"x": 1}'
+    second.invalidate_collection("c1")
+    assert first.get("k") is None
+    first.close()
+    second.close()
+
+
+def test_query_key_normalizes_whitespace():
+    """Tests that whitespace differences map to the same key."""
+    assert QueryCache.make_key("c1", "query", {"query": "  what is\nRAG "}) == QueryCache.make_key(
+        "c1", "query", {"query": "what is RAG"}
+    )
+    assert QueryCache.make_key("c1", "query", {"query": "q"}) != QueryCache.make_key(
+        "c1", "question", {"query": "q"}
+    )
+
+
+def test_get_and_set_share_entries_with_the_body_methods():
+    """Tests that decoded and raw access read the same entries and count each lookup once."""
+    cache = QueryCache()
+    cache.set("c1", "query", {"query": "q"}, {"results": []})
+    assert cache.get_body("c1", "query", {"query": "q"}) == b'{"results":[]}'
+    cache.set_body("c1", "query", {"query": "r"}, b'{"results": [1]}')
+    assert cache.get("c1", "query", {"query": "r"}) == {"results": [1]}
+    assert cache.get("c1", "query", {"query": "missing"}) is None
+    assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+
+
+def test_query_collection_served_from_cache(counting_client):
+    """Tests that repeated queries hit the cache and count hits/misses."""
+    first = counting_client.query.query_collection("c1", "What is RAG?")
+    second = counting_client.query.query_collection("c1", "What  is RAG?")
+    assert first == second
+    assert len(counting_client.calls) == 1
+    stats = counting_client.query_cache.stats
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda client: client.files.delete_file("c1", "f1"),
+        lambda client: client.files.upload_file("c1", file_content=b"data", file_name="a.txt"),
+        lambda client: client.folders.delete_folder("c1", "folder-1"),
+    ],
+)
+def test_mutations_invalidate_collection(counting_client, mutate):
+    """Tests that mutating a collection through the client drops its cached queries."""
+    counting_client.query.query_collection("c1", "q")
+    mutate(counting_client)
+    counting_client.query.query_collection("c1", "q")
+    query_calls = [call for call in counting_client.calls if call[1].endswith("/query")]
+    assert len(query_calls) == 2
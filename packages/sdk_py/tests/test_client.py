@@ -1,7 +1,11 @@
 """Tests for the RagulaClient, focusing on initialization and core attributes."""
 
+import io
+
 import pytest
-from ragula.sdk.client import RagulaClient
+import requests
+from ragula.sdk.client import RagulaClient, RagulaError
+from ragula.sdk.retry import RetryPolicy
 
 # TODO: Add comprehensive tests for RagulaClient
 
@@ -17,4 +21,67 @@ def test_client_initialization():
     assert client.folders is not None
     assert client.query is not None
 
-# Add more tests here for client methods, error handling, etc.
\ No newline at end of file
+# Add more tests here for client methods, error handling, etc.
+
+
+def make_response(status_code, body=b"{}", headers=None):
+    """Builds a requests.Response without touching the network."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.raw = io.BytesIO(body)
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.fixture
+def scripted_client(monkeypatch):
+    """Fixture creating a client whose session replays scripted outcomes."""
+    client = RagulaClient(
+        token="test_token",
+        base_url="http://localhost:8000",
+        retry=RetryPolicy(max_attempts=3, backoff_base=0.001, jitter=False),
+    )
+    client.script = []
+    client.calls = 0
+
+    def fake_request(**kwargs):
+        client.calls += 1
+        outcome = client.script.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(client._session, "request", fake_request)
+    return client
+
+
+def test_retries_transient_status_then_succeeds(scripted_client):
+    """Tests that a 503 followed by a 200 returns the successful body."""
+    scripted_client.script = [make_response(503), make_response(200, b'{"id": "c1"}')]
+    assert scripted_client.collections.get_collection("c1") == {"id": "c1"}
+    assert scripted_client.calls == 2
+
+
+def test_gives_up_after_max_attempts(scripted_client):
+    """Tests that the last error is raised once attempts are exhausted."""
+    scripted_client.script = [make_response(503, b'{"message": "busy"}')] * 3
+    with pytest.raises(RagulaError) as exc_info:
+        scripted_client.collections.list_collections()
+    assert exc_info.value.status_code == 503
+    assert scripted_client.calls == 3
+
+
+def test_upload_not_retried_after_server_error(scripted_client):
+    """Tests that a non-idempotent upload is not repeated on a 503."""
+    scripted_client.script = [make_response(503), make_response(201)]
+    with pytest.raises(RagulaError):
+        scripted_client.files.upload_file("c1", file_content=b"data", file_name="a.txt")
+    assert scripted_client.calls == 1
+
+
+def test_query_post_retried_on_read_timeout(scripted_client):
+    """Tests that read-only query POSTs are retried on transport failures."""
+    scripted_client.script = [requests.exceptions.ReadTimeout("slow"), make_response(200, b'{"results": []}')]
+    assert scripted_client.query.query_collection("c1", "q") == {"results": []}
+    assert scripted_client.calls == 2
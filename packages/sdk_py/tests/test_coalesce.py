@@ -0,0 +1,109 @@
+"""Tests for single-flight coalescing of identical in-flight reads."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import requests
+from ragula.sdk import AsyncRagulaClient, RagulaClient, RagulaError, RetryPolicy, SingleFlight
+
+BODY = b'{"results": [{"fileId": "f1", "score": 0.9, "contentSnippet": "text"}]}'
+
+
+@pytest.fixture
+def gated_client(monkeypatch):
+    """Fixture creating a coalescing client whose requests block until the test opens the gate."""
+    client = RagulaClient(token="t", base_url="http://localhost:8000", coalesce=True,
+                          retry=RetryPolicy(max_attempts=1))
+    client.sent, client.gate = [], threading.Event()
+
+    def fake_request(method, url, **kwargs):
+        client.sent.append((method, url, kwargs["data"]))
+        client.gate.wait(5)
+        response = requests.Response()
+        response.status_code = 500 if url.endswith("/broken/query") else 200
+        response._content = BODY
+        return response
+
+    monkeypatch.setattr(client._session, "request", fake_request)
+    yield client
+    client.gate.set()
+
+
+def run_concurrently(client, calls):
+    """Starts the calls on threads, opens the gate once all of them joined, and returns their outcomes."""
+    with ThreadPoolExecutor(len(calls)) as pool:
+        futures = [pool.submit(call) for call in calls]
+        while client.coalescer.stats().requests + client.coalescer.stats().coalesced < len(calls):
+            threading.Event().wait(0.01)
+        client.gate.set()
+        return [future.exception() or future.result() for future in futures]
+
+
+def test_identical_queries_share_one_request(gated_client):
+    """Tests that concurrent identical queries send one request and get independent results."""
+    results = run_concurrently(gated_client, [lambda: gated_client.query.query_collection("c1", "q")] * 4)
+    assert len(gated_client.sent) == 1
+    assert all(result == results[0] for result in results)
+    results[0]["results"].clear()
+    assert results[1]["results"][0]["fileId"] == "f1" # Every caller decoded its own copy
+    stats = gated_client.coalescer.stats()
+    assert (stats.requests, stats.coalesced, stats.coalesced_rate) == (1, 3, 0.75)
+    assert gated_client.coalescer.in_flight == 0 # Nothing is kept after completion
+
+
+def test_different_reads_and_writes_are_not_coalesced(gated_client):
+    """Tests that distinct payloads and non-idempotent calls each send their own request."""
+    run_concurrently(gated_client, [
+        lambda: gated_client.query.query_collection("c1", "q", top_k=3),
+        lambda: gated_client.query.query_collection("c1", "q", top_k=5),
+    ])
+    gated_client.gate.set()
+    gated_client._request("POST", "/collections", json_data={"name": "n"})
+    gated_client._request("POST", "/collections", json_data={"name": "n"})
+    assert len(gated_client.sent) == 4
+    assert gated_client.coalescer.stats().requests == 2
+
+
+def test_errors_reach_every_caller(gated_client):
+    """Tests that a failed shared request raises a separate RagulaError in each caller."""
+    errors = run_concurrently(gated_client, [lambda: gated_client.query.query_collection("broken", "q")] * 3)
+    assert len(gated_client.sent) == 1
+    assert all(isinstance(error, RagulaError) and error.status_code == 500 for error in errors)
+    assert len({id(error) for error in errors}) == 3
+
+
+def test_single_flight_runs_again_after_completion():
+    """Tests that a completed call is not reused by later callers."""
+    flight, calls = SingleFlight(), []
+    assert flight.do(b"k", lambda: calls.append(1) or len(calls)) == 1
+    assert flight.do(b"k", lambda: calls.append(1) or len(calls)) == 2
+
+
+def test_async_queries_share_one_request_and_survive_cancellation():
+    """Tests asyncio coalescing, and that cancelling one waiter does not cancel the shared request."""
+    sent = []
+
+    async def handler(request):
+        sent.append(request.url.path)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, content=BODY)
+
+    async def run():
+        client = AsyncRagulaClient(token="t", base_url="http://localhost:8000", coalesce=True,
+                                   transport=httpx.MockTransport(handler))
+        try:
+            tasks = [asyncio.ensure_future(client.query.query_collection("c1", "q")) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            tasks[0].cancel()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            return results, client.coalescer.stats(), client.coalescer.in_flight
+        finally:
+            await client.aclose()
+
+    results, stats, in_flight = asyncio.run(run())
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert results[1] == results[2] and results[1] is not results[2]
+    assert len(sent) == 1 and (stats.requests, stats.coalesced) == (1, 2) and in_flight == 0
@@ -0,0 +1,139 @@
+"""Tests for federated queries and rank fusion."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+from ragula.sdk.async_client import AsyncRagulaClient
+from ragula.sdk.client import RagulaClient, RagulaError
+from ragula.sdk.federated import fuse
+from ragula.sdk.models import QueryResponse
+from ragula.sdk.retry import RetryPolicy
+
+# collection -> [(fileId, score)]; the collections score on different scales.
+RESULTS = {
+    "small": [("s1", 0.9), ("s2", 0.5), ("s3", 0.1)],
+    "large": [("l1", 40.0), ("l2", 35.0)],
+}
+
+
+def body(collection_id):
+    results = [{"fileId": fid, "score": score, "contentSnippet": fid} for fid, score in RESULTS[collection_id]]
+    return {"results": results}
+
+
+def serve(client, method, endpoint, json_data=None, timeout=None, **kwargs):
+    """Answers queries from RESULTS, stalling a "slow" collection until client.release is set."""
+    collection_id = endpoint.split("/")[2]
+    if collection_id == "slow":
+        client.release.wait(5)
+        return body("small")
+    client.seen.append((collection_id, json_data, timeout))
+    if collection_id == "broken":
+        raise RagulaError(status_code=500, message="boom")
+    return body(collection_id)
+
+
+@pytest.fixture
+def federated_client(fake_transport):
+    """Fixture creating a client that answers queries from RESULTS and can stall a "slow" collection."""
+    client = fake_transport(serve)
+    client.seen, client.release = [], threading.Event()
+    yield client
+    client.release.set()
+
+
+def test_rrf_interleaves_collections():
+    """Tests that reciprocal rank fusion ranks by position, not by raw score scale."""
+    hits = fuse([("small", body("small")), ("large", body("large"))], top_k=4)
+    # Equal ranks tie on the fused score; the higher raw score goes first.
+    assert [(hit.collection_id, hit.file_id, hit.rank) for hit in hits] == [
+        ("large", "l1", 1), ("small", "s1", 1), ("large", "l2", 2), ("small", "s2", 2)
+    ]
+    assert hits[0].score == pytest.approx(1 / 61)
+    assert hits[1].content_snippet == "s1"
+
+
+def test_score_fusion_normalizes_per_collection():
+    """Tests min-max normalization, with model-mode responses."""
+    model = QueryResponse.model_validate(body("small"))
+    hits = fuse([("small", model), ("large", body("large"))], top_k=10, fusion="score")
+    scores = {hit.file_id: hit.score for hit in hits}
+    assert scores == {"s1": 1.0, "s2": 0.5, "s3": 0.0, "l1": 1.0, "l2": 0.0}
+    assert hits[0].raw_score == 40.0 # Ties on the fused score go to the higher raw score
+    with pytest.raises(ValueError):
+        fuse([], fusion="borda")
+
+
+def test_federated_query_merges_and_reports_errors(federated_client):
+    """Tests fan-out, top_k forwarding, de-duplicated IDs and per-collection errors."""
+    response = federated_client.query.federated_query(["small", "large", "broken", "small"], "q", top_k=3)
+    assert len(response) == 3 and {hit.collection_id for hit in response} == {"small", "large"}
+    assert not response.complete and response.errors["broken"].status_code == 500
+    assert sorted(collection for collection, _, _ in federated_client.seen) == ["broken", "large", "small"]
+    assert all(payload == {"query": "q", "topK": 3} for _, payload, _ in federated_client.seen)
+
+
+def test_federated_query_deadline_drops_slow_collections(federated_client):
+    """Tests that a stalled collection is reported as a 504 without delaying the others."""
+    started = time.monotonic()
+    response = federated_client.query.federated_query(["slow", "large"], "q", deadline=0.2)
+    assert time.monotonic() - started < 2
+    assert response.errors["slow"].status_code == 504
+    assert [hit.file_id for hit in response] == ["l1", "l2"]
+    assert federated_client.seen[0][2][1] <= 0.2 # Read timeout clamped to the deadline
+
+
+def test_federated_query_stragglers_end_by_the_deadline(monkeypatch):
+    """Tests that retries of abandoned collections stop at the deadline, leaving no request in flight."""
+    client = RagulaClient(token="t", base_url="http://localhost:8000",
+                          retry=RetryPolicy(max_attempts=5, backoff_base=0.01, jitter=False))
+    lock, in_flight, attempts = threading.Lock(), [0], []
+
+    def hanging_request(timeout=None, **kwargs):
+        # A server that never answers: each attempt ends when its read timeout expires.
+        with lock:
+            in_flight[0] += 1
+            attempts.append(timeout[1])
+        time.sleep(timeout[1])
+        with lock:
+            in_flight[0] -= 1
+        raise requests.exceptions.ReadTimeout("read timed out")
+
+    monkeypatch.setattr(client._session, "request", hanging_request)
+    started = time.monotonic()
+    response = client.query.federated_query(["a", "b"], "q", deadline=0.3)
+    assert set(response.errors) == {"a", "b"}
+    time.sleep(max(0.0, started + 0.4 - time.monotonic()))
+    assert in_flight[0] == 0
+    assert len(attempts) == 2 # Without the deadline, each collection would be retried 4 more times
+    time.sleep(0.2)
+    assert len(attempts) == 2
+
+
+def test_async_federated_query_cancels_slow_collections(fake_transport):
+    """Tests that the async client cancels collections that miss the deadline."""
+    cancelled = []
+
+    async def serve_slowly(client, method, endpoint, **kwargs):
+        collection_id = endpoint.split("/")[2]
+        if collection_id == "slow":
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(collection_id)
+                raise
+        return body(collection_id)
+
+    async def run():
+        client = fake_transport(serve_slowly, AsyncRagulaClient)
+        try:
+            return await client.query.federated_query(["small", "slow", "large"], "q", deadline=0.1, fusion="score")
+        finally:
+            await client.aclose()
+
+    response = asyncio.run(run())
+    assert cancelled == ["slow"] and set(response.errors) == {"slow"}
+    assert len(response.hits) == 5
@@ -1,5 +1,9 @@
 """Tests for the FilesHandler, covering file operations."""
 
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
 import pytest
 from ragula.sdk.client import RagulaClient
 from ragula.sdk.files import FilesService
@@ -21,4 +25,57 @@ def test_files_handler_initialization(files_handler, client):
     assert files_handler._client == client
 
 # Add more tests here for list_files, upload_file, get_file,
-# delete_file, etc., including mocking API calls and file operations.
\ No newline at end of file
+# delete_file, etc., including mocking API calls and file operations.
+
+
+@pytest.fixture
+def upload_server():
+    """Fixture running a local HTTP server that records one upload request."""
+    received = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            received["path"] = self.path
+            received["headers"] = dict(self.headers)
+            received["body"] = self.rfile.read(int(self.headers["Content-Length"]))
+            payload = json.dumps({"id": "file-1"}).encode()
+            self.send_response(201)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", received
+    server.shutdown()
+    server.server_close()
+
+
+def test_upload_file_streams_with_content_length(upload_server, tmp_path):
+    """Tests that upload_file sends a sized multipart body and reports progress."""
+    base_url, received = upload_server
+    path = tmp_path / "report.pdf"
+    path.write_bytes(b"%PDF" + b"\0" * 200000)
+    progress = []
+
+    client = RagulaClient(token="test_api_key", base_url=base_url)
+    response = client.files.upload_file(
+        "col-1",
+        file_path=str(path),
+        folder_id="folder-1",
+        progress_callback=lambda sent, total: progress.append((sent, total)),
+    )
+
+    assert response == {"id": "file-1"}
+    assert received["path"] == "/api/collections/col-1/files"
+    assert "Transfer-Encoding" not in received["headers"]
+    assert int(received["headers"]["Content-Length"]) == len(received["body"])
+    assert received["headers"]["Content-Type"].startswith("multipart/form-data; boundary=")
+    assert b'name="folderId"' in received["body"]
+    assert b'filename="report.pdf"' in received["body"]
+    assert progress[-1] == (len(received["body"]), len(received["body"]))
@@ -0,0 +1,38 @@
+"""Tests for lazy imports and cold-start behavior."""
+
+import pytest
+import ragula.sdk
+from benchmarks.bench_import import SCENARIOS, sample
+from ragula.sdk.client import RagulaClient
+
+
+def test_first_query_loads_no_heavy_modules():
+    """Tests that importing the client and running a JSON query skips pydantic, httpx, asyncio and sqlite3."""
+    assert sample(SCENARIOS["RagulaClient + first query"])["loaded"] == []
+    assert sample(SCENARIOS["ragula_tool definition"])["loaded"] == []
+
+
+def test_services_defer_asyncio_and_status():
+    """Tests that the collections and files services load neither asyncio nor status watching until used."""
+    client = "from ragula.sdk import RagulaClient\nimport sys\nclient = RagulaClient(token='t')\n"
+    no_status = "\nassert 'ragula.sdk.status' not in sys.modules"
+    assert "asyncio" not in sample(client + "client.collections" + no_status)["loaded"]
+    assert sample(client + "client.files" + no_status)["loaded"] == []
+
+
+def test_package_exports_resolve_lazily():
+    """Tests that every public name resolves on access and unknown names still fail."""
+    for name in ragula.sdk.__all__:
+        assert getattr(ragula.sdk, name) is not None
+    assert set(ragula.sdk.__all__) <= set(dir(ragula.sdk))
+    with pytest.raises(AttributeError):
+        ragula.sdk.NoSuchThing
+
+
+def test_services_are_created_once():
+    """Tests that lazily created services are cached per client and can be replaced."""
+    client = RagulaClient(token="t", base_url="http://localhost:8000")
+    assert client.query is client.query
+    assert client.collections._client is client
+    client.files = "stub"
+    assert client.files == "stub"
@@ -0,0 +1,61 @@
+"""Tests for the SyncManifest used by incremental syncs."""
+
+import hashlib
+
+import pytest
+from ragula.sdk.manifest import ManifestEntry, SyncManifest, hash_file
+
+
+def test_hash_file_matches_hashlib(tmp_path):
+    """Tests that chunked hashing matches a one-shot digest."""
+    path = tmp_path / "blob.bin"
+    content = bytes(range(256)) * 10000
+    path.write_bytes(content)
+    assert hash_file(str(path)) == hashlib.sha256(content).hexdigest()
+
+
+def test_manifest_persists_entries_and_pending_deletes(tmp_path):
+    """Tests that entries and superseded file IDs survive reopening the manifest."""
+    path = str(tmp_path / "manifest.sqlite3")
+    with SyncManifest(path, "col-1") as manifest:
+        manifest.record(ManifestEntry("a.txt", 3, 10, "h1", "file-1"))
+        manifest.record(ManifestEntry("a.txt", 4, 20, "h2", "file-2"), replaced_file_id="file-1")
+
+    with SyncManifest(path, "col-1") as manifest:
+        assert manifest.get("a.txt") == ManifestEntry("a.txt", 4, 20, "h2", "file-2")
+        assert manifest.pending_deletes() == ["file-1"]
+        manifest.clear_pending_delete("file-1")
+        manifest.remove("a.txt")
+        assert manifest.paths() == [] and manifest.pending_deletes() == []
+
+
+def test_manifest_rejects_other_collection(tmp_path):
+    """Tests that a manifest cannot be reused for a different collection."""
+    path = str(tmp_path / "manifest.sqlite3")
+    SyncManifest(path, "col-1").close()
+    with pytest.raises(ValueError):
+        SyncManifest(path, "col-2")
+
+
+def test_manifest_rejects_other_directory_or_parent_folder(tmp_path):
+    """Tests that a manifest used with a directory and parent folder stays bound to them."""
+    path = str(tmp_path / "manifest.sqlite3")
+    SyncManifest(path, "col-1", str(tmp_path), None).close()
+    SyncManifest(path, "col-1", str(tmp_path / "."), None).close() # Same directory, spelled differently
+    with pytest.raises(ValueError):
+        SyncManifest(path, "col-1", str(tmp_path / "other"), None)
+    with pytest.raises(ValueError):
+        SyncManifest(path, "col-1", str(tmp_path), "folder-1")
+
+
+def test_record_clears_the_pending_upload(tmp_path):
+    """Tests that pending uploads persist until the upload is recorded."""
+    path = str(tmp_path / "manifest.sqlite3")
+    with SyncManifest(path, "col-1") as manifest:
+        manifest.begin_upload("a.txt", None)
+        manifest.begin_upload("docs/b.txt", "folder-1")
+    with SyncManifest(path, "col-1") as manifest:
+        assert sorted(manifest.pending_uploads()) == [("a.txt", None), ("docs/b.txt", "folder-1")]
+        manifest.record(ManifestEntry("a.txt", 3, 10, "h1", "file-1"))
+        manifest.clear_pending_upload("docs/b.txt")
+        assert manifest.pending_uploads() == []
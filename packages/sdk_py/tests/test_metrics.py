@@ -0,0 +1,139 @@
+"""Tests for request hooks, the metrics collector and the OpenTelemetry hook."""
+
+import asyncio
+import io
+
+import httpx
+import pytest
+import requests
+from ragula.sdk.async_client import AsyncRagulaClient
+from ragula.sdk.client import RagulaClient, RagulaError
+from ragula.sdk.metrics import (
+    CallbackHook, Histogram, MetricsCollector, OpenTelemetryHook, RequestHook, endpoint_template, service_for,
+)
+from ragula.sdk.retry import RetryPolicy
+
+
+def make_response(status_code, body=b"{}"):
+    """Builds a requests.Response with a prepared request carrying a Content-Length."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.raw = io.BytesIO(body)
+    response.request = requests.Request("POST", "http://localhost", data=b"12345").prepare()
+    return response
+
+
+@pytest.fixture
+def metered_client(monkeypatch):
+    """Fixture creating a client with a MetricsCollector whose session replays scripted responses."""
+    metrics = MetricsCollector()
+    events = []
+    client = RagulaClient(
+        token="t",
+        base_url="http://localhost:8000",
+        retry=RetryPolicy(max_attempts=3, backoff_base=0.001, jitter=False),
+        hooks=[metrics, CallbackHook(after=events.append)],
+    )
+    client.metrics, client.events, client.script = metrics, events, []
+    monkeypatch.setattr(client._session, "request", lambda **kwargs: client.script.pop(0))
+    return client
+
+
+@pytest.mark.parametrize("endpoint, template, service", [
+    ("/collections", "/collections", "collections"),
+    ("/collections/abc/query", "/collections/{id}/query", "query"),
+    ("/collections/abc/status", "/collections/{id}/status", "collections"),
+    ("/collections/abc/files/f1", "/collections/{id}/files/{id}", "files"),
+    ("/collections/abc/folders", "/collections/{id}/folders", "folders"),
+])
+def test_endpoint_templates(endpoint, template, service):
+    """Tests that IDs are replaced so calls aggregate per operation."""
+    assert endpoint_template(endpoint) == template
+    assert service_for(template) == service
+
+
+def test_histogram_percentiles():
+    """Tests bucketed percentile estimates stay within the observed range."""
+    histogram = Histogram(buckets=(0.1, 0.2, 0.5))
+    for value in [0.05] * 90 + [0.4] * 9 + [2.0]:
+        histogram.observe(value)
+    assert histogram.count == 100
+    assert histogram.percentile(50) <= 0.1
+    assert 0.2 <= histogram.percentile(95) <= 0.5
+    assert histogram.percentile(100) == 2.0
+
+
+def test_collector_tags_calls(metered_client):
+    """Tests per-call tagging, retries, payload sizes and decode time."""
+    metered_client.script = [make_response(503), make_response(200, b'{"results": []}')]
+    metered_client.query.query_collection("c1", "q")
+
+    event = metered_client.events[0]
+    assert (event.service, event.endpoint, event.status, event.attempts) == ("query", "/collections/{id}/query", "200", 2)
+    assert event.bytes_sent == 5 and event.bytes_received == len(b'{"results": []}')
+    assert event.decode_time > 0 and event.duration >= event.decode_time
+
+    stats = metered_client.metrics.stats("query", "/collections/{id}/query", "200")
+    assert stats.latency.count == 1 and stats.retries == 1
+    assert metered_client.metrics.percentile(99, service="query") > 0
+
+
+def test_errors_are_tagged_with_status(metered_client):
+    """Tests that failed calls are recorded with their status and error."""
+    metered_client.script = [make_response(404, b'{"message": "nope"}')]
+    with pytest.raises(RagulaError):
+        metered_client.collections.get_collection("missing")
+    event = metered_client.events[0]
+    assert event.status == "404" and isinstance(event.error, RagulaError)
+    assert metered_client.metrics.keys() == [("collections", "/collections/{id}", "404")]
+
+
+def test_failing_hook_does_not_break_requests(metered_client):
+    """Tests that exceptions raised by hooks are logged, not propagated."""
+    class Broken(RequestHook):
+        def before_request(self, event):
+            raise RuntimeError("hook bug")
+
+    metered_client.hooks.insert(0, Broken())
+    metered_client.script = [make_response(200, b"[]")]
+    assert metered_client.collections.list_collections() == []
+    assert len(metered_client.events) == 1
+
+
+def test_opentelemetry_hook_records_span():
+    """Tests the span lifecycle with a stand-in tracer."""
+    class Span:
+        def __init__(self, name):
+            self.name, self.attributes, self.ended = name, {}, False
+
+        def set_attribute(self, key, value):
+            self.attributes[key] = value
+
+        def end(self):
+            self.ended = True
+
+    class Tracer:
+        spans = []
+
+        def start_span(self, name, kind=None):
+            self.spans.append(Span(name))
+            return self.spans[-1]
+
+    client = AsyncRagulaClient(
+        token="t", base_url="http://localhost:8000", retry=RetryPolicy(max_attempts=1),
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=[])),
+        hooks=[OpenTelemetryHook(tracer=Tracer())],
+    )
+    asyncio.run(client.folders.list_folders("c1"))
+    span = Tracer.spans[0]
+    assert span.name == "GET /collections/{id}/folders" and span.ended
+    assert span.attributes["http.response.status_code"] == 200
+    assert span.attributes["ragula.service"] == "folders"
+
+
+def test_opentelemetry_hook_is_noop_without_tracer(monkeypatch):
+    """Tests that the hook is inert when OpenTelemetry is unavailable."""
+    monkeypatch.setattr("ragula.sdk.metrics.otel_trace", None)
+    hook = OpenTelemetryHook()
+    assert not hook.enabled
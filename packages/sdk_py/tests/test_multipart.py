@@ -0,0 +1,76 @@
+"""Tests for the streaming MultipartEncoder."""
+
+import io
+from email.parser import BytesParser
+from email.policy import HTTP
+
+import pytest
+from ragula.sdk.multipart import MultipartEncoder
+
+
+def parse_body(encoder, body):
+    """Parses an encoded body into {field name: (filename, payload bytes)}."""
+    message = BytesParser(policy=HTTP).parsebytes(
+        f"Content-Type: {encoder.content_type}\r\n\r\n".encode() + body
+    )
+    return {
+        part.get_param("name", header="content-disposition"): (
+            part.get_filename(),
+            part.get_payload(decode=True),
+        )
+        for part in message.iter_parts()
+    }
+
+
+def test_encoder_length_matches_body(tmp_path):
+    """Tests that __len__ matches the streamed body and the parts round-trip."""
+    path = tmp_path / "doc.txt"
+    content = b"0123456789" * 10000
+    path.write_bytes(content)
+
+    with MultipartEncoder.from_path(str(path), fields={"folderId": "f1"}, chunk_size=4096) as encoder:
+        body = b"".join(encoder)
+        assert len(body) == len(encoder)
+
+    parts = parse_body(encoder, body)
+    assert parts["folderId"][1] == b"f1"
+    assert parts["file"] == ("doc.txt", content)
+
+
+def test_encoder_chunks_are_bounded_and_report_progress():
+    """Tests that no chunk exceeds chunk_size and progress reaches the total."""
+    progress = []
+    encoder = MultipartEncoder.from_content(
+        b"x" * 10000, "a.bin", chunk_size=1000, progress_callback=lambda sent, total: progress.append((sent, total))
+    )
+    chunks = list(encoder)
+    assert max(len(chunk) for chunk in chunks) <= 1000
+    assert progress[-1] == (len(encoder), len(encoder))
+
+
+def test_encoder_closes_owned_file(tmp_path):
+    """Tests that files opened from a path are closed on exit."""
+    path = tmp_path / "doc.txt"
+    path.write_bytes(b"data")
+    with MultipartEncoder.from_path(str(path)) as encoder:
+        fileobj = encoder._fileobj
+    assert fileobj.closed
+
+
+def test_encoder_leaves_caller_file_open_and_resets():
+    """Tests that caller-owned streams stay open and the body can be replayed."""
+    stream = io.BytesIO(b"header-skipped|payload")
+    stream.seek(len(b"header-skipped|"))
+    with MultipartEncoder.from_content(stream, "p.txt") as encoder:
+        first = b"".join(encoder)
+        encoder.reset()
+        assert b"".join(encoder) == first
+    assert not stream.closed
+    assert parse_body(encoder, first)["file"][1] == b"payload"
+
+
+def test_encoder_detects_truncated_file():
+    """Tests that a file shorter than announced raises instead of hanging."""
+    encoder = MultipartEncoder({}, "file", "a.txt", io.BytesIO(b"abc"), file_size=10)
+    with pytest.raises(IOError):
+        b"".join(encoder)
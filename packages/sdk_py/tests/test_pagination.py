@@ -0,0 +1,99 @@
+"""Tests for paged, lazy listing iterators."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+from ragula.sdk.async_client import AsyncRagulaClient
+from ragula.sdk.pagination import iter_pages
+from ragula.sdk.retry import RetryPolicy
+
+
+def make_file(index):
+    return {
+        "id": f"f{index}", "name": f"{index}.txt", "collectionId": "c1", "storagePath": f"/{index}",
+        "createdAt": "2024-01-01T00:00:00Z", "updatedAt": "2024-01-01T00:00:00Z",
+    }
+
+
+ALL_FILES = [make_file(i) for i in range(25)]
+
+
+def serve(client, method, endpoint, params=None, **kwargs):
+    """Serves ALL_FILES in limit/offset pages and records the pages requested."""
+    client.pages.append((params["limit"], params["offset"], params.get("folderId")))
+    return ALL_FILES[params["offset"]:params["offset"] + params["limit"]]
+
+
+@pytest.fixture
+def paged_client(fake_transport):
+    """Fixture creating a client that serves ALL_FILES in limit/offset pages."""
+    client = fake_transport(serve)
+    client.pages = []
+    return client
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_files_pages_through_listing(paged_client, prefetch):
+    """Tests that every page is requested once and items arrive in order."""
+    files = list(paged_client.files.iter_files("c1", folder_id="d1", page_size=10, prefetch=prefetch))
+    assert [f["id"] for f in files] == [f["id"] for f in ALL_FILES]
+    assert sorted(paged_client.pages) == [(10, 0, "d1"), (10, 10, "d1"), (10, 20, "d1")]
+
+
+def test_iter_is_lazy(paged_client):
+    """Tests that only the first page (and at most one prefetched page) is fetched up front."""
+    files = paged_client.files.iter_files("c1", page_size=10)
+    assert next(files)["id"] == "f0"
+    assert len(paged_client.pages) <= 2
+    files.close()
+
+
+def test_prefetch_runs_in_background():
+    """Tests that the next page is fetched off the consuming thread."""
+    threads = set()
+
+    def fetch(limit, offset):
+        threads.add(threading.get_ident())
+        return list(range(offset, min(offset + limit, 5)))
+
+    assert list(iter_pages(fetch, page_size=2)) == [0, 1, 2, 3, 4]
+    assert threading.get_ident() not in threads
+
+
+@pytest.mark.parametrize("server_page", [lambda limit, offset: ALL_FILES, lambda limit, offset: ALL_FILES[:limit]])
+def test_falls_back_when_server_ignores_pagination(server_page):
+    """Tests that a full list, or a repeated first page, ends iteration without duplicates."""
+    assert len(list(iter_pages(server_page, page_size=25))) == 25
+    assert len(list(iter_pages(lambda limit, offset: ALL_FILES, page_size=10))) == 25
+
+
+def test_rejects_invalid_page_size(paged_client):
+    """Tests that a non-positive page size fails when the iterator is created."""
+    with pytest.raises(ValueError):
+        paged_client.folders.iter_folders("c1", page_size=0)
+
+
+def test_async_iter_collections_models():
+    """Tests async paging in model mode, including the prefetch task."""
+    collection = {"id": "c", "name": "n", "userId": "u", "createdAt": "2024-01-01T00:00:00Z",
+                  "updatedAt": "2024-01-01T00:00:00Z"}
+    seen = []
+
+    def handler(request):
+        offset, limit = int(request.url.params["offset"]), int(request.url.params["limit"])
+        seen.append(offset)
+        return httpx.Response(200, json=[dict(collection, id=f"c{i}") for i in range(offset, min(offset + limit, 5))])
+
+    async def run():
+        client = AsyncRagulaClient(
+            token="t", base_url="http://localhost:8000", transport=httpx.MockTransport(handler),
+            retry=RetryPolicy(max_attempts=1), response_mode="model",
+        )
+        async with client:
+            return [c async for c in client.collections.iter_collections(page_size=2)]
+
+    collections = asyncio.run(run())
+    assert [c.id for c in collections] == ["c0", "c1", "c2", "c3", "c4"]
+    assert sorted(seen) == [0, 2, 4]
@@ -0,0 +1,122 @@
+"""Tests for response modes and body decoding."""
+
+import json
+
+import pytest
+import requests
+from ragula.sdk.cache import QueryCache
+from ragula.sdk.client import RagulaClient, RagulaError
+from ragula.sdk.models import AskQuestionResponse, Folder, ListFoldersResponse, QueryResponse
+from ragula.sdk.parsing import decode_body, dumps_json, loads_json, to_json_value, type_adapter
+
+QUERY_BODY = b'{"results": [{"fileId": "f1", "score": 0.9, "contentSnippet": "text"}]}'
+FOLDER_BODY = (
+    b'[{"id": "d1", "name": "docs", "parentId": null, "collectionId": "c1",'
+    b' "createdAt": "2024-01-01T00:00:00Z", "updatedAt": "2024-01-01T00:00:00Z"}]'
+)
+
+
+@pytest.fixture
+def serving_client(monkeypatch):
+    """Fixture returning a factory for clients whose session answers with a fixed body."""
+
+    def make(body, response_mode="json", query_cache=None):
+        client = RagulaClient(
+            token="t", base_url="http://localhost:8000", response_mode=response_mode, query_cache=query_cache
+        )
+        client.calls = 0
+
+        def fake_request(**kwargs):
+            client.calls += 1
+            response = requests.Response()
+            response.status_code = 200
+            response._content = body
+            return response
+
+        monkeypatch.setattr(client._session, "request", fake_request)
+        return client
+
+    return make
+
+
+def test_json_mode_returns_plain_values(serving_client):
+    """Tests that the default mode keeps returning dicts."""
+    client = serving_client(QUERY_BODY)
+    assert client.query.query_collection("c1", "q") == json.loads(QUERY_BODY)
+
+
+def test_model_mode_returns_models(serving_client):
+    """Tests that model mode validates bodies into the documented response types."""
+    client = serving_client(QUERY_BODY, response_mode="model")
+    response = client.query.query_collection("c1", "q")
+    assert isinstance(response, QueryResponse)
+    assert response.results[0].file_id == "f1"
+
+    folders = serving_client(FOLDER_BODY, response_mode="model").folders.list_folders("c1")
+    assert isinstance(folders[0], Folder)
+    assert folders[0].name == "docs"
+
+
+def test_ask_question_model_allows_answer(serving_client):
+    """Tests that ask_question responses carry an optional answer."""
+    client = serving_client(b'{"answer": "42", "results": []}', response_mode="model")
+    response = client.query.ask_question("c1", "q")
+    assert isinstance(response, AskQuestionResponse)
+    assert response.answer == "42"
+
+
+def test_raw_mode_returns_bytes(serving_client):
+    """Tests that raw mode skips decoding entirely."""
+    client = serving_client(QUERY_BODY, response_mode="raw")
+    assert client.query.query_collection("c1", "q") == QUERY_BODY
+
+
+def test_per_call_mode_overrides_client(serving_client):
+    """Tests that _request's response_mode wins over the client default."""
+    client = serving_client(QUERY_BODY, response_mode="model")
+    assert client._request("GET", "/anything", response_mode="raw") == QUERY_BODY
+
+
+def test_unexpected_body_raises_ragula_error(serving_client):
+    """Tests that a body not matching the model surfaces as a RagulaError."""
+    client = serving_client(b'{"results": [{"score": "high"}]}', response_mode="model")
+    with pytest.raises(RagulaError) as exc_info:
+        client.query.query_collection("c1", "q")
+    assert exc_info.value.status_code == 200
+
+
+def test_cache_hit_decodes_into_client_mode(serving_client):
+    """Tests that cached raw bodies are decoded per hit in the client's mode."""
+    client = serving_client(QUERY_BODY, response_mode="model", query_cache=QueryCache())
+    first = client.query.query_collection("c1", "q")
+    second = client.query.query_collection("c1", "q")
+    assert client.calls == 1
+    assert isinstance(second, QueryResponse)
+    assert first == second
+
+
+def test_type_adapter_is_cached():
+    """Tests that the adapter for a response type is built once."""
+    assert type_adapter(QueryResponse) is type_adapter(QueryResponse)
+
+
+def test_decode_body_falls_back_to_text():
+    """Tests that a non-JSON success body is returned as text."""
+    assert decode_body(b"ok", "json") == "ok"
+
+
+def test_to_json_value_normalizes_every_mode():
+    """Tests that helpers can read fields regardless of the response mode."""
+    model = decode_body(FOLDER_BODY, "model", ListFoldersResponse)
+    assert to_json_value(model)[0]["parentId"] is None
+    assert to_json_value(FOLDER_BODY)[0]["id"] == "d1"
+    assert to_json_value({"id": "d1"}) == {"id": "d1"}
+
+
+def test_json_helpers_round_trip():
+    """Tests compact encoding, including values only the standard library accepts."""
+    assert dumps_json({"query": "caf\u00e9"}) == '{"query":"caf\u00e9"}'.encode("utf-8")
+    assert dumps_json({1: 2**70}) == b'{"1":1180591620717411303424}'
+    assert loads_json(b'{"a": [1, 2]}') == {"a": [1, 2]} == loads_json('{"a": [1, 2]}')
+    with pytest.raises(ValueError):
+        loads_json(b"not json")
@@ -1,8 +1,12 @@
 """Tests for the QueryHandler, covering query operations."""
 
+import threading
+
 import pytest
-from ragula.sdk.client import RagulaClient
-from ragula.sdk.query import QueryService
+from pydantic import ValidationError
+from ragula.sdk.client import RagulaClient, RagulaError
+from ragula.sdk.models import QueryPayload
+from ragula.sdk.query import QueryService, build_query_payload
 
 # TODO: Add comprehensive tests for QueryHandler
 
@@ -21,4 +25,81 @@ def test_query_handler_initialization(query_handler, client):
     assert query_handler._client == client
 
 # Add more tests here for the query method, including different query parameters,
-# mocking API calls, and verifying results.
\ No newline at end of file
+# mocking API calls, and verifying results.
+
+
+def test_query_many_preserves_order_and_isolates_errors(query_handler, client, monkeypatch):
+    """Tests that query_many returns per-query results in input order."""
+    threads = set()
+
+    def fake_request(method, endpoint, json_data=None, **kwargs):
+        threads.add(threading.get_ident())
+        if json_data["query"] == "bad":
+            raise RagulaError(status_code=500, message="boom")
+        return {"results": [{"fileId": json_data["query"], "score": 1.0}]}
+
+    monkeypatch.setattr(client, "_request", fake_request)
+    results = query_handler.query_many("col-1", ["a", "bad", "c", "d"], concurrency=4)
+
+    assert results[0]["results"][0]["fileId"] == "a"
+    assert isinstance(results[1], RagulaError)
+    assert results[2]["results"][0]["fileId"] == "c"
+    assert results[3]["results"][0]["fileId"] == "d"
+    assert threading.get_ident() not in threads
+
+
+def test_query_collections_targets_each_collection(query_handler, client, monkeypatch):
+    """Tests that query_collections sends the query to every collection."""
+    endpoints = []
+
+    def fake_request(method, endpoint, json_data=None, **kwargs):
+        endpoints.append(endpoint)
+        return {"results": []}
+
+    monkeypatch.setattr(client, "_request", fake_request)
+    results = query_handler.query_collections(["c1", "c2"], "q")
+
+    assert results == [{"results": []}, {"results": []}]
+    assert sorted(endpoints) == ["/collections/c1/query", "/collections/c2/query"]
+
+
+def test_query_many_rejects_invalid_concurrency(query_handler):
+    """Tests that a non-positive concurrency is rejected."""
+    with pytest.raises(ValueError):
+        query_handler.query_many("col-1", ["a"], concurrency=0)
+
+
+def test_query_options_build_full_payload(query_handler, client, monkeypatch):
+    """Tests that top_k, filters and snippet projection reach the request body."""
+    sent = []
+
+    def fake_request(method, endpoint, json_data=None, **kwargs):
+        sent.append((endpoint, json_data))
+        return {"results": [{"fileId": "f1", "score": 0.5, "contentSnippet": "text"}]}
+
+    monkeypatch.setattr(client, "_request", fake_request)
+    query_handler.query_collection("col-1", "plain")
+    response = query_handler.ask_question(
+        "col-1", "q", top_k=3, folder_ids=["d1"], file_types=["pdf"], include_snippets=False
+    )
+
+    assert sent[0] == ("/collections/col-1/query", {"query": "plain"})
+    assert sent[1] == (
+        "/collections/col-1/question",
+        {"query": "q", "topK": 3, "filter": {"folderIds": ["d1"], "fileTypes": ["pdf"]}, "includeSnippets": False},
+    )
+    # Snippets are dropped client-side too, in case the server ignores the flag.
+    assert response["results"] == [{"fileId": "f1", "score": 0.5}]
+
+
+def test_query_rejects_invalid_top_k(query_handler):
+    """Tests that a non-positive top_k is rejected before any request."""
+    with pytest.raises(ValueError):
+        query_handler.query_collection("col-1", "q", top_k=0)
+
+
+def test_plain_query_payload_skips_validation():
+    """Tests that the fast path for plain queries matches the model-built payload."""
+    assert build_query_payload("q") == QueryPayload(query="q").model_dump(by_alias=True, exclude_none=True)
+    with pytest.raises(ValidationError):
+        build_query_payload(None)
@@ -0,0 +1,126 @@
+"""Tests for the RequestGovernor rate limiter and priority lanes."""
+
+import asyncio
+import io
+import threading
+import time
+
+import pytest
+import requests
+from ragula.sdk.client import RagulaClient
+from ragula.sdk.ratelimit import BACKGROUND, INTERACTIVE, RequestGovernor
+
+
+def test_token_bucket_limits_rate():
+    """Tests that acquisitions beyond the burst are spaced by the rate."""
+    governor = RequestGovernor(rate=50, burst=1)
+    started = time.monotonic()
+    for _ in range(6):
+        with governor.slot():
+            pass
+    assert time.monotonic() - started >= 5 / 50 * 0.9
+
+
+def test_max_in_flight_bounds_concurrency():
+    """Tests that no more than max_in_flight threads hold a slot at once."""
+    governor = RequestGovernor(max_in_flight=3)
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def work():
+        with governor.slot():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=work) for _ in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak[0] == 3
+    assert governor.in_flight == 0
+
+
+def test_interactive_lane_served_before_background():
+    """Tests that a waiting interactive request overtakes queued background work."""
+    governor = RequestGovernor(max_in_flight=1)
+    order = []
+    governor.acquire(BACKGROUND)
+
+    def wait_in(lane):
+        with governor.slot(lane):
+            order.append(lane)
+
+    background = threading.Thread(target=wait_in, args=(BACKGROUND,))
+    background.start()
+    time.sleep(0.05)
+    interactive = threading.Thread(target=wait_in, args=(INTERACTIVE,))
+    interactive.start()
+    time.sleep(0.05)
+    governor.release(BACKGROUND)
+    background.join()
+    interactive.join()
+    assert order == [INTERACTIVE, BACKGROUND]
+
+
+def test_lane_limits_reserve_capacity():
+    """Tests that a per-lane cap leaves slots free for other lanes."""
+    governor = RequestGovernor(max_in_flight=2, lane_limits={BACKGROUND: 1})
+    governor.acquire(BACKGROUND)
+    with governor._lock:
+        assert governor._try_acquire(BACKGROUND) is None
+    governor.acquire(INTERACTIVE)  # would block if background held both slots
+    assert governor.in_flight == 2
+
+
+def test_async_acquire_bounds_concurrency():
+    """Tests that coroutines share the in-flight limit without blocking the loop."""
+    governor = RequestGovernor(max_in_flight=2)
+    active, peak = [0], [0]
+
+    async def work():
+        async with governor.slot_async():
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+
+    async def run():
+        await asyncio.gather(*(work() for _ in range(10)))
+
+    asyncio.run(run())
+    assert peak[0] == 2
+    assert governor.in_flight == 0
+
+
+def test_client_uses_background_lane_for_uploads(monkeypatch):
+    """Tests that the client routes uploads through the background lane."""
+    governor = RequestGovernor()
+    lanes = []
+    original = governor.acquire
+    monkeypatch.setattr(governor, "acquire", lambda lane=INTERACTIVE: (lanes.append(lane), original(lane)))
+    client = RagulaClient(token="t", base_url="http://localhost:8000", governor=governor)
+    monkeypatch.setattr(client._session, "request", lambda **kwargs: _ok_response())
+
+    client.query.query_collection("c1", "q")
+    client.files.upload_file("c1", file_content=b"x", file_name="a.txt")
+    assert lanes == [INTERACTIVE, BACKGROUND]
+    assert governor.in_flight == 0
+
+
+def test_unknown_lane_rejected():
+    """Tests that acquiring an undeclared lane fails fast."""
+    with pytest.raises(ValueError):
+        RequestGovernor().acquire("bulk")
+
+
+def _ok_response():
+    """Builds an empty 200 response without touching the network."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b"{}"
+    response.raw = io.BytesIO(b"{}")
+    return response
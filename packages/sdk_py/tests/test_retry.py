@@ -0,0 +1,61 @@
+"""Tests for the RetryPolicy decisions."""
+
+import time
+from email.utils import formatdate
+
+import pytest
+from ragula.sdk.retry import RetryPolicy, parse_retry_after
+
+
+def test_backoff_is_exponential_and_capped():
+    """Tests the un-jittered backoff schedule."""
+    policy = RetryPolicy(backoff_base=1.0, backoff_cap=5.0, jitter=False)
+    assert [policy.backoff(n) for n in range(1, 5)] == [1.0, 2.0, 4.0, 5.0]
+
+
+def test_full_jitter_stays_within_backoff():
+    """Tests that jittered delays never exceed the exponential backoff."""
+    policy = RetryPolicy(backoff_base=1.0, backoff_cap=8.0)
+    assert all(0 <= policy.backoff(3) <= 4.0 for _ in range(100))
+
+
+def test_parse_retry_after_formats():
+    """Tests delta-seconds, HTTP-date and invalid Retry-After values."""
+    assert parse_retry_after("7") == 7.0
+    assert 55 <= parse_retry_after(formatdate(time.time() + 60, usegmt=True)) <= 60
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+@pytest.mark.parametrize(
+    "idempotent, status, connect_error, retried",
+    [
+        (True, 503, False, True),
+        (True, 400, False, False),
+        (False, 503, False, False),  # a POST may have been processed
+        (False, 429, False, True),   # the server refused it outright
+        (True, None, False, True),
+        (False, None, False, False),
+        (False, None, True, True),   # never reached the server
+    ],
+)
+def test_idempotency_rules(idempotent, status, connect_error, retried):
+    """Tests which failures are retried for safe and unsafe requests."""
+    policy = RetryPolicy(jitter=False)
+    delay = policy.next_delay(1, idempotent, None, status_code=status, connect_error=connect_error)
+    assert (delay is not None) == retried
+
+
+def test_attempts_retry_after_and_deadline():
+    """Tests max_attempts, Retry-After handling and the deadline budget."""
+    policy = RetryPolicy(max_attempts=2, backoff_base=0.1, backoff_cap=10.0, jitter=False)
+    assert policy.next_delay(2, True, None, status_code=503) is None
+    assert policy.next_delay(1, True, None, status_code=503, retry_after="3") == 3.0
+    assert policy.next_delay(1, True, None, status_code=503, retry_after="60") is None
+    assert policy.next_delay(1, True, time.monotonic() + 1.0, status_code=503, retry_after="3") is None
+
+
+def test_invalid_policy_rejected():
+    """Tests that nonsensical settings are rejected."""
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
@@ -0,0 +1,165 @@
+"""Tests for collection status watching and wait_until_ready."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from ragula.sdk.async_client import AsyncRagulaClient
+from ragula.sdk.client import RagulaClient, RagulaError
+from ragula.sdk.retry import RetryPolicy
+from ragula.sdk.status import StatusPolling
+
+FAST = StatusPolling(initial_interval=0.01, max_interval=0.05)
+
+
+def scripted_statuses(statuses):
+    """Returns a status fetcher that replays statuses, repeating the last one."""
+    calls = []
+    lock = threading.Lock()
+
+    def fetch(method, endpoint, **kwargs):
+        with lock:
+            calls.append(endpoint)
+            status, count, size = statuses[min(len(calls), len(statuses)) - 1]
+        return {"status": status, "fileCount": count, "totalSize": size}
+
+    fetch.calls = calls
+    return fetch
+
+
+@pytest.fixture
+def status_client(monkeypatch):
+    """Fixture returning a factory for clients whose status endpoint replays a script."""
+
+    def make(statuses):
+        client = RagulaClient(token="t", base_url="http://localhost:8000")
+        client.fetch = scripted_statuses(statuses)
+        monkeypatch.setattr(client, "_request", client.fetch)
+        return client
+
+    return make
+
+
+def test_wait_until_ready_reports_transitions(status_client):
+    """Tests that only changes are reported, with file count and size deltas."""
+    client = status_client([
+        ("processing", 1, 10), ("processing", 1, 10), ("processing", 3, 30), ("ready", 3, 35),
+    ])
+    changes = []
+    final = client.collections.wait_until_ready("c1", timeout=5, polling=FAST, on_change=changes.append)
+    assert final.status == "ready"
+    assert [(c.status, c.file_count_delta, c.total_size_delta) for c in changes] == [
+        ("processing", 0, 0), ("processing", 2, 20), ("ready", 0, 5),
+    ]
+    assert changes[-1].previous_status == "processing"
+
+
+def test_wait_until_ready_times_out(status_client):
+    """Tests that a collection that never becomes ready raises TimeoutError."""
+    client = status_client([("processing", 0, 0)])
+    with pytest.raises(TimeoutError):
+        client.collections.wait_until_ready("c1", timeout=0.1, polling=FAST)
+
+
+def test_wait_until_ready_raises_on_failure(status_client):
+    """Tests that a failed status surfaces as a RagulaError."""
+    client = status_client([("processing", 0, 0), ("FAILED", 0, 0)])
+    with pytest.raises(RagulaError):
+        client.collections.wait_until_ready("c1", timeout=5, polling=FAST)
+
+
+def test_concurrent_waiters_share_one_poller(status_client):
+    """Tests that waiters on the same collection are served by a single poll loop."""
+    client = status_client([("processing", 0, 0)] * 10 + [("ready", 1, 1)])
+    results = []
+
+    def wait():
+        results.append(client.collections.wait_until_ready("c1", timeout=5, polling=FAST).status)
+
+    threads = [threading.Thread(target=wait) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == ["ready"] * 5
+    # One poller: never more status requests than the script plus a few late ones.
+    assert len(client.fetch.calls) <= 13
+
+
+def test_adaptive_polling_interval():
+    """Tests that the interval grows while idle and resets on change."""
+    polling = StatusPolling(initial_interval=1, max_interval=3, multiplier=2)
+    assert polling.next_interval(1, changed=False) == 2
+    assert polling.next_interval(2, changed=False) == 3
+    assert polling.next_interval(3, changed=True) == 1
+
+
+def test_async_waiters_coalesce():
+    """Tests async wait_until_ready with concurrent waiters on one polling task."""
+    client = AsyncRagulaClient(token="t", base_url="http://localhost:8000", retry=RetryPolicy(max_attempts=1))
+    fetch = scripted_statuses([("processing", 0, 0), ("processing", 2, 4), ("ready", 2, 4)])
+
+    async def fake_request(method, endpoint, **kwargs):
+        return fetch(method, endpoint, **kwargs)
+
+    client._request = fake_request
+
+    async def run():
+        waits = [client.collections.wait_until_ready("c1", timeout=5, polling=FAST) for _ in range(3)]
+        return await asyncio.gather(*waits)
+
+    finals = asyncio.run(run())
+    assert [f.status for f in finals] == ["ready"] * 3
+    assert len(fetch.calls) == 3
+
+
+def test_poller_stops_without_polling_again_when_abandoned(status_client):
+    """Tests that the poller exits before its next request once the last watcher leaves."""
+    client = status_client([("processing", 0, 0)])
+    slow = StatusPolling(initial_interval=5, max_interval=5)
+    watch = client.collections.watch_status("c1", polling=slow)
+    assert next(watch).status == "processing"
+    watch.close()
+    deadline = time.monotonic() + 2
+    while client.collections._status_watcher._polls and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert client.collections._status_watcher._polls == {}
+    assert len(client.fetch.calls) == 1
+
+
+def test_each_watcher_gets_its_own_error(status_client, monkeypatch):
+    """Tests that a polling failure is raised as a separate exception object in every watcher."""
+    client = status_client([("processing", 0, 0)])
+    release = threading.Event()
+    fetch = client.fetch
+
+    def failing_fetch(method, endpoint, **kwargs):
+        if fetch.calls:
+            release.wait(5)
+            raise RagulaError(status_code=503, message="unavailable")
+        return fetch(method, endpoint, **kwargs)
+
+    monkeypatch.setattr(client, "_request", failing_fetch)
+    watches = [client.collections.watch_status("c1", polling=FAST) for _ in range(2)]
+    assert [next(watch).status for watch in watches] == ["processing"] * 2
+    release.set()
+    errors = []
+    for watch in watches:
+        with pytest.raises(RagulaError) as excinfo:
+            next(watch)
+        errors.append(excinfo.value)
+    assert errors[0] is not errors[1]
+    assert [error.status_code for error in errors] == [503, 503]
+
+
+def test_watches_with_other_polling_settings_get_their_own_poller(status_client):
+    """Tests that a watch never runs on another watch's intervals."""
+    client = status_client([("processing", 0, 0)])
+    slow = StatusPolling(initial_interval=5, max_interval=5)
+    watches = [client.collections.watch_status("c1", polling=polling) for polling in (FAST, slow, FAST)]
+    for watch in watches:
+        next(watch)
+    assert sorted(p.initial_interval for _, p in client.collections._status_watcher._polls) == [0.01, 5]
+    for watch in watches:
+        watch.close()
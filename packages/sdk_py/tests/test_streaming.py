@@ -0,0 +1,168 @@
+"""Tests for streamed answers of ask_question_stream."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from ragula.sdk import AsyncRagulaClient, CallbackHook, MetricsCollector, RagulaClient, RagulaError
+from ragula.sdk.streaming import AnswerParser
+
+EVENTS = (
+    ": keep-alive\n\n"
+    'data: {"delta": "Paris is "}\n\n'
+    'event: sources\ndata: {"results": [{"fileId": "f1", "score": 0.9, "contentSnippet": "Paris"}]}\n\n'
+    'data: {"delta": "the capital – of France."}\n\n'
+    "data: [DONE]\n\n"
+).encode()
+
+
+def parse(content_type, body, piece_size):
+    parser = AnswerParser(content_type)
+    chunks = []
+    for start in range(0, len(body), piece_size):
+        chunks.extend(parser.feed(body[start:start + piece_size]))
+    return chunks + parser.finish()
+
+
+@pytest.mark.parametrize("piece_size", [1, 7, 4096])
+def test_parser_handles_split_events(piece_size):
+    """Tests that SSE events split at any byte (including inside UTF-8 sequences) parse the same."""
+    chunks = parse("text/event-stream; charset=utf-8", EVENTS, piece_size)
+    assert "".join(chunk.text for chunk in chunks) == "Paris is the capital – of France."
+    assert [item["fileId"] for chunk in chunks for item in chunk.results] == ["f1"]
+
+
+def test_parser_framings_and_errors():
+    """Tests NDJSON bodies, plain JSON bodies from servers that cannot stream, and error events."""
+    ndjson = b'{"text": "a"}\r\n{"text": "b", "sources": [{"fileId": "f2", "score": 1}]}'
+    assert [chunk.text for chunk in parse("application/x-ndjson", ndjson, 5)] == ["a", "b"]
+    whole = parse("application/json", b'{"answer": "all", "results": []}', 3)
+    assert [chunk.text for chunk in whole] == ["all"]
+    with pytest.raises(RagulaError) as error:
+        parse("text/event-stream", b'event: error\ndata: {"message": "quota", "statusCode": 429}\n\n', 64)
+    assert error.value.status_code == 429 and error.value.message == "quota"
+
+
+@pytest.fixture
+def stream_server():
+    """Fixture running a server that streams an answer in two parts, holding the second back until released."""
+    release = threading.Event()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for event in ({"delta": "first "}, {"delta": "second", "results": [{"fileId": "f1", "score": 1}]}):
+                data = f"data: {json.dumps(event)}\n\n".encode()
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+                self.wfile.flush()
+                if not release.wait(5):
+                    return
+            self.wfile.write(b"0\r\n\r\n")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server.release = release
+    yield server
+    release.set()
+    server.shutdown()
+    server.server_close()
+
+
+def test_stream_yields_before_the_answer_is_complete(stream_server):
+    """Tests that the first chunk arrives while the server still generates, then the whole answer."""
+    with RagulaClient(token="t", base_url=f"http://127.0.0.1:{stream_server.server_port}") as client:
+        with client.query.ask_question_stream("c1", "q") as stream:
+            assert next(stream).text == "first " # The server is still holding back the rest
+            stream_server.release.set()
+            assert [chunk.text for chunk in stream] == ["second"]
+        assert stream.complete and stream.answer == "first second"
+        assert stream.results == [{"fileId": "f1", "score": 1}]
+
+
+def test_stream_with_hooks_does_not_read_ahead(stream_server):
+    """Tests that request hooks record a streamed call without downloading its body first."""
+    events = []
+    hooks = [MetricsCollector(), CallbackHook(after=events.append)]
+    base_url = f"http://127.0.0.1:{stream_server.server_port}"
+    with RagulaClient(token="t", base_url=base_url, hooks=hooks) as client:
+        with client.query.ask_question_stream("c1", "q") as stream:
+            assert next(stream).text == "first " # Reading ahead would block on the held-back event
+            stream_server.release.set()
+            assert stream.answer + "".join(chunk.text for chunk in stream) == "first second"
+    assert events[0].status_code == 200 and events[0].bytes_received == 0 # Chunked: no Content-Length
+
+
+def test_abandoned_stream_releases_its_connection(stream_server):
+    """Tests that leaving a stream early frees the only pooled connection for the next call."""
+    base_url = f"http://127.0.0.1:{stream_server.server_port}"
+    with RagulaClient(token="t", base_url=base_url, pool_maxsize=1, pool_block=True) as client:
+        with client.query.ask_question_stream("c1", "q") as stream:
+            next(stream)
+        assert not stream.complete
+        stream_server.release.set()
+        client.query.ask_question_stream("c1", "q") # Dropped unread
+        assert "".join(chunk.text for chunk in client.query.ask_question_stream("c1", "q")) == "first second"
+
+
+def test_async_stream_and_cancellation():
+    """Tests the async stream, and that cancelling its consumer closes the response."""
+    closed = []
+
+    class Body(httpx.AsyncByteStream):
+        def __init__(self, endless):
+            self.endless = endless
+
+        async def __aiter__(self):
+            yield b'data: {"delta": "hello"}\n\n'
+            while self.endless:
+                await asyncio.sleep(1)
+            yield b'data: {"delta": " world"}\n\ndata: [DONE]\n\n'
+
+        async def aclose(self):
+            closed.append(self.endless)
+
+    def handler(request):
+        endless = json.loads(request.content)["query"] == "endless"
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, stream=Body(endless))
+
+    async def run():
+        client = AsyncRagulaClient(
+            token="t", base_url="http://localhost:8000", transport=httpx.MockTransport(handler),
+            hooks=[MetricsCollector()], # Hooks must not read the streamed body
+        )
+        try:
+            async with await client.query.ask_question_stream("c1", "q") as stream:
+                texts = [chunk.text async for chunk in stream]
+
+            endless = await client.query.ask_question_stream("c1", "endless")
+            started = asyncio.Event()
+
+            async def consume():
+                async for _ in endless:
+                    started.set()
+
+            task = asyncio.ensure_future(consume())
+            await started.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return texts, stream.answer
+        finally:
+            await client.aclose()
+
+    texts, answer = asyncio.run(run())
+    assert texts == ["hello", " world"] and answer == "hello world"
+    assert closed == [False, True]
@@ -0,0 +1,260 @@
+"""Tests for the SyncService, covering directory ingestion."""
+
+import itertools
+import os
+import threading
+
+import pytest
+from ragula.sdk.client import RagulaClient, RagulaError
+
+
+class FakeRemote:
+    """In-memory stand-in for the folders and files endpoints."""
+
+    def __init__(self):
+        self.folders = {}
+        self.uploads = []
+        self.files = {}
+        self.file_folders = {}
+        self.fail_names = set()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def list_folders(self, collection_id, parent_id=None):
+        with self._lock:
+            return [dict(f) for f in self.folders.values() if f["parentId"] == parent_id]
+
+    def create_folder(self, collection_id, payload):
+        with self._lock:
+            if payload.parent_id is not None:
+                assert payload.parent_id in self.folders, "parent must exist before its children"
+            folder = {"id": f"folder-{next(self._ids)}", "name": payload.name, "parentId": payload.parent_id}
+            self.folders[folder["id"]] = folder
+            return folder
+
+    def upload_file(self, collection_id, file_path=None, folder_id=None, **kwargs):
+        name = os.path.basename(file_path)
+        if name in self.fail_names:
+            raise RagulaError(status_code=500, message="upload failed")
+        with self._lock:
+            self.uploads.append((name, folder_id))
+            file_id = f"file-{next(self._ids)}"
+            self.files[file_id] = name
+            self.file_folders[file_id] = folder_id
+        return {"id": file_id}
+
+    def iter_files(self, collection_id, folder_id=None, **kwargs):
+        with self._lock:
+            return [
+                {"id": file_id, "name": name, "folderId": self.file_folders[file_id]}
+                for file_id, name in self.files.items()
+                if folder_id is None or self.file_folders[file_id] == folder_id
+            ]
+
+    def delete_file(self, collection_id, file_id):
+        with self._lock:
+            if file_id not in self.files:
+                raise RagulaError(status_code=404, message="File not found")
+            del self.files[file_id]
+
+    def path_of(self, folder_id):
+        parts = []
+        while folder_id is not None:
+            folder = self.folders[folder_id]
+            parts.append(folder["name"])
+            folder_id = folder["parentId"]
+        return "/".join(reversed(parts))
+
+
+@pytest.fixture
+def remote(monkeypatch):
+    """Fixture wiring a FakeRemote into a client's folders and files services."""
+    fake = FakeRemote()
+    client = RagulaClient(token="test_api_key", base_url="http://localhost:8000")
+    monkeypatch.setattr(client.folders, "list_folders", fake.list_folders)
+    monkeypatch.setattr(client.folders, "create_folder", fake.create_folder)
+    monkeypatch.setattr(client.files, "upload_file", fake.upload_file)
+    monkeypatch.setattr(client.files, "delete_file", fake.delete_file)
+    monkeypatch.setattr(client.files, "iter_files", fake.iter_files)
+    fake.client = client
+    return fake
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Fixture creating a small document tree."""
+    for rel in ["a.txt", "docs/b.pdf", "docs/deep/c.pdf", "docs/deep/skip.tmp", ".git/config"]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * 10)
+    return tmp_path
+
+
+def test_sync_directory_mirrors_folders(remote, tree):
+    """Tests that folders are mirrored and files land in the matching folder."""
+    summary = remote.client.sync.sync_directory("col-1", str(tree), exclude=[".git", "*.tmp"])
+
+    assert sorted(summary.uploaded) == ["a.txt", "docs/b.pdf", "docs/deep/c.pdf"]
+    assert summary.failed == []
+    assert summary.folders_created == 2
+    assert summary.bytes_uploaded == 30
+    placed = {name: remote.path_of(folder_id) if folder_id else "" for name, folder_id in remote.uploads}
+    assert placed == {"a.txt": "", "b.pdf": "docs", "c.pdf": "docs/deep"}
+
+
+def test_sync_directory_reuses_existing_folders_and_filters(remote, tree):
+    """Tests that existing folders are reused and include globs are applied."""
+    remote.create_folder("col-1", type("P", (), {"name": "docs", "parent_id": None})())
+    summary = remote.client.sync.sync_directory("col-1", str(tree), include=["*.pdf"])
+
+    assert sorted(summary.uploaded) == ["docs/b.pdf", "docs/deep/c.pdf"]
+    assert summary.folders_created == 1
+    assert len(remote.folders) == 2
+
+
+def test_sync_directory_records_failures(remote, tree):
+    """Tests that a failed upload is reported without stopping the run."""
+    remote.fail_names.add("b.pdf")
+    summary = remote.client.sync.sync_directory("col-1", str(tree), include=["*.pdf"], concurrency=2)
+
+    assert summary.uploaded == ["docs/deep/c.pdf"]
+    assert [failure.path for failure in summary.failed] == ["docs/b.pdf"]
+    assert isinstance(summary.failed[0].error, RagulaError)
+
+
+def test_sync_directory_rejects_missing_directory(remote, tmp_path):
+    """Tests that a non-directory path is rejected."""
+    with pytest.raises(ValueError):
+        remote.client.sync.sync_directory("col-1", str(tmp_path / "missing"))
+
+
+def test_incremental_sync_uploads_only_changes(remote, tree, tmp_path_factory):
+    """Tests that a manifest-backed sync uploads, skips, replaces and deletes correctly."""
+    manifest = str(tmp_path_factory.mktemp("state") / "manifest.sqlite3")
+    sync = remote.client.sync.sync_directory
+    first = sync("col-1", str(tree), exclude=[".git"], manifest_path=manifest)
+    assert len(first.uploaded) == 4
+
+    second = sync("col-1", str(tree), exclude=[".git"], manifest_path=manifest)
+    assert second.uploaded == [] and len(second.skipped) == 4
+
+    (tree / "a.txt").write_bytes(b"changed content")
+    os.utime(tree / "docs" / "b.pdf", ns=(1, 1))  # stat change only, same content
+    (tree / "docs" / "deep" / "skip.tmp").unlink()
+    third = sync("col-1", str(tree), exclude=[".git"], manifest_path=manifest, delete_missing=True)
+
+    assert third.uploaded == ["a.txt"]
+    assert sorted(third.skipped) == ["docs/b.pdf", "docs/deep/c.pdf"]
+    assert third.deleted == ["docs/deep/skip.tmp"]
+    assert third.failed == []
+    # The superseded copy of a.txt and the vanished skip.tmp are gone remotely.
+    assert sorted(remote.files.values()) == ["a.txt", "b.pdf", "c.pdf"]
+
+
+def test_incremental_sync_resumes_after_failure(remote, tree, tmp_path_factory):
+    """Tests that a rerun uploads only what an interrupted run did not finish."""
+    manifest = str(tmp_path_factory.mktemp("state") / "manifest.sqlite3")
+    remote.fail_names.add("c.pdf")
+    first = remote.client.sync.sync_directory("col-1", str(tree), include=["*.pdf"], manifest_path=manifest)
+    assert first.uploaded == ["docs/b.pdf"]
+
+    remote.fail_names.clear()
+    second = remote.client.sync.sync_directory("col-1", str(tree), include=["*.pdf"], manifest_path=manifest)
+    assert second.uploaded == ["docs/deep/c.pdf"]
+    assert second.skipped == ["docs/b.pdf"]
+
+
+def test_malformed_upload_response_fails_only_that_file(remote, tree, tmp_path_factory, monkeypatch):
+    """Tests that an upload response without a file id is a per-file failure, not an aborted run."""
+    manifest = str(tmp_path_factory.mktemp("state") / "manifest.sqlite3")
+    upload = remote.upload_file
+
+    def malformed_for_b(collection_id, file_path=None, **kwargs):
+        response = upload(collection_id, file_path=file_path, **kwargs)
+        return "ok" if file_path.endswith("b.pdf") else response
+
+    monkeypatch.setattr(remote.client.files, "upload_file", malformed_for_b)
+    summary = remote.client.sync.sync_directory("col-1", str(tree), include=["*.pdf"], manifest_path=manifest)
+    assert summary.uploaded == ["docs/deep/c.pdf"]
+    assert [failure.path for failure in summary.failed] == ["docs/b.pdf"]
+    assert summary.failed[0].error.status_code == 502
+
+
+def test_file_changed_while_syncing_is_retried_next_run(remote, tree, tmp_path_factory, monkeypatch):
+    """Tests that files modified during hashing or upload are reported and re-checked by the next run."""
+    import ragula.sdk.sync as sync_module
+
+    manifest = str(tmp_path_factory.mktemp("state") / "manifest.sqlite3")
+    hash_file, upload = sync_module.hash_file, remote.upload_file
+
+    def hash_while_writing(path):
+        digest = hash_file(path)
+        if path.endswith("b.pdf"):
+            with open(path, "ab") as f:
+                f.write(b"appended while hashing")
+        return digest
+
+    def upload_while_writing(collection_id, file_path=None, **kwargs):
+        response = upload(collection_id, file_path=file_path, **kwargs)
+        if file_path.endswith("c.pdf"):
+            with open(file_path, "ab") as f:
+                f.write(b"appended while uploading")
+        return response
+
+    monkeypatch.setattr(sync_module, "hash_file", hash_while_writing)
+    monkeypatch.setattr(remote.client.files, "upload_file", upload_while_writing)
+    first = remote.client.sync.sync_directory("col-1", str(tree), include=["*.pdf"], manifest_path=manifest)
+    assert first.uploaded == []
+    assert sorted(failure.path for failure in first.failed) == ["docs/b.pdf", "docs/deep/c.pdf"]
+    assert all(failure.error.status_code == 409 for failure in first.failed)
+    assert [name for name, _ in remote.uploads] == ["c.pdf"] # b.pdf was never uploaded
+
+    monkeypatch.setattr(sync_module, "hash_file", hash_file)
+    monkeypatch.setattr(remote.client.files, "upload_file", upload)
+    second = remote.client.sync.sync_directory("col-1", str(tree), include=["*.pdf"], manifest_path=manifest)
+    assert sorted(second.uploaded) == ["docs/b.pdf", "docs/deep/c.pdf"]
+    assert second.failed == []
+    # The copy of c.pdf uploaded mid-change was replaced.
+    assert sorted(remote.files.values()) == ["b.pdf", "c.pdf"]
+
+
+def test_manifest_is_bound_to_its_directory_and_folder(remote, tree, tmp_path_factory):
+    """Tests that reusing a manifest for another directory or parent folder fails instead of deleting files."""
+    manifest = str(tmp_path_factory.mktemp("state") / "manifest.sqlite3")
+    other = tmp_path_factory.mktemp("other")
+    (other / "new.txt").write_bytes(b"y")
+    sync = remote.client.sync.sync_directory
+    assert len(sync("col-1", str(tree), include=["*.pdf"], manifest_path=manifest).uploaded) == 2
+
+    with pytest.raises(ValueError, match="directory"):
+        sync("col-1", str(other), manifest_path=manifest, delete_missing=True)
+    with pytest.raises(ValueError, match="parent folder"):
+        sync("col-1", str(tree), parent_folder_id="folder-x", manifest_path=manifest, delete_missing=True)
+    assert sorted(remote.files.values()) == ["b.pdf", "c.pdf"]
+
+    # Without delete_missing, files no longer selected are left alone.
+    assert sync("col-1", str(tree), include=["b.pdf"], manifest_path=manifest).deleted == []
+
+
+def test_interrupted_upload_is_not_duplicated(remote, tree, tmp_path_factory, monkeypatch):
+    """Tests that a remote copy uploaded but never recorded is deleted by the next run."""
+    from ragula.sdk.manifest import SyncManifest
+
+    manifest = str(tmp_path_factory.mktemp("state") / "manifest.sqlite3")
+    record = SyncManifest.record
+
+    def crash_on_b(self, entry, replaced_file_id=None):
+        if entry.path == "docs/b.pdf":
+            raise KeyboardInterrupt
+        return record(self, entry, replaced_file_id)
+
+    monkeypatch.setattr(SyncManifest, "record", crash_on_b)
+    with pytest.raises(KeyboardInterrupt):
+        remote.client.sync.sync_directory("col-1", str(tree), include=["*.pdf"], manifest_path=manifest,
+                                          concurrency=1)
+    assert "b.pdf" in remote.files.values() # Uploaded, but never recorded
+
+    monkeypatch.setattr(SyncManifest, "record", record)
+    summary = remote.client.sync.sync_directory("col-1", str(tree), include=["*.pdf"], manifest_path=manifest)
+    assert "docs/b.pdf" in summary.uploaded and summary.failed == []
+    assert sorted(remote.files.values()) == ["b.pdf", "c.pdf"]
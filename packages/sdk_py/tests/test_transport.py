@@ -0,0 +1,116 @@
+"""Tests for connection pooling and timeout configuration."""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ragula.sdk.client import RagulaClient
+from ragula.sdk.transport import Timeouts, build_session, clamp_timeout, resolve_environment
+
+
+def test_build_session_sizes_pool():
+    """Tests that the mounted adapters use the requested pool sizes."""
+    session = build_session(pool_connections=4, pool_maxsize=64, pool_block=True)
+    adapter = session.get_adapter("https://www.ragula.io")
+    assert adapter._pool_maxsize == 64
+    assert adapter._pool_block is True
+    assert adapter.max_retries.total == 0
+
+
+def test_environment_is_resolved_once(monkeypatch):
+    """Tests that proxy settings are read at construction, not on every request."""
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+    monkeypatch.setenv("NO_PROXY", "")
+    client = RagulaClient(token="t", base_url="https://www.ragula.io")
+    assert client._session.trust_env is False
+    assert client._session.proxies["https"] == "http://proxy.internal:3128"
+
+    monkeypatch.setenv("NO_PROXY", "ragula.io")
+    session = build_session()
+    resolve_environment(session, "https://www.ragula.io/api")
+    assert "https" not in session.proxies
+
+
+def test_json_bodies_are_encoded_once(monkeypatch):
+    """Tests that JSON calls send pre-encoded bodies with the session's default headers."""
+    client = RagulaClient(token="t", base_url="http://localhost:8000")
+    seen = []
+
+    class Response:
+        status_code = 200
+        content = b"{}"
+
+    def fake_request(**kwargs):
+        seen.append(kwargs)
+        return Response()
+
+    monkeypatch.setattr(client._session, "request", fake_request)
+    client.query.query_collection("c1", "q")
+    client.files.upload_file("c1", file_content=b"x", file_name="a.txt")
+    assert seen[0]["data"] == b'{"query":"q"}'
+    assert seen[0]["headers"] is None
+    assert client._session.headers["Content-Type"] == "application/json"
+    # Only the upload's own headers are passed; requests merges in the session's.
+    assert seen[1]["headers"]["Content-Type"].startswith("multipart/form-data")
+    assert "Authorization" not in seen[1]["headers"]
+
+
+def test_clamp_timeout_respects_deadline():
+    """Tests that timeouts never exceed the remaining deadline budget."""
+    assert clamp_timeout((5.0, 30.0), None) == (5.0, 30.0)
+    assert clamp_timeout((5.0, 30.0), 2.0) == (2.0, 2.0)
+
+
+def test_operations_use_their_timeouts(monkeypatch):
+    """Tests that queries, uploads and other calls get per-operation timeouts."""
+    timeouts = Timeouts(default=(1.0, 2.0), query=(1.0, 3.0), upload=(1.0, 4.0))
+    client = RagulaClient(token="t", base_url="http://localhost:8000", timeouts=timeouts)
+    seen = []
+
+    class Response:
+        status_code = 200
+        content = b"{}"
+
+    def fake_request(**kwargs):
+        seen.append(kwargs["timeout"])
+        return Response()
+
+    monkeypatch.setattr(client._session, "request", fake_request)
+    client.collections.list_collections()
+    client.query.query_collection("c1", "q")
+    client.files.upload_file("c1", file_content=b"x", file_name="a.txt")
+    assert seen == [(1.0, 2.0), (1.0, 3.0), (1.0, 4.0)]
+
+
+def test_threads_share_pooled_connections():
+    """Tests that concurrent threads reuse keep-alive connections from the pool."""
+    peers = set()
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            with lock:
+                peers.add(self.client_address)
+            payload = json.dumps([]).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with RagulaClient(token="t", base_url=f"http://127.0.0.1:{server.server_port}", pool_maxsize=4) as client:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                list(pool.map(lambda _: client.collections.list_collections(), range(40)))
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert len(peers) <= 4
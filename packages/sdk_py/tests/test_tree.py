@@ -0,0 +1,122 @@
+"""Tests for folders.walk() and the TreeCache."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from ragula.sdk.async_client import AsyncRagulaClient
+from ragula.sdk.models import CreateFolderPayload
+from ragula.sdk.retry import RetryPolicy
+from ragula.sdk.tree import TreeCache
+
+# id -> (name, parent id)
+FOLDERS = {"a": ("docs", None), "b": ("img", None), "c": ("api", "a"), "d": ("v1", "c")}
+FILES = {None: ["readme"], "a": ["guide"], "d": ["spec"]}
+
+
+def serve(client, method, endpoint, params=None, **kwargs):
+    """Answers the folder and file listing endpoints from FOLDERS and FILES."""
+    params = params or {}
+    client.requests.append((endpoint.rsplit("/", 1)[-1], params))
+    if method == "POST":
+        return {"id": "new", "name": "new", "parentId": None}
+    if endpoint.endswith("/folders"):
+        # Like the API, an unfiltered listing returns root folders.
+        parent = params.get("parentId")
+        return [
+            {"id": fid, "name": name, "parentId": pid} for fid, (name, pid) in FOLDERS.items() if pid == parent
+        ]
+    folder_id = params.get("folderId")
+    return [{"id": name, "name": name, "folderId": folder_id} for name in FILES.get(folder_id, [])]
+
+
+@pytest.fixture
+def tree_client(fake_transport):
+    """Fixture creating a client with a tree cache that serves a fixed tree."""
+    client = fake_transport(serve, tree_cache=TreeCache())
+    client.requests = []
+    return client
+
+
+def test_walk_yields_levels_top_down(tree_client):
+    """Tests paths, folder ids and files of every visited folder."""
+    entries = list(tree_client.folders.walk("c1", concurrency=4))
+    assert [(e.path, e.folder_id) for e in entries] == [
+        ("", None), ("docs", "a"), ("img", "b"), ("docs/api", "c"), ("docs/api/v1", "d"),
+    ]
+    assert [f["name"] for f in entries[0].files] == ["readme"]
+    assert [f["name"] for f in entries[4].files] == ["spec"]
+    path, folder_id, folders, files = entries[1]
+    assert [f["name"] for f in folders] == ["api"]
+    assert threading.get_ident() not in tree_client.threads
+
+
+def test_walk_from_subfolder_without_files(tree_client):
+    """Tests starting below the root and skipping file listings."""
+    entries = list(tree_client.folders.walk("c1", folder_id="c", include_files=False))
+    assert [(e.path, e.folder_id, e.files) for e in entries] == [("", "c", []), ("v1", "d", [])]
+    assert all(name == "folders" for name, _ in tree_client.requests)
+
+
+def test_tree_snapshot_cached_and_invalidated(tree_client):
+    """Tests that a repeated walk is served from the cache until a folder is created or deleted."""
+    first = list(tree_client.folders.walk("c1"))
+    count = len(tree_client.requests)
+    assert list(tree_client.folders.walk("c1")) == first
+    assert len(tree_client.requests) == count
+
+    tree_client.folders.create_folder("c1", CreateFolderPayload(name="new"))
+    list(tree_client.folders.walk("c1"))
+    assert len(tree_client.requests) > count + 1
+
+    count = len(tree_client.requests)
+    tree_client.folders.delete_folder("c1", "b")
+    assert len(tree_client.tree_cache) == 0
+    list(tree_client.folders.walk("c1", use_cache=False))
+    assert len(tree_client.tree_cache) == 0
+
+
+def test_cached_levels_cannot_be_changed_by_callers(tree_client):
+    """Tests that mutating walked levels, during the first walk or a cached one, leaves the snapshot intact."""
+    first = []
+    for entry in tree_client.folders.walk("c1"):
+        first.append([f["name"] for f in entry.files])
+        entry.files.clear()
+    cached = list(tree_client.folders.walk("c1"))
+    assert [[f["name"] for f in entry.files] for entry in cached] == first
+    cached[0].folders.clear()
+    assert [f["name"] for f in next(tree_client.folders.walk("c1")).folders] == ["docs", "img"]
+
+
+def test_walk_skips_files_of_other_folders(tree_client, monkeypatch):
+    """Tests that files a server lists for another folder are not reported at this level."""
+    def nested_files(method, endpoint, params=None, **kwargs):
+        if endpoint.endswith("/files") and not (params or {}).get("folderId"):
+            # Like an unfiltered listing: every file of the collection.
+            return [{"id": name, "name": name, "folderId": fid} for name, fid in (("spec", "d"), ("readme", None))]
+        return serve(tree_client, method, endpoint, params=params, **kwargs)
+
+    monkeypatch.setattr(tree_client, "_request", nested_files)
+    top = next(tree_client.folders.walk("c1", use_cache=False))
+    assert [f["name"] for f in top.files] == ["readme"]
+
+
+def test_tree_cache_ttl():
+    """Tests that snapshots expire."""
+    cache = TreeCache(ttl=0.01)
+    cache.set("c1", None, True, [])
+    assert cache.get("c1", None, True) == []
+    time.sleep(0.02)
+    assert cache.get("c1", None, True) is None
+
+
+def test_async_walk(fake_transport):
+    """Tests the asyncio walker against the same tree."""
+    client = fake_transport(serve, AsyncRagulaClient, retry=RetryPolicy(max_attempts=1))
+    client.requests = []
+
+    async def run():
+        return [(e.path, len(e.files)) async for e in client.folders.walk("c1", concurrency=2)]
+
+    assert asyncio.run(run()) == [("", 1), ("docs", 1), ("img", 0), ("docs/api", 0), ("docs/api/v1", 1)]